@@ -1,9 +1,10 @@
+from collections.abc import AsyncIterator
 from typing import Optional
 
 import uvicorn
 from fastapi import Depends, FastAPI, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm
 
 from backend.api.auth.jwt import (
@@ -25,7 +26,7 @@ from backend.api.models.config import (
     DeploymentConfig,
 )
 from backend.api.models.user import Preferences, User, UserCreate, UserUpdate
-from backend.api.services.config_service import ConfigService
+from backend.api.services.config_service import config_service
 from backend.api.services.user_service import UserService
 
 app = FastAPI(
@@ -383,7 +384,46 @@ async def toggle_participation(
     return updated_user
 
 
-@app.get("/users", response_model=list[User])
+def _user_json(user: User) -> str:
+    """
+    Encode a user as JSON.
+
+    Args:
+        user: The user to encode
+
+    Returns:
+        The user's JSON
+    """
+    # model_dump_json is the compiled path on Pydantic v2; .json() is kept for v1
+    if hasattr(user, "model_dump_json"):
+        return user.model_dump_json()
+    return user.json()
+
+
+async def _json_array(first: User, users: AsyncIterator[User]) -> AsyncIterator[str]:
+    """
+    Encode users as a JSON array, one user at a time.
+
+    Args:
+        first: The first user, already read before the response started
+        users: The remaining users to encode
+
+    Yields:
+        Pieces of the JSON array
+    """
+    yield "[" + _user_json(first)
+    async for user in users:
+        yield "," + _user_json(user)
+    yield "]"
+
+
+# The users are streamed rather than validated through a response model, so
+# the schema is only declared for the OpenAPI docs
+@app.get(
+    "/users",
+    response_class=StreamingResponse,
+    responses={200: {"model": list[User], "content": {"application/json": {}}}},
+)
 async def get_all_users(
     active_only: Optional[bool] = None,
     paused_only: Optional[bool] = None,
@@ -403,10 +443,18 @@ async def get_all_users(
     # Create user service with deployment ID from token
     user_service = UserService(token_data.deployment_id)
 
-    # Get all users with optional filters
-    users = await user_service.get_all_users(active_only, paused_only)
+    # Stream the users with optional filters, one query page at a time
+    users = user_service.iter_users(active_only, paused_only)
 
-    return users
+    # The status is sent before the stream is read, so read the first page
+    # here: a failing query then still ends in an error response
+    first_user = await anext(users, None)
+    if first_user is None:
+        return JSONResponse([])
+
+    return StreamingResponse(
+        _json_array(first_user, users), media_type="application/json"
+    )
 
 
 # Configuration service endpoints
@@ -425,9 +473,6 @@ async def create_deployment_config(
     Returns:
         The created configuration
     """
-    # Create config service
-    config_service = ConfigService()
-
     # Create the configuration
     config = await config_service.create_config(token_data.deployment_id, config_create)
 
@@ -450,9 +495,6 @@ async def get_deployment_config(
     Raises:
         HTTPException: If the configuration is not found
     """
-    # Create config service
-    config_service = ConfigService()
-
     # Get the configuration
     config = await config_service.get_config(token_data.deployment_id)
 
@@ -481,15 +523,18 @@ async def update_deployment_config(
         The updated configuration
 
     Raises:
-        HTTPException: If the configuration is not found
+        HTTPException: If the configuration is not found or the schedule is invalid
     """
-    # Create config service
-    config_service = ConfigService()
-
     # Update the configuration
-    updated_config = await config_service.update_config(
-        token_data.deployment_id, config_update
-    )
+    try:
+        updated_config = await config_service.update_config(
+            token_data.deployment_id, config_update
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
 
     if not updated_config:
         raise HTTPException(
@@ -518,15 +563,18 @@ async def update_schedule(
         The updated configuration
 
     Raises:
-        HTTPException: If the configuration is not found
+        HTTPException: If the configuration is not found or the schedule is invalid
     """
-    # Create config service
-    config_service = ConfigService()
-
     # Update the schedule
-    updated_config = await config_service.update_schedule(
-        token_data.deployment_id, schedule, timezone
-    )
+    try:
+        updated_config = await config_service.update_schedule(
+            token_data.deployment_id, schedule, timezone
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
 
     if not updated_config:
         raise HTTPException(
@@ -562,9 +610,6 @@ async def update_meeting_size(
             detail="Meeting size must be between 2 and 10",
         )
 
-    # Create config service
-    config_service = ConfigService()
-
     # Update the meeting size
     updated_config = await config_service.update_meeting_size(
         token_data.deployment_id, meeting_size
@@ -592,9 +637,6 @@ async def get_all_configs(token_data: TokenData = Depends(get_current_token_data
     Returns:
         A list of configurations
     """
-    # Create config service
-    config_service = ConfigService()
-
     # Get all configurations
     configs = await config_service.get_all_configs()
 
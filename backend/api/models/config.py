@@ -1,11 +1,14 @@
 """
 Configuration models for the Virtual Coffee Platform.
 """
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel, Field, validator
 
+from backend.api.models.cron import ParsedCron, parse_cron
+
 
 class EmailTemplates(BaseModel):
     """Email templates for notifications."""
@@ -51,10 +54,8 @@ class DeploymentConfig(BaseModel):
     @validator("schedule")
     def validate_schedule(cls, v):
         """Validate the schedule cron expression."""
-        # Basic validation for cron expression format
-        parts = v.split()
-        if len(parts) != 5:
-            raise ValueError("Schedule must be a valid cron expression with 5 parts")
+        # Parsing validates every field and primes the parsed-cron cache
+        parse_cron(v)
         return v
 
     @validator("timezone")
@@ -66,6 +67,11 @@ class DeploymentConfig(BaseModel):
             raise ValueError("Timezone cannot be empty")
         return v
 
+    @property
+    def parsed_cron(self) -> ParsedCron:
+        """The schedule parsed into its structured cron representation."""
+        return parse_cron(self.schedule)
+
     class Config:
         schema_extra = {
             "example": {
@@ -84,6 +90,26 @@ class DeploymentConfig(BaseModel):
         }
 
 
+@dataclass(frozen=True, slots=True)
+class DeploymentConfigView:
+    """
+    Read-only view of the configuration fields used for scheduling.
+
+    Used on read paths that sweep many deployments; creating and updating
+    configurations goes through the validated DeploymentConfig model.
+    """
+
+    deployment_id: str
+    schedule: str
+    timezone: str = "UTC"
+    meeting_size: int = 2
+
+    @property
+    def parsed_cron(self) -> ParsedCron:
+        """The schedule parsed into its structured cron representation."""
+        return parse_cron(self.schedule)
+
+
 class ConfigCreate(BaseModel):
     """Schema for configuration creation."""
 
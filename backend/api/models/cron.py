@@ -0,0 +1,341 @@
+"""
+Cron expression model for the Virtual Coffee Platform.
+
+Schedules are stored as standard 5-field cron expressions, as accepted by
+Kubernetes CronJobs: month and weekday names (JAN, MON) and the @yearly,
+@monthly, @weekly, @daily and @hourly macros are allowed too. They are parsed
+and validated once, when a configuration is written or loaded, into a
+structured representation that the scheduler can read without re-tokenizing
+the string.
+"""
+import re
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import pairwise
+
+# Inclusive (low, high) bounds for each cron field, in expression order
+_FIELD_BOUNDS = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day of month", 1, 31),
+    ("month", 1, 12),
+    ("day of week", 0, 7),
+)
+
+# Names allowed in place of numbers, keyed by the field they belong to
+_FIELD_NAMES = {
+    "month": {
+        "JAN": 1,
+        "FEB": 2,
+        "MAR": 3,
+        "APR": 4,
+        "MAY": 5,
+        "JUN": 6,
+        "JUL": 7,
+        "AUG": 8,
+        "SEP": 9,
+        "OCT": 10,
+        "NOV": 11,
+        "DEC": 12,
+    },
+    "day of week": {
+        "SUN": 0,
+        "MON": 1,
+        "TUE": 2,
+        "WED": 3,
+        "THU": 4,
+        "FRI": 5,
+        "SAT": 6,
+    },
+}
+
+# Predefined schedules and the expressions they stand for
+_MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+_ALL_HOURS = frozenset(range(24))
+_ALL_DAYS = frozenset(range(1, 32))
+_ALL_MONTHS = frozenset(range(1, 13))
+_ALL_WEEKDAYS = frozenset(range(7))
+
+# How far ahead to search before giving up on an expression that never fires
+# (e.g. "0 0 30 2 *")
+_MAX_LOOKAHEAD_YEARS = 5
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedCron:
+    """A validated cron expression with each field expanded to its values."""
+
+    minutes: frozenset[int]
+    hours: frozenset[int]
+    days: frozenset[int]
+    months: frozenset[int]
+    weekdays: frozenset[int]
+    # Sorted copies of the minute and hour values, for jumping between matches
+    _minute_order: tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _hour_order: tuple[int, ...] = field(init=False, repr=False, compare=False)
+    # Fixed distance between consecutive runs, when the expression has one
+    _period: timedelta | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_minute_order", tuple(sorted(self.minutes)))
+        object.__setattr__(self, "_hour_order", tuple(sorted(self.hours)))
+        object.__setattr__(self, "_period", self._fixed_period())
+
+    def _fixed_period(self) -> timedelta | None:
+        """Get the fixed interval between runs (e.g. "*/15 * * * *"), if any."""
+        if (
+            self.days != _ALL_DAYS
+            or self.months != _ALL_MONTHS
+            or self.weekdays != _ALL_WEEKDAYS
+        ):
+            return None
+
+        if self.hours == _ALL_HOURS:
+            step = _uniform_step(self._minute_order, 60)
+            return timedelta(minutes=step) if step else None
+        if len(self.minutes) == 1:
+            step = _uniform_step(self._hour_order, 24)
+            return timedelta(hours=step) if step else None
+        return None
+
+    def _day_matches(self, moment: datetime) -> bool:
+        """Check the day-of-month and day-of-week fields for a date."""
+        day_match = moment.day in self.days
+        # Python counts weekdays from Monday, cron counts from Sunday
+        weekday_match = (moment.weekday() + 1) % 7 in self.weekdays
+
+        # As in standard cron, when both day fields are restricted either may match
+        if self.days != _ALL_DAYS and self.weekdays != _ALL_WEEKDAYS:
+            return day_match or weekday_match
+        return day_match and weekday_match
+
+    def matches(self, moment: datetime) -> bool:
+        """
+        Check whether a time matches the expression (to the minute).
+
+        Args:
+            moment: The naive wall-clock time to check
+
+        Returns:
+            True if the expression fires at that minute, False otherwise
+        """
+        return (
+            moment.minute in self.minutes
+            and moment.hour in self.hours
+            and moment.month in self.months
+            and self._day_matches(moment)
+        )
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        Get the first time strictly after a moment that matches the expression.
+
+        The search walks the fields from months down to minutes, skipping a
+        whole unit whenever a coarser field does not match and jumping straight
+        to the next allowed hour or minute.
+
+        Args:
+            moment: The naive wall-clock time to search from
+
+        Returns:
+            The next matching naive wall-clock time
+
+        Raises:
+            ValueError: If the expression never matches
+        """
+        tick = moment.replace(second=0, microsecond=0)
+
+        # Fast path: from an exact tick of a fixed-interval expression, the
+        # next run is one interval away
+        if self._period and self.matches(tick):
+            return tick + self._period
+
+        candidate = tick + timedelta(minutes=1)
+        last_year = candidate.year + _MAX_LOOKAHEAD_YEARS
+
+        while candidate.year <= last_year:
+            if candidate.month not in self.months:
+                month_start = candidate.replace(day=1, hour=0, minute=0)
+                candidate = (month_start + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(candidate):
+                day_start = candidate.replace(hour=0, minute=0)
+                candidate = day_start + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                index = bisect_left(self._hour_order, candidate.hour)
+                if index < len(self._hour_order):
+                    candidate = candidate.replace(
+                        hour=self._hour_order[index], minute=0
+                    )
+                else:
+                    day_start = candidate.replace(hour=0, minute=0)
+                    candidate = day_start + timedelta(days=1)
+            elif candidate.minute not in self.minutes:
+                index = bisect_left(self._minute_order, candidate.minute)
+                if index < len(self._minute_order):
+                    candidate = candidate.replace(minute=self._minute_order[index])
+                else:
+                    candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            else:
+                return candidate
+
+        raise ValueError("Cron expression does not match any upcoming time")
+
+
+def _uniform_step(values: tuple[int, ...], span: int) -> int | None:
+    """
+    Get the common step of sorted values that repeat evenly across a cycle.
+
+    Args:
+        values: The sorted field values
+        span: The length of the cycle (60 for minutes, 24 for hours)
+
+    Returns:
+        The step between consecutive values, or None if it is not uniform
+    """
+    step = span // len(values)
+    if step * len(values) != span:
+        return None
+    if any(b - a != step for a, b in pairwise(values)):
+        return None
+    return step
+
+
+# A whole expression: exactly five whitespace-separated fields
+_CRON_RE = re.compile(r"^\s*(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s*$")
+
+# A month or weekday name within a field
+_NAME_RE = re.compile(r"[A-Za-z]+")
+
+# A single comma-separated part of a field: "*", "a" or "a-b", optionally "/step"
+_PART_RE = re.compile(
+    r"^(?:(?P<any>\*)|(?P<start>\d+)(?:-(?P<end>\d+))?)(?:/(?P<step>\d+))?$",
+)
+
+
+def _any_bounds(_match: re.Match, low: int, high: int) -> tuple[int, int]:
+    """Get the bounds of a "*" part."""
+    return low, high
+
+
+def _range_bounds(match: re.Match, _low: int, _high: int) -> tuple[int, int]:
+    """Get the bounds of an "a-b" part."""
+    return int(match["start"]), int(match["end"])
+
+
+def _value_bounds(match: re.Match, _low: int, high: int) -> tuple[int, int]:
+    """Get the bounds of an "a" part ("a/n" runs from a to the field maximum)."""
+    start = int(match["start"])
+    return start, high if match["step"] else start
+
+
+# Bounds builders keyed by the shape of the part, as matched by _PART_RE
+_BOUNDS_BUILDERS = {
+    "any": _any_bounds,
+    "range": _range_bounds,
+    "value": _value_bounds,
+}
+
+
+def _part_shape(match: re.Match) -> str:
+    """Classify a matched field part."""
+    if match["any"]:
+        return "any"
+    if match["end"]:
+        return "range"
+    return "value"
+
+
+def _parse_field(field: str, name: str, low: int, high: int) -> frozenset[int]:
+    """
+    Expand a single cron field into the set of values it matches.
+
+    Args:
+        field: The field text (e.g. "*", "1-5", "*/15", "0,30", "MON-FRI")
+        name: The field name (for error messages)
+        low: The lowest allowed value
+        high: The highest allowed value
+
+    Returns:
+        The set of matching values
+
+    Raises:
+        ValueError: If the field is malformed or out of range
+    """
+    values = set()
+
+    # Replace known names with their numbers; unknown ones fail to match below
+    names = _FIELD_NAMES.get(name, {})
+    numeric = _NAME_RE.sub(
+        lambda word: str(names.get(word[0].upper(), word[0])),
+        field,
+    )
+
+    for part in numeric.split(","):
+        match = _PART_RE.match(part)
+        if not match:
+            raise ValueError(f"Invalid value in cron {name} field: {field}")
+
+        step = int(match["step"]) if match["step"] else 1
+        if step < 1:
+            raise ValueError(f"Invalid step in cron {name} field: {field}")
+
+        start, end = _BOUNDS_BUILDERS[_part_shape(match)](match, low, high)
+        if not low <= start <= end <= high:
+            raise ValueError(f"Cron {name} field out of range: {field}")
+
+        values.update(range(start, end + 1, step))
+
+    return frozenset(values)
+
+
+@lru_cache(maxsize=1024)
+def parse_cron(expression: str) -> ParsedCron:
+    """
+    Parse and validate a 5-field cron expression or a predefined schedule.
+
+    Results are cached per expression, so configurations sharing a schedule
+    only pay the parsing cost once.
+
+    Args:
+        expression: The cron expression (minute hour day month weekday), or
+            a macro such as "@daily"
+
+    Returns:
+        The parsed cron expression
+
+    Raises:
+        ValueError: If the expression is not a valid cron expression
+    """
+    expression = _MACROS.get(expression.strip().lower(), expression)
+    match = _CRON_RE.match(expression)
+    if not match:
+        raise ValueError("Schedule must be a valid cron expression with 5 parts")
+    parts = match.groups()
+
+    minutes, hours, days, months, weekdays = (
+        _parse_field(part, name, low, high)
+        for part, (name, low, high) in zip(parts, _FIELD_BOUNDS, strict=True)
+    )
+
+    # Both 0 and 7 mean Sunday
+    if 7 in weekdays:
+        weekdays = (weekdays - {7}) | {0}
+
+    return ParsedCron(
+        minutes=minutes,
+        hours=hours,
+        days=days,
+        months=months,
+        weekdays=weekdays,
+    )
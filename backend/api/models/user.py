@@ -24,6 +24,22 @@ class Preferences(BaseModel):
     )
 
 
+class NotificationPreferences(BaseModel):
+    """User preferences for match notification channels."""
+
+    email: bool = True
+    slack: bool = False
+    slack_webhook: Optional[str] = None
+    telegram: bool = False
+    telegram_chat_id: Optional[str] = None
+    signal: bool = False
+    signal_number: Optional[str] = None
+    primary_channel: str = Field(
+        default="email",
+        description="Channel tried first (email, slack, telegram or signal)",
+    )
+
+
 class User(BaseModel):
     """User model for the Virtual Coffee Platform."""
 
@@ -32,6 +48,7 @@ class User(BaseModel):
     name: str
     deployment_id: str
     preferences: Preferences = Field(default_factory=Preferences)
+    notification_prefs: Optional[NotificationPreferences] = None
     is_active: bool = True
     is_paused: bool = False
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -89,6 +106,7 @@ class UserUpdate(BaseModel):
 
     name: Optional[str] = None
     preferences: Optional[Preferences] = None
+    notification_prefs: Optional[NotificationPreferences] = None
     is_paused: Optional[bool] = None
 
     class Config:
@@ -5,7 +5,7 @@ import logging
 from datetime import datetime
 from typing import Any, Optional
 
-from backend.api.models.config import DeploymentConfig
+from backend.api.models.config import DeploymentConfig, DeploymentConfigView
 from backend.api.repositories.base import BaseRepository
 from backend.api.repositories.dynamodb_connection import dynamodb_manager
 
@@ -120,6 +120,50 @@ class ConfigRepository(BaseRepository[DeploymentConfig]):
         except Exception as e:
             dynamodb_manager.handle_error("get_all_configs", e)
 
+    async def get_all_views(self) -> list[DeploymentConfigView]:
+        """
+        Get the scheduling fields of all deployment configurations.
+
+        Only the fields in DeploymentConfigView are read from the table, and
+        items are not validated into full DeploymentConfig models.
+
+        Returns:
+            A list of configuration views
+        """
+        try:
+            scan_params = {
+                "ProjectionExpression": "#id, #schedule, #timezone, #meeting_size",
+                "ExpressionAttributeNames": {
+                    "#id": "deployment_id",
+                    "#schedule": "schedule",
+                    "#timezone": "timezone",
+                    "#meeting_size": "meeting_size",
+                },
+            }
+
+            views = []
+            while True:
+                response = self.table.scan(**scan_params)
+
+                for item in response.get("Items", []):
+                    views.append(
+                        DeploymentConfigView(
+                            deployment_id=item["deployment_id"],
+                            schedule=item["schedule"],
+                            timezone=item.get("timezone") or "UTC",
+                            # DynamoDB returns numbers as Decimal
+                            meeting_size=int(item.get("meeting_size", 2)),
+                        ),
+                    )
+
+                if "LastEvaluatedKey" not in response:
+                    break
+                scan_params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+            return views
+        except Exception as e:
+            dynamodb_manager.handle_error("get_all_config_views", e)
+
     async def update(
         self, deployment_id: str, config_update: dict[str, Any]
     ) -> Optional[DeploymentConfig]:
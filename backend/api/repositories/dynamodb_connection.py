@@ -5,10 +5,18 @@ import logging
 import os
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
+# Configuration of the shared DynamoDB client and resource: enough pooled
+# connections for concurrent requests, and SDK-side backoff when throttled
+DYNAMODB_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"mode": "adaptive", "max_attempts": 5},
+)
+
 
 class DynamoDBConnectionManager:
     """
@@ -35,6 +43,7 @@ class DynamoDBConnectionManager:
             # Connection parameters
             conn_params = {
                 "region_name": region,
+                "config": DYNAMODB_CLIENT_CONFIG,
             }
 
             # For local development or testing, use a local DynamoDB endpoint
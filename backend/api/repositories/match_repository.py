@@ -2,6 +2,7 @@
 Match repository implementation for DynamoDB.
 """
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any, Optional
 
@@ -39,23 +40,57 @@ class MatchRepository(BaseRepository[Match]):
             The created match
         """
         try:
-            # Ensure deployment_id is set
-            match.deployment_id = self.deployment_id
-
-            # Convert Pydantic model to dict
-            match_dict = match.dict()
-
-            # Convert datetime objects to ISO format strings for DynamoDB
-            match_dict["scheduled_date"] = match_dict["scheduled_date"].isoformat()
-            match_dict["created_at"] = match_dict["created_at"].isoformat()
-
             # Put item in DynamoDB
-            self.table.put_item(Item=match_dict)
+            self.table.put_item(Item=self._to_item(match))
 
             return match
         except Exception as e:
             dynamodb_manager.handle_error("create_match", e)
 
+    async def bulk_create(self, matches: list[Match]) -> list[Match]:
+        """
+        Create several matches with batched writes.
+
+        The batch writer sends the puts 25 at a time (the DynamoDB batch limit)
+        and resends any unprocessed items, instead of one request per match.
+
+        Args:
+            matches: The matches to create
+
+        Returns:
+            The created matches
+        """
+        try:
+            with self.table.batch_writer() as batch:
+                for match in matches:
+                    batch.put_item(Item=self._to_item(match))
+
+            return matches
+        except Exception as e:
+            dynamodb_manager.handle_error("bulk_create_matches", e)
+
+    def _to_item(self, match: Match) -> dict[str, Any]:
+        """
+        Convert a match into a DynamoDB item.
+
+        Args:
+            match: The match to convert
+
+        Returns:
+            The DynamoDB item
+        """
+        # Ensure deployment_id is set
+        match.deployment_id = self.deployment_id
+
+        # Convert Pydantic model to dict
+        match_dict = match.dict()
+
+        # Convert datetime objects to ISO format strings for DynamoDB
+        match_dict["scheduled_date"] = match_dict["scheduled_date"].isoformat()
+        match_dict["created_at"] = match_dict["created_at"].isoformat()
+
+        return match_dict
+
     async def get(self, id: str) -> Optional[Match]:
         """
         Get a match by ID.
@@ -100,6 +135,23 @@ class MatchRepository(BaseRepository[Match]):
         Returns:
             A list of matches
         """
+        return [match async for match in self.iter_all(filter_params)]
+
+    async def iter_all(
+        self, filter_params: Optional[dict[str, Any]] = None
+    ) -> AsyncIterator[Match]:
+        """
+        Iterate over all matches, optionally filtered, one page at a time.
+
+        Only the current query page is held in memory, so callers can stream
+        large deployments without materializing every match.
+
+        Args:
+            filter_params: Optional filter parameters
+
+        Yields:
+            Matches in query order
+        """
         try:
             # Start with basic query for the deployment
             expression_values = {
@@ -129,6 +181,13 @@ class MatchRepository(BaseRepository[Match]):
                         "participant_id"
                     ]
 
+                if "created_since" in filter_params:
+                    # Timestamps are stored as ISO strings, which sort by time
+                    filter_conditions.append("created_at >= :created_since")
+                    expression_values[":created_since"] = filter_params[
+                        "created_since"
+                    ].isoformat()
+
                 if filter_conditions:
                     filter_expression = " AND ".join(filter_conditions)
 
@@ -141,26 +200,11 @@ class MatchRepository(BaseRepository[Match]):
             if filter_expression:
                 query_params["FilterExpression"] = filter_expression
 
-            # Execute query
-            response = self.table.query(**query_params)
-
-            # Process items and convert date strings to datetime objects
-            matches = []
-            for item in response.get("Items", []):
-                if "scheduled_date" in item:
-                    item["scheduled_date"] = datetime.fromisoformat(
-                        item["scheduled_date"]
-                    )
-                if "created_at" in item:
-                    item["created_at"] = datetime.fromisoformat(item["created_at"])
-
-                matches.append(Match(**item))
-
-            # Handle pagination if needed
-            while "LastEvaluatedKey" in response:
-                query_params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+            # Execute the query page by page
+            while True:
                 response = self.table.query(**query_params)
 
+                # Convert date strings to datetime objects
                 for item in response.get("Items", []):
                     if "scheduled_date" in item:
                         item["scheduled_date"] = datetime.fromisoformat(
@@ -169,9 +213,11 @@ class MatchRepository(BaseRepository[Match]):
                     if "created_at" in item:
                         item["created_at"] = datetime.fromisoformat(item["created_at"])
 
-                    matches.append(Match(**item))
+                    yield Match(**item)
 
-            return matches
+                if "LastEvaluatedKey" not in response:
+                    break
+                query_params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
         except Exception as e:
             dynamodb_manager.handle_error("get_all_matches", e)
 
@@ -187,6 +233,27 @@ class MatchRepository(BaseRepository[Match]):
         """
         return await self.get_all({"participant_id": user_id})
 
+    async def get_pending_notifications(self) -> list[Match]:
+        """
+        Get all matches whose participants have not been notified yet.
+
+        The predicate is applied by DynamoDB as a filter expression, so
+        already-notified matches are never returned to the client.
+
+        Returns:
+            A list of matches pending notification
+        """
+        return await self.get_all({"notification_sent": False})
+
+    def iter_pending_notifications(self) -> AsyncIterator[Match]:
+        """
+        Iterate over matches pending notification, one page at a time.
+
+        Returns:
+            An async iterator of matches pending notification
+        """
+        return self.iter_all({"notification_sent": False})
+
     async def update(self, id: str, match_update: dict[str, Any]) -> Optional[Match]:
         """
         Update a match.
@@ -1,7 +1,10 @@
 """
 User repository implementation for DynamoDB.
 """
+import asyncio
 import logging
+import time
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any, Optional
 
@@ -11,6 +14,96 @@ from repositories.dynamodb_connection import dynamodb_manager
 
 logger = logging.getLogger(__name__)
 
+# Most keys DynamoDB accepts in one BatchGetItem call
+BATCH_GET_MAX_KEYS = 100
+
+# Delay before requesting unprocessed keys again, doubled on each attempt
+BATCH_GET_RETRY_DELAY = 0.05
+
+# Attributes always read by projected queries, since a user cannot be built
+# without them
+USER_REQUIRED_ATTRIBUTES = ("id", "email", "name", "deployment_id")
+
+# Most users kept in the lookup cache, and how long each is kept in seconds.
+# Writes only evict the entry on the replica that made them, so the TTL is kept
+# short: long enough to absorb the repeated lookups of one matching or
+# notification run, short enough that other replicas soon see updates
+USER_CACHE_MAX_SIZE = 10_000
+USER_CACHE_TTL = 5.0
+
+
+class _TTLCache:
+    """
+    A size-bounded cache whose entries expire a fixed time after being set.
+
+    Every entry lives for the same time, so insertion order is also expiry
+    order, and the oldest entry is the one evicted when the cache is full.
+    """
+
+    __slots__ = ("_entries", "maxsize", "ttl")
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Most entries kept
+            ttl: How long an entry is kept, in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: dict[Any, tuple[float, Any]] = {}
+
+    def get(self, key: Any) -> Any:
+        """
+        Get an entry.
+
+        Args:
+            key: The key of the entry
+
+        Returns:
+            The value, or None if there is no live entry for the key
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """
+        Set an entry, evicting the oldest one if the cache is full.
+
+        Args:
+            key: The key of the entry
+            value: The value to keep
+        """
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        if len(self._entries) > self.maxsize:
+            del self._entries[next(iter(self._entries))]
+
+    def pop(self, key: Any) -> None:
+        """
+        Remove an entry, if there is one.
+
+        Args:
+            key: The key of the entry
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+
+
+# Users by (deployment, "id", id) and (deployment, "email", email), shared by
+# every repository instance since services are created per request
+_user_cache = _TTLCache(USER_CACHE_MAX_SIZE, USER_CACHE_TTL)
+
 
 class UserRepository(BaseRepository[User]):
     """
@@ -28,6 +121,29 @@ class UserRepository(BaseRepository[User]):
         self.deployment_id = deployment_id
         self.table = dynamodb_manager.get_table(self.table_name)
 
+    def _cache_item(self, item: dict[str, Any]) -> None:
+        """
+        Keep a user's item in the lookup cache, by ID and by email.
+
+        Items rather than users are cached, so callers changing the users
+        they are given cannot change the cache.
+
+        Args:
+            item: The user's DynamoDB item
+        """
+        _user_cache.set((self.deployment_id, "id", item["id"]), item)
+        _user_cache.set((self.deployment_id, "email", item["email"]), item)
+
+    def _evict(self, user: User) -> None:
+        """
+        Remove a user from the lookup cache.
+
+        Args:
+            user: The user to remove
+        """
+        _user_cache.pop((self.deployment_id, "id", user.id))
+        _user_cache.pop((self.deployment_id, "email", user.email))
+
     async def create(self, user: User) -> User:
         """
         Create a new user.
@@ -52,6 +168,7 @@ class UserRepository(BaseRepository[User]):
 
             # Put item in DynamoDB
             self.table.put_item(Item=user_dict)
+            self._cache_item(user_dict)
 
             return user
         except Exception as e:
@@ -68,21 +185,75 @@ class UserRepository(BaseRepository[User]):
             The user if found, None otherwise
         """
         try:
-            response = self.table.get_item(
-                Key={
-                    "id": id,
-                    "deployment_id": self.deployment_id,
-                },
-            )
-
-            item = response.get("Item")
-            if not item:
-                return None
+            item = _user_cache.get((self.deployment_id, "id", id))
+            if item is None:
+                response = self.table.get_item(
+                    Key={
+                        "id": id,
+                        "deployment_id": self.deployment_id,
+                    },
+                )
+
+                item = response.get("Item")
+                if not item:
+                    return None
+                self._cache_item(item)
 
             return User(**item)
         except Exception as e:
             dynamodb_manager.handle_error("get_user", e)
 
+    async def batch_get(self, ids: list[str]) -> list[User]:
+        """
+        Get several users with batched reads.
+
+        Cached users are not requested. The other keys are requested 100 at
+        a time (the DynamoDB batch limit), and any unprocessed keys are
+        requested again with backoff, instead of one request per user.
+
+        Args:
+            ids: The IDs of the users to get
+
+        Returns:
+            The users found, in the order of their IDs
+        """
+        try:
+            unique_ids = list(dict.fromkeys(ids))
+            items = {}
+            missing_ids = []
+            for id in unique_ids:
+                item = _user_cache.get((self.deployment_id, "id", id))
+                if item is None:
+                    missing_ids.append(id)
+                else:
+                    items[id] = item
+
+            for start in range(0, len(missing_ids), BATCH_GET_MAX_KEYS):
+                request = {
+                    self.table_name: {
+                        "Keys": [
+                            {"id": id, "deployment_id": self.deployment_id}
+                            for id in missing_ids[start : start + BATCH_GET_MAX_KEYS]
+                        ],
+                    },
+                }
+                attempt = 0
+                while request:
+                    if attempt:
+                        await asyncio.sleep(BATCH_GET_RETRY_DELAY * 2 ** (attempt - 1))
+                    response = dynamodb_manager.resource.batch_get_item(
+                        RequestItems=request
+                    )
+                    for item in response.get("Responses", {}).get(self.table_name, []):
+                        items[item["id"]] = item
+                        self._cache_item(item)
+                    request = response.get("UnprocessedKeys")
+                    attempt += 1
+
+            return [User(**items[id]) for id in unique_ids if id in items]
+        except Exception as e:
+            dynamodb_manager.handle_error("batch_get_users", e)
+
     async def get_by_email(self, email: str) -> Optional[User]:
         """
         Get a user by email.
@@ -94,36 +265,65 @@ class UserRepository(BaseRepository[User]):
             The user if found, None otherwise
         """
         try:
-            # Use a GSI for email lookups
-            response = self.table.query(
-                IndexName="email-index",
-                KeyConditionExpression="email = :email AND deployment_id = :deployment_id",
-                ExpressionAttributeValues={
-                    ":email": email,
-                    ":deployment_id": self.deployment_id,
-                },
-            )
-
-            items = response.get("Items", [])
-            if not items:
-                return None
+            item = _user_cache.get((self.deployment_id, "email", email))
+            if item is None:
+                # Use a GSI for email lookups
+                response = self.table.query(
+                    IndexName="email-index",
+                    KeyConditionExpression="email = :email AND deployment_id = :deployment_id",
+                    ExpressionAttributeValues={
+                        ":email": email,
+                        ":deployment_id": self.deployment_id,
+                    },
+                )
+
+                items = response.get("Items", [])
+                if not items:
+                    return None
+                item = items[0]
+                self._cache_item(item)
 
-            return User(**items[0])
+            return User(**item)
         except Exception as e:
             dynamodb_manager.handle_error("get_user_by_email", e)
 
     async def get_all(
-        self, filter_params: Optional[dict[str, Any]] = None
+        self,
+        filter_params: Optional[dict[str, Any]] = None,
+        fields: Optional[list[str]] = None,
     ) -> list[User]:
         """
         Get all users, optionally filtered.
 
         Args:
             filter_params: Optional filter parameters
+            fields: Optional attributes to read, besides the ones every user
+                needs; the other attributes take their default values
 
         Returns:
             A list of users
         """
+        return [user async for user in self.iter_all(filter_params, fields)]
+
+    async def iter_all(
+        self,
+        filter_params: Optional[dict[str, Any]] = None,
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[User]:
+        """
+        Iterate over all users, optionally filtered, one page at a time.
+
+        Only the current query page is held in memory, so callers can stream
+        large deployments without materializing every user.
+
+        Args:
+            filter_params: Optional filter parameters
+            fields: Optional attributes to read, besides the ones every user
+                needs; the other attributes take their default values
+
+        Yields:
+            Users in query order
+        """
         try:
             # Start with basic query for the deployment
             expression_values = {
@@ -156,19 +356,26 @@ class UserRepository(BaseRepository[User]):
             if filter_expression:
                 query_params["FilterExpression"] = filter_expression
 
-            # Execute query
-            response = self.table.query(**query_params)
+            # Only read the requested attributes
+            if fields:
+                attributes = dict.fromkeys((*USER_REQUIRED_ATTRIBUTES, *fields))
+                query_params["ProjectionExpression"] = ", ".join(
+                    f"#{attribute}" for attribute in attributes
+                )
+                query_params["ExpressionAttributeNames"] = {
+                    f"#{attribute}": attribute for attribute in attributes
+                }
+
+            # Execute the query page by page
+            while True:
+                response = self.table.query(**query_params)
 
-            # Convert items to User objects
-            users = [User(**item) for item in response.get("Items", [])]
+                for item in response.get("Items", []):
+                    yield User(**item)
 
-            # Handle pagination if needed
-            while "LastEvaluatedKey" in response:
+                if "LastEvaluatedKey" not in response:
+                    break
                 query_params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
-                response = self.table.query(**query_params)
-                users.extend([User(**item) for item in response.get("Items", [])])
-
-            return users
         except Exception as e:
             dynamodb_manager.handle_error("get_all_users", e)
 
@@ -233,8 +440,12 @@ class UserRepository(BaseRepository[User]):
                 ReturnValues="ALL_NEW",
             )
 
-            # Return updated user
+            # Replace the cached user with the updated one
             updated_item = response.get("Attributes", {})
+            self._evict(current_user)
+            self._cache_item(updated_item)
+
+            # Return updated user
             return User(**updated_item)
         except Exception as e:
             dynamodb_manager.handle_error("update_user", e)
@@ -262,6 +473,7 @@ class UserRepository(BaseRepository[User]):
                     "deployment_id": self.deployment_id,
                 },
             )
+            self._evict(user)
 
             return True
         except Exception as e:
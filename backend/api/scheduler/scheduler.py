@@ -6,15 +6,375 @@ and ArgoCD Workflows.
 """
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import random
+import subprocess
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
 
+import orjson
 import pytz
 
-from backend.api.models.config import DeploymentConfig
-from backend.api.services.config_service import ConfigService
+from backend.api.models.config import DeploymentConfig, DeploymentConfigView
+from backend.api.services.config_service import config_service
 
 logger = logging.getLogger(__name__)
 
+_UTC = pytz.UTC
+
+# Lower-cased IANA names pytz can resolve (pytz matches names case-insensitively),
+# so unknown timezones are rejected without paying for the lookup exception
+_KNOWN_TZS = frozenset(name.lower() for name in pytz.all_timezones_set)
+
+# Maximum number of deployments reconciled against the cluster at once
+MAX_CONCURRENT_APPLIES = 10
+
+# Upper bound (in seconds) for the randomized delay between kubectl retries
+MAX_RETRY_DELAY = 30
+
+# Field manager recorded by server-side apply for objects owned by the scheduler
+FIELD_MANAGER = "virtual-coffee-scheduler"
+
+# kubectl errors that will fail the same way on every retry
+NON_RETRIABLE_ERRORS = ("Invalid value", "Forbidden")
+
+
+@lru_cache(maxsize=512)
+def _get_tz(name: str) -> pytz.BaseTzInfo:
+    """
+    Get a timezone by IANA name, caching the lookup.
+
+    Args:
+        name: The IANA timezone name
+
+    Returns:
+        The timezone
+
+    Raises:
+        pytz.exceptions.UnknownTimeZoneError: If the timezone is unknown
+    """
+    return pytz.timezone(name)
+
+
+def _retry_delay(retries: int) -> float:
+    """
+    Get a randomized backoff delay for a retry attempt.
+
+    Full jitter keeps concurrent failing deployments from retrying against the
+    API server in lockstep.
+
+    Args:
+        retries: The number of attempts made so far
+
+    Returns:
+        The delay in seconds
+    """
+    return random.uniform(0, min(MAX_RETRY_DELAY, 2**retries * 0.1))
+
+
+def _is_retriable(error_output: str | None) -> bool:
+    """
+    Check whether a kubectl failure is worth retrying.
+
+    Args:
+        error_output: The stderr output of the failed kubectl command
+
+    Returns:
+        False if the error is known to be permanent, True otherwise
+    """
+    if not error_output:
+        return True
+    return not any(marker in error_output for marker in NON_RETRIABLE_ERRORS)
+
+
+async def _run_kubectl(
+    *args: str, input: bytes | None = None
+) -> subprocess.CompletedProcess:
+    """
+    Run a kubectl command without blocking the event loop.
+
+    Args:
+        *args: The kubectl arguments
+        input: The bytes to pipe to kubectl's stdin, if any
+
+    Returns:
+        The completed process, with its stdout and stderr as bytes
+
+    Raises:
+        subprocess.CalledProcessError: If kubectl exits with a non-zero status
+    """
+    cmd = ["kubectl", *args]
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=subprocess.DEVNULL if input is None else subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    stdout, stderr = await process.communicate(input)
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, cmd, stdout, stderr)
+    return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+
+
+def _build_cronjob_manifest(deployment_id: str, schedule: str, timezone: str) -> dict:
+    """
+    Build the Kubernetes CronJob manifest for a deployment.
+
+    Args:
+        deployment_id: The deployment ID
+        schedule: The cron schedule expression
+        timezone: The timezone for the schedule
+
+    Returns:
+        A dictionary containing the CronJob manifest
+    """
+    manifest = {
+        "apiVersion": "batch/v1",
+        "kind": "CronJob",
+        "metadata": {
+            "name": f"virtual-coffee-matching-{deployment_id}",
+            "namespace": "virtual-coffee",
+            "labels": {
+                "app": "virtual-coffee",
+                "component": "matching",
+                "deployment-id": deployment_id,
+            },
+        },
+        "spec": {
+            "schedule": schedule,
+            "timeZone": timezone,
+            "concurrencyPolicy": "Forbid",
+            "successfulJobsHistoryLimit": 3,
+            "failedJobsHistoryLimit": 3,
+            "jobTemplate": {
+                "spec": {
+                    "template": {
+                        "metadata": {
+                            "labels": {
+                                "app": "virtual-coffee",
+                                "component": "matching",
+                                "deployment-id": deployment_id,
+                            },
+                        },
+                        "spec": {
+                            "containers": [
+                                {
+                                    "name": "matching",
+                                    "image": "virtual-coffee/api:latest",
+                                    "command": [
+                                        "python",
+                                        "-m",
+                                        "backend.api.scheduler.run_matching",
+                                    ],
+                                    "env": [
+                                        {
+                                            "name": "DEPLOYMENT_ID",
+                                            "value": deployment_id,
+                                        },
+                                    ],
+                                    "resources": {
+                                        "requests": {
+                                            "memory": "128Mi",
+                                            "cpu": "100m",
+                                        },
+                                        "limits": {
+                                            "memory": "256Mi",
+                                            "cpu": "200m",
+                                        },
+                                    },
+                                },
+                            ],
+                            "restartPolicy": "OnFailure",
+                        },
+                    },
+                },
+            },
+        },
+    }
+
+    return manifest
+
+
+def _build_argocd_workflow(deployment_id: str, schedule: str, timezone: str) -> dict:
+    """
+    Build the ArgoCD Workflow manifest for a deployment.
+
+    Args:
+        deployment_id: The deployment ID
+        schedule: The cron schedule expression
+        timezone: The timezone for the schedule
+
+    Returns:
+        A dictionary containing the ArgoCD Workflow manifest
+    """
+    manifest = {
+        "apiVersion": "argoproj.io/v1alpha1",
+        "kind": "Workflow",
+        "metadata": {
+            "name": f"virtual-coffee-matching-{deployment_id}",
+            "namespace": "argocd",
+            "labels": {
+                "app": "virtual-coffee",
+                "component": "matching",
+                "deployment-id": deployment_id,
+            },
+        },
+        "spec": {
+            "entrypoint": "matching-workflow",
+            "arguments": {
+                "parameters": [
+                    {
+                        "name": "deployment-id",
+                        "value": deployment_id,
+                    },
+                ],
+            },
+            "templates": [
+                {
+                    "name": "matching-workflow",
+                    "steps": [
+                        [
+                            {
+                                "name": "run-matching",
+                                "template": "run-matching",
+                                "arguments": {
+                                    "parameters": [
+                                        {
+                                            "name": "deployment-id",
+                                            "value": "{{workflow.parameters.deployment-id}}",
+                                        },
+                                    ],
+                                },
+                            },
+                        ],
+                        [
+                            {
+                                "name": "send-notifications",
+                                "template": "send-notifications",
+                                "arguments": {
+                                    "parameters": [
+                                        {
+                                            "name": "deployment-id",
+                                            "value": "{{workflow.parameters.deployment-id}}",
+                                        },
+                                    ],
+                                },
+                                "depends": "run-matching",
+                            },
+                        ],
+                    ],
+                },
+                {
+                    "name": "run-matching",
+                    "inputs": {
+                        "parameters": [
+                            {
+                                "name": "deployment-id",
+                            },
+                        ],
+                    },
+                    "container": {
+                        "image": "virtual-coffee/api:latest",
+                        "command": [
+                            "python",
+                            "-m",
+                            "backend.api.scheduler.run_matching",
+                        ],
+                        "env": [
+                            {
+                                "name": "DEPLOYMENT_ID",
+                                "value": "{{inputs.parameters.deployment-id}}",
+                            },
+                        ],
+                    },
+                },
+                {
+                    "name": "send-notifications",
+                    "inputs": {
+                        "parameters": [
+                            {
+                                "name": "deployment-id",
+                            },
+                        ],
+                    },
+                    "container": {
+                        "image": "virtual-coffee/api:latest",
+                        "command": [
+                            "python",
+                            "-m",
+                            "backend.api.scheduler.send_notifications",
+                        ],
+                        "env": [
+                            {
+                                "name": "DEPLOYMENT_ID",
+                                "value": "{{inputs.parameters.deployment-id}}",
+                            },
+                        ],
+                    },
+                },
+            ],
+        },
+    }
+
+    return manifest
+
+
+# Placeholders substituted into the pre-serialized manifest templates
+_DEPLOYMENT_ID_SENTINEL = "__DEPLOYMENT_ID__"
+_SCHEDULE_SENTINEL = "__SCHEDULE__"
+_TIMEZONE_SENTINEL = "__TIMEZONE__"
+
+# Manifest templates, built once at import with placeholders for the
+# per-deployment values. They are never handed out or mutated.
+_CRONJOB_TEMPLATE = _build_cronjob_manifest(
+    _DEPLOYMENT_ID_SENTINEL, _SCHEDULE_SENTINEL, _TIMEZONE_SENTINEL
+)
+_WORKFLOW_TEMPLATE = _build_argocd_workflow(
+    _DEPLOYMENT_ID_SENTINEL, _SCHEDULE_SENTINEL, _TIMEZONE_SENTINEL
+)
+
+# Templates are serialized once; per-deployment values are spliced in as bytes
+_CRONJOB_BYTES = orjson.dumps(_CRONJOB_TEMPLATE)
+_WORKFLOW_BYTES = orjson.dumps(_WORKFLOW_TEMPLATE)
+
+
+@lru_cache(maxsize=256)
+def _cronjob_bytes(deployment_id: str, schedule: str, timezone: str) -> bytes:
+    """Get the serialized CronJob manifest, memoized per deployment settings."""
+    return _fill_template(_CRONJOB_BYTES, deployment_id, schedule, timezone)
+
+
+@lru_cache(maxsize=256)
+def _workflow_bytes(deployment_id: str, schedule: str, timezone: str) -> bytes:
+    """Get the serialized Workflow manifest, memoized per deployment settings."""
+    return _fill_template(_WORKFLOW_BYTES, deployment_id, schedule, timezone)
+
+
+def _fill_template(
+    template: bytes, deployment_id: str, schedule: str, timezone: str
+) -> bytes:
+    """
+    Substitute deployment values into a pre-serialized manifest template.
+
+    Values are JSON-escaped, so they are safe to splice into string literals.
+
+    Args:
+        template: The serialized manifest containing placeholders
+        deployment_id: The deployment ID
+        schedule: The cron schedule expression
+        timezone: The timezone for the schedule
+
+    Returns:
+        The serialized manifest
+    """
+    return (
+        template.replace(
+            _DEPLOYMENT_ID_SENTINEL.encode(), orjson.dumps(deployment_id)[1:-1]
+        )
+        .replace(_SCHEDULE_SENTINEL.encode(), orjson.dumps(schedule)[1:-1])
+        .replace(_TIMEZONE_SENTINEL.encode(), orjson.dumps(timezone)[1:-1])
+    )
+
 
 class MatchingScheduler:
     """
@@ -29,7 +389,7 @@ class MatchingScheduler:
 
     def __init__(self):
         """Initialize the matching scheduler."""
-        self.config_service = ConfigService()
+        self.config_service = config_service
 
     async def get_all_schedules(self) -> dict[str, dict]:
         """
@@ -38,29 +398,61 @@ class MatchingScheduler:
         Returns:
             A dictionary mapping deployment IDs to schedule information
         """
-        configs = await self.config_service.get_all_configs()
+        configs = await self.config_service.get_all_config_views()
+
+        # Every schedule is computed relative to the same instant
+        now = datetime.now(_UTC)
 
-        schedules = {}
+        # Deployments often share a timezone, so resolve each zone only once
+        by_timezone = defaultdict(list)
         for config in configs:
-            schedule_info = await self.get_schedule_info(config)
-            schedules[config.deployment_id] = schedule_info
+            by_timezone[config.timezone or "UTC"].append(config)
+
+        ordered_configs = []
+        lookups = []
+        for timezone, zone_configs in by_timezone.items():
+            # get_schedule_info reports unknown timezones per deployment
+            local_now = None
+            if timezone.lower() in _KNOWN_TZS:
+                local_now = now.astimezone(_get_tz(timezone)).replace(tzinfo=None)
+
+            for config in zone_configs:
+                ordered_configs.append(config)
+                lookups.append(
+                    self.get_schedule_info(config, now=now, local_now=local_now)
+                )
+
+        # Schedule lookups are independent, so run them concurrently
+        results = await asyncio.gather(*lookups)
 
-        return schedules
+        return {
+            config.deployment_id: schedule_info
+            for config, schedule_info in zip(ordered_configs, results, strict=True)
+        }
 
-    async def get_schedule_info(self, config: DeploymentConfig) -> dict:
+    async def get_schedule_info(
+        self,
+        config: DeploymentConfig | DeploymentConfigView,
+        now: datetime | None = None,
+        local_now: datetime | None = None,
+    ) -> dict:
         """
         Get schedule information for a deployment.
 
         Args:
             config: The deployment configuration
+            now: The timezone-aware current time (defaults to the current UTC time)
+            local_now: The naive current time in the deployment's timezone, when
+                already computed for the zone
 
         Returns:
             A dictionary containing schedule information
         """
-        # Parse the cron expression
-        cron_parts = config.schedule.split()
-        if len(cron_parts) != 5:
-            logger.error(f"Invalid cron expression: {config.schedule}")
+        # The cron expression is parsed once when the configuration is loaded
+        try:
+            parsed_cron = config.parsed_cron
+        except ValueError:
+            logger.exception("Invalid cron expression: %s", config.schedule)
             return {
                 "valid": False,
                 "error": "Invalid cron expression",
@@ -69,22 +461,32 @@ class MatchingScheduler:
         # Get timezone
         timezone = config.timezone or "UTC"
 
-        try:
-            tz = pytz.timezone(timezone)
-        except pytz.exceptions.UnknownTimeZoneError:
-            logger.error(f"Unknown timezone: {timezone}")
+        # Check the timezone name before resolving it; the cron expression has
+        # already been validated above
+        if timezone.lower() not in _KNOWN_TZS:
+            logger.error("Unknown timezone: %s", timezone)
             return {
                 "valid": False,
                 "error": f"Unknown timezone: {timezone}",
             }
 
-        # Calculate next run time (simplified)
-        # In a real implementation, this would use a proper cron parser
-        now = datetime.utcnow()
+        tz = _get_tz(timezone)
 
-        # For demonstration purposes, we'll just add a day
-        # In a real implementation, this would calculate the actual next run time
-        next_run = now + timedelta(days=1)
+        # Calculate the next run time in the deployment's wall-clock time
+        if local_now is None:
+            if now is None:
+                now = datetime.now(_UTC)
+            local_now = now.astimezone(tz).replace(tzinfo=None)
+        try:
+            next_local_run = parsed_cron.next_after(local_now)
+        except ValueError:
+            logger.exception("Cron expression never runs: %s", config.schedule)
+            return {
+                "valid": False,
+                "error": "Cron expression never runs",
+            }
+
+        next_run = tz.localize(next_local_run).astimezone(_UTC).replace(tzinfo=None)
 
         return {
             "valid": True,
@@ -101,6 +503,9 @@ class MatchingScheduler:
         """
         Generate a Kubernetes CronJob manifest for a deployment.
 
+        Use generate_cronjob_manifest_bytes when the manifest is only going to
+        be serialized; it skips building the dictionary entirely.
+
         Args:
             deployment_id: The deployment ID
             schedule: The cron schedule expression
@@ -109,75 +514,23 @@ class MatchingScheduler:
         Returns:
             A dictionary containing the CronJob manifest
         """
-        # Convert cron expression to Kubernetes format if needed
-        k8s_schedule = schedule
-
-        # Create the CronJob manifest
-        manifest = {
-            "apiVersion": "batch/v1",
-            "kind": "CronJob",
-            "metadata": {
-                "name": f"virtual-coffee-matching-{deployment_id}",
-                "namespace": "virtual-coffee",
-                "labels": {
-                    "app": "virtual-coffee",
-                    "component": "matching",
-                    "deployment-id": deployment_id,
-                },
-            },
-            "spec": {
-                "schedule": k8s_schedule,
-                "timeZone": timezone,
-                "concurrencyPolicy": "Forbid",
-                "successfulJobsHistoryLimit": 3,
-                "failedJobsHistoryLimit": 3,
-                "jobTemplate": {
-                    "spec": {
-                        "template": {
-                            "metadata": {
-                                "labels": {
-                                    "app": "virtual-coffee",
-                                    "component": "matching",
-                                    "deployment-id": deployment_id,
-                                },
-                            },
-                            "spec": {
-                                "containers": [
-                                    {
-                                        "name": "matching",
-                                        "image": "virtual-coffee/api:latest",
-                                        "command": [
-                                            "python",
-                                            "-m",
-                                            "backend.api.scheduler.run_matching",
-                                        ],
-                                        "env": [
-                                            {
-                                                "name": "DEPLOYMENT_ID",
-                                                "value": deployment_id,
-                                            },
-                                        ],
-                                        "resources": {
-                                            "requests": {
-                                                "memory": "128Mi",
-                                                "cpu": "100m",
-                                            },
-                                            "limits": {
-                                                "memory": "256Mi",
-                                                "cpu": "200m",
-                                            },
-                                        },
-                                    },
-                                ],
-                                "restartPolicy": "OnFailure",
-                            },
-                        },
-                    },
-                },
-            },
-        }
+        return _build_cronjob_manifest(deployment_id, schedule, timezone)
+
+    def generate_cronjob_manifest_bytes(
+        self, deployment_id: str, schedule: str, timezone: str
+    ) -> bytes:
+        """
+        Generate a serialized Kubernetes CronJob manifest for a deployment.
+
+        Args:
+            deployment_id: The deployment ID
+            schedule: The cron schedule expression
+            timezone: The timezone for the schedule
 
-        return manifest
+        Returns:
+            The CronJob manifest as JSON bytes, ready to pipe to kubectl
+        """
+        return _cronjob_bytes(deployment_id, schedule, timezone)
 
     def generate_argocd_workflow(
         self, deployment_id: str, schedule: str, timezone: str
@@ -185,6 +538,9 @@ class MatchingScheduler:
         """
         Generate an ArgoCD Workflow for a deployment.
 
+        Use generate_argocd_workflow_bytes when the manifest is only going to
+        be serialized; it skips building the dictionary entirely.
+
         Args:
             deployment_id: The deployment ID
             schedule: The cron schedule expression
@@ -193,190 +549,135 @@ class MatchingScheduler:
         Returns:
             A dictionary containing the ArgoCD Workflow manifest
         """
-        # Create the ArgoCD Workflow manifest
-        manifest = {
-            "apiVersion": "argoproj.io/v1alpha1",
-            "kind": "Workflow",
-            "metadata": {
-                "name": f"virtual-coffee-matching-{deployment_id}",
-                "namespace": "argocd",
-                "labels": {
-                    "app": "virtual-coffee",
-                    "component": "matching",
-                    "deployment-id": deployment_id,
-                },
-            },
-            "spec": {
-                "entrypoint": "matching-workflow",
-                "arguments": {
-                    "parameters": [
-                        {
-                            "name": "deployment-id",
-                            "value": deployment_id,
-                        },
-                    ],
-                },
-                "templates": [
-                    {
-                        "name": "matching-workflow",
-                        "steps": [
-                            [
-                                {
-                                    "name": "run-matching",
-                                    "template": "run-matching",
-                                    "arguments": {
-                                        "parameters": [
-                                            {
-                                                "name": "deployment-id",
-                                                "value": "{{workflow.parameters.deployment-id}}",
-                                            },
-                                        ],
-                                    },
-                                },
-                            ],
-                            [
-                                {
-                                    "name": "send-notifications",
-                                    "template": "send-notifications",
-                                    "arguments": {
-                                        "parameters": [
-                                            {
-                                                "name": "deployment-id",
-                                                "value": "{{workflow.parameters.deployment-id}}",
-                                            },
-                                        ],
-                                    },
-                                    "depends": "run-matching",
-                                },
-                            ],
-                        ],
-                    },
-                    {
-                        "name": "run-matching",
-                        "inputs": {
-                            "parameters": [
-                                {
-                                    "name": "deployment-id",
-                                },
-                            ],
-                        },
-                        "container": {
-                            "image": "virtual-coffee/api:latest",
-                            "command": [
-                                "python",
-                                "-m",
-                                "backend.api.scheduler.run_matching",
-                            ],
-                            "env": [
-                                {
-                                    "name": "DEPLOYMENT_ID",
-                                    "value": "{{inputs.parameters.deployment-id}}",
-                                },
-                            ],
-                        },
-                    },
-                    {
-                        "name": "send-notifications",
-                        "inputs": {
-                            "parameters": [
-                                {
-                                    "name": "deployment-id",
-                                },
-                            ],
-                        },
-                        "container": {
-                            "image": "virtual-coffee/api:latest",
-                            "command": [
-                                "python",
-                                "-m",
-                                "backend.api.scheduler.send_notifications",
-                            ],
-                            "env": [
-                                {
-                                    "name": "DEPLOYMENT_ID",
-                                    "value": "{{inputs.parameters.deployment-id}}",
-                                },
-                            ],
-                        },
-                    },
-                ],
-            },
-        }
+        return _build_argocd_workflow(deployment_id, schedule, timezone)
 
-        return manifest
+    def generate_argocd_workflow_bytes(
+        self, deployment_id: str, schedule: str, timezone: str
+    ) -> bytes:
+        """
+        Generate a serialized ArgoCD Workflow for a deployment.
 
-    async def apply_schedule(self, deployment_id: str) -> bool:
+        Args:
+            deployment_id: The deployment ID
+            schedule: The cron schedule expression
+            timezone: The timezone for the schedule
+
+        Returns:
+            The ArgoCD Workflow manifest as JSON bytes, ready to pipe to kubectl
+        """
+        return _workflow_bytes(deployment_id, schedule, timezone)
+
+    async def apply_schedule(
+        self,
+        deployment_id: str,
+        config: DeploymentConfig | DeploymentConfigView | None = None,
+    ) -> bool:
         """
         Apply the schedule for a deployment.
 
         This method:
-        1. Gets the deployment configuration
+        1. Gets the deployment configuration (unless it was already loaded)
         2. Generates the CronJob and ArgoCD Workflow manifests
         3. Applies the manifests to the Kubernetes cluster
 
         Args:
             deployment_id: The deployment ID
+            config: The already-loaded deployment configuration, if available
 
         Returns:
             True if the schedule was applied successfully, False otherwise
         """
-        # Get the deployment configuration
-        config = await self.config_service.get_config(deployment_id)
+        # Get the deployment configuration once; everything below reuses it
+        if config is None:
+            config = await self.config_service.get_config(deployment_id)
         if not config:
-            logger.error(f"No configuration found for deployment {deployment_id}")
+            logger.error("No configuration found for deployment %s", deployment_id)
             return False
 
         # Get schedule information
         schedule_info = await self.get_schedule_info(config)
         if not schedule_info["valid"]:
             logger.error(
-                f"Invalid schedule for deployment {deployment_id}: {schedule_info['error']}"
+                "Invalid schedule for deployment %s: %s",
+                deployment_id,
+                schedule_info["error"],
             )
             return False
 
-        # Generate manifests
-        cronjob = self.generate_cronjob_manifest(
+        # Generate the serialized manifests that are piped to kubectl
+        cronjob = self.generate_cronjob_manifest_bytes(
             deployment_id,
             config.schedule,
             config.timezone,
         )
 
-        workflow = self.generate_argocd_workflow(
+        workflow = self.generate_argocd_workflow_bytes(
             deployment_id,
             config.schedule,
             config.timezone,
         )
 
+        resource_name = f"virtual-coffee-matching-{deployment_id}"
+
         # Apply the manifests to the cluster
         try:
             # Apply CronJob manifest
-            success = await self._apply_kubernetes_manifest(cronjob, "CronJob")
+            success = await self._apply_kubernetes_manifest(
+                cronjob, "CronJob", resource_name
+            )
             if not success:
-                logger.error(f"Failed to apply CronJob for deployment {deployment_id}")
+                logger.error("Failed to apply CronJob for deployment %s", deployment_id)
                 return False
 
             # Apply ArgoCD Workflow manifest
-            success = await self._apply_argocd_workflow(workflow)
+            success = await self._apply_argocd_workflow(workflow, resource_name)
             if not success:
                 logger.error(
-                    f"Failed to apply ArgoCD Workflow for deployment {deployment_id}"
+                    "Failed to apply ArgoCD Workflow for deployment %s",
+                    deployment_id,
                 )
                 # Try to clean up the CronJob if workflow application fails
                 await self._delete_kubernetes_manifest(
-                    f"virtual-coffee-matching-{deployment_id}",
+                    resource_name,
                     "CronJob",
                     "virtual-coffee",
                 )
                 return False
 
-            logger.info(f"Successfully applied schedule for deployment {deployment_id}")
+            logger.info(
+                "Successfully applied schedule for deployment %s", deployment_id
+            )
             return True
-        except Exception as e:
+        except Exception:
             logger.exception(
-                f"Error applying schedule for deployment {deployment_id}: {e}"
+                "Error applying schedule for deployment %s", deployment_id
             )
             return False
 
+    async def apply_all_schedules(self) -> dict[str, bool]:
+        """
+        Apply the schedules for all deployments.
+
+        Configurations are loaded in one batch and handed to apply_schedule,
+        and deployments are applied concurrently up to MAX_CONCURRENT_APPLIES.
+
+        Returns:
+            A dictionary mapping deployment IDs to whether their schedule was applied
+        """
+        configs = await self.config_service.get_all_config_views()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_APPLIES)
+
+        async def apply(config: DeploymentConfigView) -> bool:
+            async with semaphore:
+                return await self.apply_schedule(config.deployment_id, config)
+
+        results = await asyncio.gather(*(apply(config) for config in configs))
+
+        return {
+            config.deployment_id: success
+            for config, success in zip(configs, results, strict=True)
+        }
+
     async def remove_schedule(self, deployment_id: str) -> bool:
         """
         Remove the schedule for a deployment.
@@ -404,102 +705,104 @@ class MatchingScheduler:
 
             if cronjob_success and workflow_success:
                 logger.info(
-                    f"Successfully removed schedule for deployment {deployment_id}"
+                    "Successfully removed schedule for deployment %s", deployment_id
                 )
                 return True
             else:
                 logger.warning(
-                    f"Partial success removing schedule for deployment {deployment_id}"
+                    "Partial success removing schedule for deployment %s",
+                    deployment_id,
                 )
                 return False
-        except Exception as e:
+        except Exception:
             logger.exception(
-                f"Error removing schedule for deployment {deployment_id}: {e}"
+                "Error removing schedule for deployment %s", deployment_id
             )
             return False
 
     async def _apply_kubernetes_manifest(
-        self, manifest: dict, kind: str, max_retries: int = 3
+        self, manifest: bytes, kind: str, name: str, max_retries: int = 3
     ) -> bool:
         """
         Apply a Kubernetes manifest to the cluster.
 
         Args:
-            manifest: The Kubernetes manifest to apply
+            manifest: The serialized Kubernetes manifest to apply
             kind: The kind of resource being applied (for logging)
+            name: The name of the resource being applied (for logging)
             max_retries: Maximum number of retry attempts
 
         Returns:
             True if the manifest was applied successfully, False otherwise
         """
-        import json
-        import os
-        import subprocess
-        import tempfile
-
         # In a real implementation, this would use the Kubernetes Python client
         # or a similar library. For this implementation, we'll use kubectl via subprocess.
 
         retries = 0
         while retries <= max_retries:
             try:
-                # Create a temporary file for the manifest
-                with tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".json", delete=False
-                ) as temp:
-                    json.dump(manifest, temp)
-                    temp_path = temp.name
-
-                try:
-                    # Apply the manifest using kubectl
-                    logger.info(
-                        f"Applying {kind} manifest: {manifest['metadata']['name']}"
-                    )
-
-                    # Execute kubectl apply
-                    result = subprocess.run(
-                        ["kubectl", "apply", "-f", temp_path],
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
-
-                    logger.info(f"Successfully applied {kind}: {result.stdout.strip()}")
-                    return True
+                # Apply the manifest using kubectl
+                logger.info("Applying %s manifest: %s", kind, name)
+
+                # Execute kubectl apply server-side, so unchanged manifests
+                # are deduplicated by the API server instead of re-patched.
+                # The manifest is piped through stdin rather than a temp file.
+                result = await _run_kubectl(
+                    "apply",
+                    "--server-side",
+                    "--force-conflicts",
+                    f"--field-manager={FIELD_MANAGER}",
+                    "-f",
+                    "-",
+                    input=manifest,
+                )
 
-                finally:
-                    # Clean up the temporary file
-                    if os.path.exists(temp_path):
-                        os.unlink(temp_path)
+                logger.info(
+                    "Successfully applied %s: %s",
+                    kind,
+                    result.stdout.decode().strip(),
+                )
+                return True
 
             except subprocess.CalledProcessError as e:
+                stderr = e.stderr.decode(errors="replace") if e.stderr else ""
+                if not _is_retriable(stderr):
+                    logger.exception("Failed to apply %s: %s", kind, stderr.strip())
+                    return False
+
                 retries += 1
                 logger.warning(
-                    f"Failed to apply {kind} (attempt {retries}/{max_retries}): "
-                    f"{e.stderr.strip() if e.stderr else str(e)}",
+                    "Failed to apply %s (attempt %s/%s): %s",
+                    kind,
+                    retries,
+                    max_retries,
+                    stderr.strip() or str(e),
                 )
 
                 if retries <= max_retries:
-                    # Wait before retrying (exponential backoff)
-                    await asyncio.sleep(2**retries)
+                    # Wait before retrying (jittered exponential backoff)
+                    await asyncio.sleep(_retry_delay(retries))
                 else:
-                    logger.error(f"Failed to apply {kind} after {max_retries} attempts")
+                    logger.exception(
+                        "Failed to apply %s after %s attempts", kind, max_retries
+                    )
                     return False
 
-            except Exception as e:
-                logger.exception(f"Error applying {kind}: {e}")
+            except Exception:
+                logger.exception("Error applying %s", kind)
                 return False
 
         return False
 
     async def _apply_argocd_workflow(
-        self, workflow: dict, max_retries: int = 3
+        self, workflow: bytes, name: str, max_retries: int = 3
     ) -> bool:
         """
         Apply an ArgoCD Workflow manifest to the cluster.
 
         Args:
-            workflow: The ArgoCD Workflow manifest to apply
+            workflow: The serialized ArgoCD Workflow manifest to apply
+            name: The name of the workflow (for logging)
             max_retries: Maximum number of retry attempts
 
         Returns:
@@ -508,7 +811,7 @@ class MatchingScheduler:
         # ArgoCD workflows require special handling through the Argo CLI
         # For this implementation, we'll use the same approach as _apply_kubernetes_manifest
         return await self._apply_kubernetes_manifest(
-            workflow, "ArgoCD Workflow", max_retries
+            workflow, "ArgoCD Workflow", name, max_retries
         )
 
     async def _delete_kubernetes_manifest(
@@ -526,50 +829,57 @@ class MatchingScheduler:
         Returns:
             True if the resource was deleted successfully, False otherwise
         """
-        import asyncio
-        import subprocess
-
         retries = 0
         while retries <= max_retries:
             try:
                 # Execute kubectl delete
-                logger.info(f"Deleting {kind} {name} in namespace {namespace}")
+                logger.info("Deleting %s %s in namespace %s", kind, name, namespace)
 
-                result = subprocess.run(
-                    ["kubectl", "delete", kind.lower(), name, "-n", namespace],
-                    capture_output=True,
-                    text=True,
-                    check=True,
+                result = await _run_kubectl(
+                    "delete", kind.lower(), name, "-n", namespace
                 )
 
-                logger.info(f"Successfully deleted {kind}: {result.stdout.strip()}")
+                logger.info(
+                    "Successfully deleted %s: %s", kind, result.stdout.decode().strip()
+                )
                 return True
 
             except subprocess.CalledProcessError as e:
+                stderr = e.stderr.decode(errors="replace") if e.stderr else ""
                 # Check if the resource doesn't exist (which is fine)
-                if "not found" in e.stderr:
+                if "not found" in stderr:
                     logger.info(
-                        f"{kind} {name} not found in namespace {namespace}, nothing to delete"
+                        "%s %s not found in namespace %s, nothing to delete",
+                        kind,
+                        name,
+                        namespace,
                     )
                     return True
 
+                if not _is_retriable(stderr):
+                    logger.exception("Failed to delete %s: %s", kind, stderr.strip())
+                    return False
+
                 retries += 1
                 logger.warning(
-                    f"Failed to delete {kind} (attempt {retries}/{max_retries}): "
-                    f"{e.stderr.strip() if e.stderr else str(e)}",
+                    "Failed to delete %s (attempt %s/%s): %s",
+                    kind,
+                    retries,
+                    max_retries,
+                    stderr.strip() or str(e),
                 )
 
                 if retries <= max_retries:
-                    # Wait before retrying (exponential backoff)
-                    await asyncio.sleep(2**retries)
+                    # Wait before retrying (jittered exponential backoff)
+                    await asyncio.sleep(_retry_delay(retries))
                 else:
-                    logger.error(
-                        f"Failed to delete {kind} after {max_retries} attempts"
+                    logger.exception(
+                        "Failed to delete %s after %s attempts", kind, max_retries
                     )
                     return False
 
-            except Exception as e:
-                logger.exception(f"Error deleting {kind}: {e}")
+            except Exception:
+                logger.exception("Error deleting %s", kind)
                 return False
 
         return False
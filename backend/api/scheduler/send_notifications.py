@@ -14,6 +14,13 @@ from backend.api.services.notification_service import NotificationService
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of match batches notified concurrently
+MAX_CONCURRENT_NOTIFICATIONS = 4
+
+# Matches notified together, so their emails share SES bulk sends (a bulk send
+# takes 50 destinations, the participants of 25 pairs)
+MATCHES_PER_BATCH = 25
+
 
 async def send_notifications():
     """
@@ -34,48 +41,84 @@ async def send_notifications():
         logger.error("No deployment ID provided")
         return 1
 
-    logger.info(f"Sending notifications for deployment {deployment_id}")
+    logger.info("Sending notifications for deployment %s", deployment_id)
 
     try:
         # Create repositories and services
         match_repository = MatchRepository(deployment_id)
         notification_service = NotificationService(deployment_id)
 
-        # Get all matches
-        all_matches = await match_repository.get_all()
-
-        # Filter to matches that need notifications
-        pending_matches = [
-            match for match in all_matches if not match.notification_sent
-        ]
-
-        if not pending_matches:
-            logger.info(f"No pending notifications for deployment {deployment_id}")
+        # Peek at the first pending match, so an empty run exits before any
+        # workers are started
+        pending_matches = match_repository.iter_pending_notifications()
+        first_match = await anext(pending_matches, None)
+        if first_match is None:
+            logger.info("No pending notifications for deployment %s", deployment_id)
             return 0
 
-        logger.info(f"Found {len(pending_matches)} matches requiring notifications")
-
-        # Process each match
-        success_count = 0
-        failure_count = 0
-
-        for match in pending_matches:
-            success = await notification_service.send_match_notification(match)
-            if success:
-                logger.info(f"Successfully sent notifications for match {match.id}")
-                success_count += 1
-            else:
-                logger.error(f"Failed to send notifications for match {match.id}")
-                failure_count += 1
+        # Stream batches of pending matches through a bounded queue to a
+        # fixed pool of workers, so memory use is capped by the queue rather
+        # than the number of pending matches
+        queue = asyncio.Queue(maxsize=MAX_CONCURRENT_NOTIFICATIONS * 2)
+        counts = {"success": 0, "failure": 0}
+
+        async def worker():
+            while (batch := await queue.get()) is not None:
+                try:
+                    results = await notification_service.send_match_notifications_bulk(
+                        batch
+                    )
+                except Exception:
+                    logger.exception(
+                        "Error sending notifications for %s matches",
+                        len(batch),
+                    )
+                    results = [False] * len(batch)
+
+                for match, success in zip(batch, results, strict=True):
+                    if success:
+                        logger.info(
+                            "Successfully sent notifications for match %s", match.id
+                        )
+                        counts["success"] += 1
+                    else:
+                        logger.error(
+                            "Failed to send notifications for match %s", match.id
+                        )
+                        counts["failure"] += 1
+
+        workers = [
+            asyncio.create_task(worker()) for _ in range(MAX_CONCURRENT_NOTIFICATIONS)
+        ]
+        try:
+            batch = [first_match]
+            async for match in pending_matches:
+                if len(batch) == MATCHES_PER_BATCH:
+                    await queue.put(batch)
+                    batch = []
+                batch.append(match)
+            await queue.put(batch)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            await notification_service.aclose()
+
+        success_count = counts["success"]
+        failure_count = counts["failure"]
 
         logger.info(
-            f"Notification summary: {success_count} successful, {failure_count} failed"
+            "Notification summary: %s successful, %s failed",
+            success_count,
+            failure_count,
         )
 
         # Return success if at least some notifications were sent
         return 0 if success_count > 0 else 1
     except Exception:
-        logger.exception(f"Error sending notifications for deployment {deployment_id}")
+        logger.exception("Error sending notifications for deployment %s", deployment_id)
         return 1
 
 
@@ -2,18 +2,40 @@
 Configuration service implementation for the Virtual Coffee Platform.
 """
 import logging
+import time
 from typing import Optional
 
 from backend.api.models.config import (
     ConfigCreate,
     ConfigUpdate,
     DeploymentConfig,
+    DeploymentConfigView,
     EmailTemplates,
 )
+from backend.api.models.cron import parse_cron
 from backend.api.repositories.config_repository import ConfigRepository
 
 logger = logging.getLogger(__name__)
 
+# How long (in seconds) configurations read from the repository are reused
+CONFIG_CACHE_TTL = 10.0
+
+
+def _copy_config(config: DeploymentConfig) -> DeploymentConfig:
+    """
+    Copy a cached configuration, so callers cannot modify the cached instance.
+
+    Args:
+        config: The cached configuration
+
+    Returns:
+        A deep copy of the configuration
+    """
+    # model_copy is the Pydantic v2 name; .copy() is kept for v1
+    if hasattr(config, "model_copy"):
+        return config.model_copy(deep=True)
+    return config.copy(deep=True)
+
 
 class ConfigService:
     """
@@ -26,6 +48,22 @@ class ConfigService:
         """
         self.repository = ConfigRepository()
 
+        # Recently read configurations, as (read time, value), invalidated on writes
+        self._cache: dict[str, tuple[float, DeploymentConfig]] = {}
+        self._all_cache: Optional[tuple[float, list[DeploymentConfig]]] = None
+        self._views_cache: Optional[tuple[float, list[DeploymentConfigView]]] = None
+
+    def _invalidate(self, deployment_id: str) -> None:
+        """
+        Drop cached reads affected by a write to a deployment's configuration.
+
+        Args:
+            deployment_id: The ID of the deployment that was written
+        """
+        self._cache.pop(deployment_id, None)
+        self._all_cache = None
+        self._views_cache = None
+
     async def create_config(
         self, deployment_id: str, config_create: ConfigCreate
     ) -> DeploymentConfig:
@@ -55,28 +93,69 @@ class ConfigService:
             email_templates=config_create.email_templates or EmailTemplates(),
         )
 
-        return await self.repository.create(config)
+        result = await self.repository.create(config)
+        self._invalidate(deployment_id)
+        return result
 
     async def get_config(self, deployment_id: str) -> Optional[DeploymentConfig]:
         """
         Get a deployment configuration by ID.
 
+        Configurations are cached for CONFIG_CACHE_TTL seconds; each call
+        returns its own copy of the cached configuration.
+
         Args:
             deployment_id: The ID of the deployment
 
         Returns:
             The configuration if found, None otherwise
         """
-        return await self.repository.get(deployment_id)
+        cached = self._cache.get(deployment_id)
+        if cached and time.monotonic() - cached[0] < CONFIG_CACHE_TTL:
+            return _copy_config(cached[1])
+
+        config = await self.repository.get(deployment_id)
+        if config:
+            self._cache[deployment_id] = (time.monotonic(), config)
+            return _copy_config(config)
+        return config
 
     async def get_all_configs(self) -> list[DeploymentConfig]:
         """
         Get all deployment configurations.
 
+        The list is cached for CONFIG_CACHE_TTL seconds; each call returns
+        its own copies of the cached configurations.
+
         Returns:
             A list of configurations
         """
-        return await self.repository.get_all()
+        if self._all_cache and time.monotonic() - self._all_cache[0] < CONFIG_CACHE_TTL:
+            return [_copy_config(config) for config in self._all_cache[1]]
+
+        configs = await self.repository.get_all()
+        self._all_cache = (time.monotonic(), configs)
+        return [_copy_config(config) for config in configs]
+
+    async def get_all_config_views(self) -> list[DeploymentConfigView]:
+        """
+        Get lightweight read-only views of all deployment configurations.
+
+        Intended for sweeps that only need the scheduling fields. The list is
+        cached for CONFIG_CACHE_TTL seconds.
+
+        Returns:
+            A list of configuration views
+        """
+        if (
+            self._views_cache
+            and time.monotonic() - self._views_cache[0] < CONFIG_CACHE_TTL
+        ):
+            return list(self._views_cache[1])
+
+        views = await self.repository.get_all_views()
+        self._views_cache = (time.monotonic(), views)
+        return list(views)
 
     async def update_config(
         self, deployment_id: str, config_update: ConfigUpdate
@@ -90,11 +169,24 @@ class ConfigService:
 
         Returns:
             The updated configuration if found, None otherwise
+
+        Raises:
+            ValueError: If the schedule is not a valid cron expression
         """
-        # Convert Pydantic model to dict
-        update_dict = config_update.dict(exclude_unset=True)
+        # Convert Pydantic model to dict (model_dump is the compiled path on
+        # Pydantic v2; .dict() is kept for v1)
+        if hasattr(config_update, "model_dump"):
+            update_dict = config_update.model_dump(exclude_unset=True)
+        else:
+            update_dict = config_update.dict(exclude_unset=True)
 
-        return await self.repository.update(deployment_id, update_dict)
+        # Validate the schedule before it is persisted
+        if update_dict.get("schedule") is not None:
+            parse_cron(update_dict["schedule"])
+
+        result = await self.repository.update(deployment_id, update_dict)
+        self._invalidate(deployment_id)
+        return result
 
     async def update_schedule(
         self, deployment_id: str, schedule: str, timezone: Optional[str] = None
@@ -109,13 +201,21 @@ class ConfigService:
 
         Returns:
             The updated configuration if found, None otherwise
+
+        Raises:
+            ValueError: If the schedule is not a valid cron expression
         """
+        # Validate the schedule before it is persisted
+        parse_cron(schedule)
+
         update_dict = {"schedule": schedule}
 
         if timezone:
             update_dict["timezone"] = timezone
 
-        return await self.repository.update(deployment_id, update_dict)
+        result = await self.repository.update(deployment_id, update_dict)
+        self._invalidate(deployment_id)
+        return result
 
     async def update_meeting_size(
         self, deployment_id: str, meeting_size: int
@@ -132,7 +232,9 @@ class ConfigService:
         """
         update_dict = {"meeting_size": meeting_size}
 
-        return await self.repository.update(deployment_id, update_dict)
+        result = await self.repository.update(deployment_id, update_dict)
+        self._invalidate(deployment_id)
+        return result
 
     async def delete_config(self, deployment_id: str) -> bool:
         """
@@ -144,4 +246,10 @@ class ConfigService:
         Returns:
             True if the configuration was deleted, False otherwise
         """
-        return await self.repository.delete(deployment_id)
+        result = await self.repository.delete(deployment_id)
+        self._invalidate(deployment_id)
+        return result
+
+
+# Shared instance, so the repository and the read cache live for the whole process
+config_service = ConfigService()
@@ -1,112 +1,77 @@
 """
 Email templates for the Virtual Coffee Platform.
 
-This module contains HTML templates for various email notifications.
+This module contains HTML templates for various email notifications. The
+templates are compiled once by a shared Jinja2 environment, so sending an email
+only pays the rendering cost.
 """
+import binascii
+import re
+import sys
+from collections.abc import Callable
+from functools import lru_cache
+from html import escape
+from pathlib import Path
+from types import MappingProxyType
 
-# Match notification template
-MATCH_NOTIFICATION_TEMPLATE = """
+from botocore.exceptions import ClientError
+from jinja2 import DictLoader, Environment, Template, meta
+from markupsafe import Markup
+
+# Shared stylesheet, inlined into each template's <style> block because most
+# mail clients drop external <link> stylesheets
+_STYLESHEET_PATH = Path(__file__).with_name("email_static.css")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_TAG_GAP_RE = re.compile(r"(>|%\})\s+(<|\{%)")
+_CSS_GAP_RE = re.compile(r"\s*([{};:,])\s*")
+
+
+def _minify_css(css: str) -> str:
+    """
+    Strip the whitespace from a stylesheet.
+
+    Args:
+        css: The stylesheet source
+
+    Returns:
+        The minified, interned stylesheet
+    """
+    css = _CSS_GAP_RE.sub(r"\1", _WHITESPACE_RE.sub(" ", css))
+    return sys.intern(css.replace(";}", "}").strip())
+
+
+def _minify(html: str) -> str:
+    """
+    Collapse the indentation and whitespace in an HTML template.
+
+    Args:
+        html: The template source
+
+    Returns:
+        The minified, interned template source
+    """
+    html = _TAG_GAP_RE.sub(r"\1\2", _WHITESPACE_RE.sub(" ", html))
+    return sys.intern(html.strip())
+
+
+# Layout shared by every email; the templates below fill in its blocks
+_BASE_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Virtual Coffee Match</title>
-    <style>
-        body {
-            font-family: 'Amazon Ember', Arial, sans-serif;
-            line-height: 1.6;
-            color: #16191f;
-            margin: 0;
-            padding: 0;
-            background-color: #f8f8f8;
-        }
-        .container {
-            max-width: 600px;
-            margin: 0 auto;
-            background-color: #ffffff;
-            border: 1px solid #eaeded;
-            border-radius: 4px;
-            overflow: hidden;
-        }
-        .header {
-            background-color: #232f3e;
-            padding: 20px;
-            text-align: center;
-        }
-        .header h1 {
-            color: #ffffff;
-            margin: 0;
-            font-size: 24px;
-            font-weight: 500;
-        }
-        .content {
-            padding: 30px;
-        }
-        .match-details {
-            background-color: #f2f3f3;
-            border-radius: 4px;
-            padding: 20px;
-            margin: 20px 0;
-        }
-        .participant {
-            margin-bottom: 15px;
-            padding-bottom: 15px;
-            border-bottom: 1px solid #eaeded;
-        }
-        .participant:last-child {
-            margin-bottom: 0;
-            padding-bottom: 0;
-            border-bottom: none;
-        }
-        .button {
-            display: inline-block;
-            background-color: #ff9900;
-            color: #ffffff;
-            text-decoration: none;
-            padding: 10px 20px;
-            border-radius: 4px;
-            margin-top: 20px;
-        }
-        .footer {
-            background-color: #f2f3f3;
-            padding: 20px;
-            text-align: center;
-            font-size: 12px;
-            color: #687078;
-        }
-        .preferences-link {
-            color: #0073bb;
-            text-decoration: none;
-        }
-    </style>
+    <title>{% block title %}{% endblock %}</title>
+    <style>{% include "email_static.css" %}</style>
 </head>
 <body>
     <div class="container">
         <div class="header">
-            <h1>Virtual Coffee Match</h1>
+            <h1>{{ self.title() }}</h1>
         </div>
         <div class="content">
-            <p>Hello {{user_name}},</p>
-            <p>You've been matched for a virtual coffee meeting! This is a great opportunity to connect with colleagues and share ideas in a casual setting.</p>
-
-            <div class="match-details">
-                <h2>Your Match Details</h2>
-                {{participants_html}}
-
-                <p>We recommend scheduling a {{meeting_length}} minute meeting at a time that works for everyone.</p>
-            </div>
-
-            <p>Some conversation starters:</p>
-            <ul>
-                <li>What are you working on currently?</li>
-                <li>What's something interesting you've learned recently?</li>
-                <li>Any book/podcast recommendations?</li>
-            </ul>
-
-            <p>Enjoy your virtual coffee!</p>
-
-            <a href="{{platform_url}}" class="button">View Match in Platform</a>
+            {% block content %}{% endblock %}
         </div>
         <div class="footer">
             <p>This is an automated message from the Virtual Coffee Platform.</p>
@@ -118,237 +83,608 @@ MATCH_NOTIFICATION_TEMPLATE = """
 </html>
 """
 
+# Match notification template
+MATCH_NOTIFICATION_TEMPLATE = """
+{% extends "base.html" %}
+{% block title %}Virtual Coffee Match{% endblock %}
+{% block content %}
+    <p>Hello {{user_name}},</p>
+    <p>You've been matched for a virtual coffee meeting! This is a great opportunity to connect with colleagues and share ideas in a casual setting.</p>
+
+    <div class="match-details">
+        <h2>Your Match Details</h2>
+        {{participants_html}}
+
+        <p>We recommend scheduling a {{meeting_length}} minute meeting at a time that works for everyone.</p>
+    </div>
+
+    <p>Some conversation starters:</p>
+    <ul>
+        <li>What are you working on currently?</li>
+        <li>What's something interesting you've learned recently?</li>
+        <li>Any book/podcast recommendations?</li>
+    </ul>
+
+    <p>Enjoy your virtual coffee!</p>
+
+    <a href="{{platform_url}}" class="button">View Match in Platform</a>
+{% endblock %}
+"""
+
 # Match reminder template
 MATCH_REMINDER_TEMPLATE = """
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Virtual Coffee Reminder</title>
-    <style>
-        body {
-            font-family: 'Amazon Ember', Arial, sans-serif;
-            line-height: 1.6;
-            color: #16191f;
-            margin: 0;
-            padding: 0;
-            background-color: #f8f8f8;
-        }
-        .container {
-            max-width: 600px;
-            margin: 0 auto;
-            background-color: #ffffff;
-            border: 1px solid #eaeded;
-            border-radius: 4px;
-            overflow: hidden;
-        }
-        .header {
-            background-color: #232f3e;
-            padding: 20px;
-            text-align: center;
-        }
-        .header h1 {
-            color: #ffffff;
-            margin: 0;
-            font-size: 24px;
-            font-weight: 500;
-        }
-        .content {
-            padding: 30px;
-        }
-        .match-details {
-            background-color: #f2f3f3;
-            border-radius: 4px;
-            padding: 20px;
-            margin: 20px 0;
-        }
-        .button {
-            display: inline-block;
-            background-color: #ff9900;
-            color: #ffffff;
-            text-decoration: none;
-            padding: 10px 20px;
-            border-radius: 4px;
-            margin-top: 20px;
-        }
-        .footer {
-            background-color: #f2f3f3;
-            padding: 20px;
-            text-align: center;
-            font-size: 12px;
-            color: #687078;
-        }
-        .preferences-link {
-            color: #0073bb;
-            text-decoration: none;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Virtual Coffee Reminder</h1>
-        </div>
-        <div class="content">
-            <p>Hello {{user_name}},</p>
-            <p>This is a friendly reminder about your virtual coffee match. Have you scheduled your meeting yet?</p>
+{% extends "base.html" %}
+{% block title %}Virtual Coffee Reminder{% endblock %}
+{% block content %}
+    <p>Hello {{user_name}},</p>
+    <p>This is a friendly reminder about your virtual coffee match. Have you scheduled your meeting yet?</p>
 
-            <div class="match-details">
-                <h2>Your Match Details</h2>
-                {{participants_html}}
-            </div>
+    <div class="match-details">
+        <h2>Your Match Details</h2>
+        {{participants_html}}
+    </div>
 
-            <p>Don't miss out on this opportunity to connect with your colleagues!</p>
+    <p>Don't miss out on this opportunity to connect with your colleagues!</p>
 
-            <a href="{{platform_url}}" class="button">View Match in Platform</a>
-        </div>
-        <div class="footer">
-            <p>This is an automated message from the Virtual Coffee Platform.</p>
-            <p>If you wish to pause your participation, please <a href="{{preferences_url}}" class="preferences-link">update your preferences</a>.</p>
-            <p>Deployment: {{deployment_id}}</p>
-        </div>
-    </div>
-</body>
-</html>
+    <a href="{{platform_url}}" class="button">View Match in Platform</a>
+{% endblock %}
 """
 
 # Weekly summary template
 WEEKLY_SUMMARY_TEMPLATE = """
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Virtual Coffee Weekly Summary</title>
-    <style>
-        body {
-            font-family: 'Amazon Ember', Arial, sans-serif;
-            line-height: 1.6;
-            color: #16191f;
-            margin: 0;
-            padding: 0;
-            background-color: #f8f8f8;
-        }
-        .container {
-            max-width: 600px;
-            margin: 0 auto;
-            background-color: #ffffff;
-            border: 1px solid #eaeded;
-            border-radius: 4px;
-            overflow: hidden;
-        }
-        .header {
-            background-color: #232f3e;
-            padding: 20px;
-            text-align: center;
-        }
-        .header h1 {
-            color: #ffffff;
-            margin: 0;
-            font-size: 24px;
-            font-weight: 500;
-        }
-        .content {
-            padding: 30px;
-        }
-        .stats {
-            background-color: #f2f3f3;
-            border-radius: 4px;
-            padding: 20px;
-            margin: 20px 0;
-        }
-        .stat-item {
-            margin-bottom: 10px;
-        }
-        .button {
-            display: inline-block;
-            background-color: #ff9900;
-            color: #ffffff;
-            text-decoration: none;
-            padding: 10px 20px;
-            border-radius: 4px;
-            margin-top: 20px;
-        }
-        .footer {
-            background-color: #f2f3f3;
-            padding: 20px;
-            text-align: center;
-            font-size: 12px;
-            color: #687078;
-        }
-        .preferences-link {
-            color: #0073bb;
-            text-decoration: none;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Virtual Coffee Weekly Summary</h1>
-        </div>
-        <div class="content">
-            <p>Hello {{user_name}},</p>
-            <p>Here's your weekly summary of virtual coffee activity:</p>
+{% extends "base.html" %}
+{% block title %}Virtual Coffee Weekly Summary{% endblock %}
+{% block content %}
+    <p>Hello {{user_name}},</p>
+    <p>Here's your weekly summary of virtual coffee activity:</p>
 
-            <div class="stats">
-                <h2>This Week's Stats</h2>
-                <div class="stat-item"><strong>Matches Created:</strong> {{matches_count}}</div>
-                <div class="stat-item"><strong>Active Participants:</strong> {{active_participants}}</div>
-                <div class="stat-item"><strong>Your Status:</strong> {{user_status}}</div>
-            </div>
+    <div class="stats">
+        <h2>This Week's Stats</h2>
+        <div class="stat-item"><strong>Matches Created:</strong> {{matches_count}}</div>
+        <div class="stat-item"><strong>Active Participants:</strong> {{active_participants}}</div>
+        <div class="stat-item"><strong>Your Status:</strong> {{user_status}}</div>
+    </div>
 
-            <p>{{custom_message}}</p>
+    <p>{{custom_message}}</p>
 
-            <a href="{{platform_url}}" class="button">Visit Platform</a>
-        </div>
-        <div class="footer">
-            <p>This is an automated message from the Virtual Coffee Platform.</p>
-            <p>If you wish to pause your participation, please <a href="{{preferences_url}}" class="preferences-link">update your preferences</a>.</p>
-            <p>Deployment: {{deployment_id}}</p>
-        </div>
-    </div>
-</body>
-</html>
+    <a href="{{platform_url}}" class="button">Visit Platform</a>
+{% endblock %}
 """
 
 
-def get_template(template_name):
+# The templates are sent with every email, so strip them down once at import
+_BASE_TEMPLATE = _minify(_BASE_TEMPLATE)
+MATCH_NOTIFICATION_TEMPLATE = _minify(MATCH_NOTIFICATION_TEMPLATE)
+MATCH_REMINDER_TEMPLATE = _minify(MATCH_REMINDER_TEMPLATE)
+WEEKLY_SUMMARY_TEMPLATE = _minify(WEEKLY_SUMMARY_TEMPLATE)
+
+# Names of the email templates (the other sources are only included by them)
+_EMAIL_TEMPLATES = ("match_notification", "match_reminder", "weekly_summary")
+
+# Template sources keyed by name (read-only, built once at import)
+_TEMPLATES = MappingProxyType(
+    {
+        "match_notification": MATCH_NOTIFICATION_TEMPLATE,
+        "match_reminder": MATCH_REMINDER_TEMPLATE,
+        "weekly_summary": WEEKLY_SUMMARY_TEMPLATE,
+        "base.html": _BASE_TEMPLATE,
+        "email_static.css": _minify_css(_STYLESHEET_PATH.read_text()),
+    },
+)
+
+# The templates never change at runtime, so each one is compiled once and
+# served from the environment's cache afterwards. Autoescaping stays off
+# because participants_html is an HTML fragment.
+_ENV = Environment(loader=DictLoader(_TEMPLATES), auto_reload=False)
+
+# Compile every template at import so no send pays the parse/codegen cost
+_COMPILED = MappingProxyType({name: _ENV.get_template(name) for name in _TEMPLATES})
+
+
+def get_template(template_name: str) -> Template | None:
     """
-    Get an email template by name.
+    Get a compiled email template by name.
 
     Args:
         template_name: The name of the template to retrieve
 
     Returns:
-        The template string or None if not found
+        The compiled template or None if not found
     """
-    templates = {
-        "match_notification": MATCH_NOTIFICATION_TEMPLATE,
-        "match_reminder": MATCH_REMINDER_TEMPLATE,
-        "weekly_summary": WEEKLY_SUMMARY_TEMPLATE,
+    return _COMPILED.get(template_name)
+
+
+def _template_variables(template_name: str) -> set[str]:
+    """
+    Get the variables used by a template and the templates it builds on.
+
+    Args:
+        template_name: The name of the template
+
+    Returns:
+        The names of the variables
+    """
+    ast = _ENV.parse(_TEMPLATES[template_name])
+    variables = meta.find_undeclared_variables(ast)
+    for referenced in meta.find_referenced_templates(ast):
+        variables |= _template_variables(referenced)
+    return variables
+
+
+# Classes used by the HTML fragments that fill a template variable
+_SLOT_CLASSES = {"participants_html": frozenset({"participant"})}
+
+_STYLE_BLOCK_RE = re.compile(r"<style>(.*?)</style>", re.DOTALL)
+_CLASS_ATTR_RE = re.compile(r'class="([^"]*)"')
+_CSS_RULE_RE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_SELECTOR_CLASS_RE = re.compile(r"\.([\w-]+)")
+
+
+def _strip_unused_css(css: str, used_classes: set[str]) -> str:
+    """
+    Drop the selectors of a minified stylesheet that need unused classes.
+
+    Args:
+        css: The minified stylesheet
+        used_classes: The classes present in the email
+
+    Returns:
+        The stylesheet without rules that cannot match
+    """
+    rules = []
+    for selectors, declarations in _CSS_RULE_RE.findall(css):
+        kept = [
+            selector
+            for selector in selectors.split(",")
+            if used_classes.issuperset(_SELECTOR_CLASS_RE.findall(selector))
+        ]
+        if kept:
+            rules.append(f"{','.join(kept)}{{{declarations}}}")
+    return "".join(rules)
+
+
+def _placeholder_source(
+    template_name: str,
+    raw_variables: frozenset[str] = frozenset(),
+) -> str:
+    """
+    Render a template with "{{name}}" placeholders left in for its variables.
+
+    Includes are expanded, so the result is the full email with only the
+    per-send values missing. Stylesheet rules the email cannot use are
+    dropped.
+
+    Args:
+        template_name: The name of the template
+        raw_variables: Variables to leave as "{{{name}}}" instead
+
+    Returns:
+        The expanded template source
+    """
+    variables = _template_variables(template_name)
+    placeholders = {
+        name: ("{{{%s}}}" if name in raw_variables else "{{%s}}") % name
+        for name in variables
     }
+    html = _COMPILED[template_name].render(placeholders)
+
+    used_classes = set()
+    for classes in _CLASS_ATTR_RE.findall(html):
+        used_classes.update(classes.split())
+    for name in variables:
+        used_classes |= _SLOT_CLASSES.get(name, frozenset())
+
+    return _STYLE_BLOCK_RE.sub(
+        lambda match: f"<style>{_strip_unused_css(match[1], used_classes)}</style>",
+        html,
+    )
 
-    return templates.get(template_name)
+
+# A variable slot in an expanded template
+_SLOT_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+def _split_slots(template_name: str) -> tuple[str, tuple[tuple[str, str], ...]]:
+    """
+    Parse an expanded template into its leading text and (slot, text) pairs.
+
+    Args:
+        template_name: The name of the template
+
+    Returns:
+        The text before the first slot, and each slot name paired with the
+        text that follows it
+    """
+    parts = _SLOT_RE.split(_placeholder_source(template_name))
+    return parts[0], tuple(zip(parts[1::2], parts[2::2], strict=True))
+
+
+# Each email template parsed once at import, so rendering only walks the
+# pre-parsed pairs and joins them
+_SEGMENTS = MappingProxyType({name: _split_slots(name) for name in _EMAIL_TEMPLATES})
+
+
+@lru_cache(maxsize=32)
+def _fill_segments(
+    template_name: str,
+    shared: tuple[tuple[str, object], ...],
+) -> tuple[str, tuple[tuple[str, str], ...]]:
+    """
+    Fill some of a template's slots, merging them into the literal text.
+
+    Args:
+        template_name: The name of the template
+        shared: The (slot, value) pairs to fill
+
+    Returns:
+        The template's segments, with only the unfilled slots left
+    """
+    values = dict(shared)
+    head, segments = _SEGMENTS[template_name]
+    filled = []
+    text = [head]
+    for slot, literal in segments:
+        if slot in values:
+            text += (str(values[slot]), literal)
+        else:
+            filled.append("".join(text))
+            filled.append(slot)
+            text = [literal]
+    filled.append("".join(text))
+    return filled[0], tuple(zip(filled[1::2], filled[2::2], strict=True))
+
+
+def render(template_name: str, shared: dict | None = None, **context) -> str:
+    """
+    Render an email template from its pre-parsed segments.
+
+    Values that are the same across many emails (such as a deployment's URLs)
+    can be passed as shared: the template is pre-filled with them once and
+    cached, so each email only substitutes the rest of the context.
+    Variables missing from both render as empty strings, as they do in Jinja2.
+
+    Args:
+        template_name: The name of the template to render
+        shared: Template variables common to many emails
+        **context: The template variables for this email
+
+    Returns:
+        The rendered email
+
+    Raises:
+        KeyError: If there is no email template with that name
+    """
+    if shared:
+        head, segments = _fill_segments(template_name, tuple(shared.items()))
+    else:
+        head, segments = _SEGMENTS[template_name]
+    return _join_segments(head, segments, context)
+
+
+def _join_segments(
+    head: str, segments: tuple[tuple[str, str], ...], context: dict
+) -> str:
+    """
+    Join a template's segments with the values of its slots.
+
+    Args:
+        head: The text before the first slot
+        segments: Each slot name paired with the text that follows it
+        context: The values of the slots
+
+    Returns:
+        The rendered text
+    """
+    value = context.get
+    parts = [head]
+    for slot, literal in segments:
+        parts += (str(value(slot, "")), literal)
+    return "".join(parts)
+
+
+def prefill(template_name: str, shared: dict) -> Callable[..., str]:
+    """
+    Pre-fill an email template with values that never change for a sender.
+
+    The template is looked up and filled once, so each email rendered with
+    the returned function only joins its own values into the template.
+
+    Args:
+        template_name: The name of the template to render
+        shared: Template variables common to every email of the sender
+
+    Returns:
+        A function rendering the template from the remaining variables,
+        given as keyword arguments
+
+    Raises:
+        KeyError: If there is no email template with that name
+    """
+    head, segments = _fill_segments(template_name, tuple(shared.items()))
+
+    def render_prefilled(**context) -> str:
+        return _join_segments(head, segments, context)
+
+    return render_prefilled
+
+
+@lru_cache(maxsize=32)
+def _encoded_segments(
+    template_name: str,
+    shared: tuple[tuple[str, object], ...],
+) -> tuple[bytes, tuple[tuple[str, bytes], ...]]:
+    """
+    Get a template's segments, optionally pre-filled, encoded as UTF-8.
+
+    Args:
+        template_name: The name of the template
+        shared: The (slot, value) pairs to fill
+
+    Returns:
+        The template's encoded segments, with only the unfilled slots left
+    """
+    head, segments = _fill_segments(template_name, shared)
+    return head.encode(), tuple((slot, literal.encode()) for slot, literal in segments)
+
+
+def render_bytes(template_name: str, shared: dict | None = None, **context) -> bytes:
+    """
+    Render an email template straight to UTF-8, for raw message transports.
+
+    The template text is encoded once and cached, so only the per-email
+    values are encoded on each call.
+
+    Args:
+        template_name: The name of the template to render
+        shared: Template variables common to many emails
+        **context: The template variables for this email
+
+    Returns:
+        The rendered email, encoded as UTF-8
+
+    Raises:
+        KeyError: If there is no email template with that name
+    """
+    head, segments = _encoded_segments(
+        template_name,
+        tuple(shared.items()) if shared else (),
+    )
+    value = context.get
+    parts = [head]
+    for slot, literal in segments:
+        parts += (str(value(slot, "")).encode(), literal)
+    return b"".join(parts)
+
+
+def _qp_encode(text: str) -> bytes:
+    """
+    Quoted-printable encode text as a splicable piece of a MIME body.
+
+    Each piece ends with a soft line break, so pieces encoded separately can
+    be concatenated without a line growing past the MIME line length limit.
+
+    Args:
+        text: The text to encode
+
+    Returns:
+        The encoded text, with CRLF soft line breaks
+    """
+    if not text:
+        return b""
+    encoded = binascii.b2a_qp(text.encode(), istext=True)
+    return encoded.replace(b"=\n", b"=\r\n") + b"=\r\n"
+
+
+@lru_cache(maxsize=32)
+def _qp_segments(
+    template_name: str,
+    shared: tuple[tuple[str, object], ...],
+) -> tuple[bytes, tuple[tuple[str, bytes], ...]]:
+    """
+    Get a template's segments, optionally pre-filled, quoted-printable encoded.
+
+    Args:
+        template_name: The name of the template
+        shared: The (slot, value) pairs to fill
+
+    Returns:
+        The template's encoded segments, with only the unfilled slots left
+    """
+    head, segments = _fill_segments(template_name, shared)
+    return _qp_encode(head), tuple(
+        (slot, _qp_encode(literal)) for slot, literal in segments
+    )
+
+
+def prefill_mime(template_name: str, shared: dict) -> Callable[..., bytes]:
+    """
+    Pre-fill an email template as a quoted-printable MIME body.
+
+    Unlike base64, quoted-printable text can be encoded in pieces and joined,
+    so the template text is encoded once and each email only encodes its own
+    values. The result is the body of a raw message whose part declares
+    ``Content-Transfer-Encoding: quoted-printable``.
+
+    Args:
+        template_name: The name of the template to render
+        shared: Template variables common to every email of the sender
+
+    Returns:
+        A function rendering the encoded body from the remaining variables,
+        given as keyword arguments
+
+    Raises:
+        KeyError: If there is no email template with that name
+    """
+    head, segments = _qp_segments(template_name, tuple(shared.items()))
+
+    def render_encoded(**context) -> bytes:
+        value = context.get
+        parts = [head]
+        for slot, literal in segments:
+            parts += (_qp_encode(str(value(slot, ""))), literal)
+        return b"".join(parts)
+
+    return render_encoded
+
+
+def render_bulk(template_name: str, contexts: list[dict]) -> list[str]:
+    """
+    Render one email template for many recipients.
+
+    The compiled template is looked up once and reused for every context.
+
+    Args:
+        template_name: The name of the template to render
+        contexts: The template variables for each email
+
+    Returns:
+        The rendered emails, in the same order as the contexts
+
+    Raises:
+        TemplateNotFound: If there is no template with that name
+    """
+    render = _ENV.get_template(template_name).render
+    return [render(context) for context in contexts]
+
+
+# Subject lines of the SES copies of the templates
+_SES_SUBJECTS = {
+    "match_notification": "Virtual Coffee Match - {{match_date}}",
+    "match_reminder": "Virtual Coffee Reminder - {{match_date}}",
+    "weekly_summary": "Virtual Coffee Weekly Summary",
+}
+
+# Variables holding HTML, which SES must insert without escaping
+_SES_RAW_VARIABLES = frozenset({"participants_html"})
+
+
+def ses_template_name(template_name: str) -> str:
+    """
+    Get the name of the SES copy of an email template.
+
+    Args:
+        template_name: The name of the template
+
+    Returns:
+        The SES template name
+    """
+    return f"virtual-coffee-{template_name}"
+
+
+def _ses_html(template_name: str) -> str:
+    """
+    Render a template with SES (Handlebars) placeholders for its variables.
+
+    Args:
+        template_name: The name of the template
+
+    Returns:
+        The HTML part of the SES template
+    """
+    return _placeholder_source(template_name, raw_variables=_SES_RAW_VARIABLES)
+
+
+def sync_templates_to_ses(ses_client) -> list[str]:
+    """
+    Create or update the SES copies of the email templates.
+
+    The templates in this module stay the source of truth: an SES template
+    is only written when it is missing or its content differs, so the sync
+    can run on every startup.
+
+    Args:
+        ses_client: The boto3 SES client
+
+    Returns:
+        The names of the SES templates that were created or updated
+
+    Raises:
+        ClientError: If SES rejects a request
+    """
+    synced = []
+
+    for template_name, subject in _SES_SUBJECTS.items():
+        template = {
+            "TemplateName": ses_template_name(template_name),
+            "SubjectPart": subject,
+            "HtmlPart": _ses_html(template_name),
+        }
+
+        try:
+            current = ses_client.get_template(
+                TemplateName=template["TemplateName"],
+            )["Template"]
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "TemplateDoesNotExist":
+                raise
+            ses_client.create_template(Template=template)
+        else:
+            if all(current.get(key) == value for key, value in template.items()):
+                continue
+            ses_client.update_template(Template=template)
+
+        synced.append(template["TemplateName"])
+
+    return synced
+
+
+# Markup for a single participant in a match email
+_PARTICIPANT_TMPL = (
+    '<div class="participant">'
+    "<strong>Name:</strong> %(name)s<br>"
+    '<strong>Email:</strong> <a href="mailto:%(email)s">%(email)s</a>'
+    "</div>"
+)
 
 
 def format_participants_html(participants):
     """
     Format a list of participants into HTML.
 
+    Every recipient of a match gets the same fragment for the same other
+    participants, so fragments are cached by the participants' identifying
+    fields.
+
     Args:
         participants: List of User objects
 
     Returns:
-        HTML string with participant information
-    """
-    html = ""
-    for participant in participants:
-        html += f"""
-        <div class="participant">
-            <strong>Name:</strong> {participant.name}<br>
-            <strong>Email:</strong> <a href="mailto:{participant.email}">{participant.email}</a>
-        </div>
-        """
-    return html
+        HTML with participant information, marked as safe markup
+    """
+    key = tuple((p.id, p.name, p.email) for p in participants)
+    return _format_participants_cached(key)
+
+
+@lru_cache(maxsize=1024)
+def _format_participants_cached(key: tuple[tuple[str, str, str], ...]) -> Markup:
+    """
+    Format participants, given as (id, name, email) tuples, into HTML.
+
+    Args:
+        key: The participants' identifying fields
+
+    Returns:
+        HTML with participant information, marked as safe markup
+    """
+    return Markup(
+        "".join([_participant_html(name, email) for _id, name, email in key]),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _participant_html(name: str, email: str) -> str:
+    """
+    Format a single participant into HTML.
+
+    A participant appears in the emails of everyone else in the match, and
+    in later matches, so each one is escaped and formatted only once.
+
+    Args:
+        name: The participant's name
+        email: The participant's email address
+
+    Returns:
+        HTML with the participant's information
+    """
+    return _PARTICIPANT_TMPL % {"name": escape(name), "email": escape(email)}
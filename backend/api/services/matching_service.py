@@ -8,17 +8,506 @@ and configurable meeting sizes.
 import logging
 import random
 from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 
+import numpy as np
+
 from backend.api.models.match import Match, MatchCreate
 from backend.api.models.user import User
 from backend.api.repositories.match_repository import MatchRepository
 from backend.api.repositories.user_repository import UserRepository
-from backend.api.services.config_service import ConfigService
+from backend.api.services.config_service import config_service
 
 logger = logging.getLogger(__name__)
 
+# Weights of the factors in a match score
+TOPIC_WEIGHT = 0.4
+LENGTH_WEIGHT = 0.2
+AVAIL_WEIGHT = 0.4
+
+# Maximum expected difference in meeting length (e.g., 15 vs 60 minutes)
+MAX_LENGTH_DIFF = 45
+
+# How much to penalize recent matches (lower = stronger penalty)
+HISTORY_PENALTY_FACTOR = 0.7
+
+# Minimum users required for a valid match
+MIN_GROUP_SIZE = 2
+
+# Noise added to scores to break ties, far below any real difference between scores
+TIE_BREAK_NOISE = 1e-9
+
+# Number of pairs checked at once when looking for the best available pair
+PAIR_SCAN_BLOCK = 1024
+
+# Pairings of up to this many users are improved after the greedy pass
+MAX_PAIR_IMPROVEMENT_USERS = 1000
+MAX_PAIR_IMPROVEMENT_PASSES = 10
+
+
+def _bitmask(values: list[str], bits: dict[str, int]) -> int:
+    """
+    Encode a set of values as an int bitmask.
+
+    Args:
+        values: The values (e.g. topics)
+        bits: The bit position of each value seen so far in the scoring run;
+            unseen values are given the next free position
+
+    Returns:
+        An int with the bit of each value set
+    """
+    mask = 0
+    for value in values:
+        mask |= 1 << bits.setdefault(value, len(bits))
+    return mask
+
+
+@dataclass(frozen=True, slots=True)
+class _PreferenceBits:
+    """A user's matching preferences, with topics and availability as bitmasks."""
+
+    topics: int
+    availability: int
+    meeting_length: int
+
+
+def _preference_bits(user: User, bits: dict[str, int]) -> _PreferenceBits:
+    """
+    Encode a user's preferences as bitmasks.
+
+    The bitmasks are built on each call, against the bit index of the users
+    being compared.
+
+    Args:
+        user: The user
+        bits: The bit position of each value, shared by the users compared
+
+    Returns:
+        The user's preference bitmasks
+    """
+    return _PreferenceBits(
+        topics=_bitmask(user.preferences.topics, bits),
+        availability=_bitmask(user.preferences.availability, bits),
+        meeting_length=user.preferences.meeting_length,
+    )
+
+
+def _score_preferences(prefs1: _PreferenceBits, prefs2: _PreferenceBits) -> float:
+    """
+    Calculate the compatibility score of two users' preferences.
+
+    Set sizes are popcounts of the bitmasks.
+
+    Args:
+        prefs1: First user's preferences
+        prefs2: Second user's preferences
+
+    Returns:
+        A score between 0 and 1, where higher is better
+    """
+    # Track scores and weights
+    weighted_score = 0.0
+    total_weight = 0.0
+
+    # Factor 1: Common topics (weighted at 40%)
+    if prefs1.topics and prefs2.topics:  # Only if both have topics
+        common_topics = (prefs1.topics & prefs2.topics).bit_count()
+        all_topics = (prefs1.topics | prefs2.topics).bit_count()
+
+        # Jaccard similarity: size of intersection / size of union
+        topic_score = common_topics / all_topics
+        weighted_score += topic_score * TOPIC_WEIGHT
+        total_weight += TOPIC_WEIGHT
+
+    # Factor 2: Meeting length preference compatibility (weighted at 20%)
+    if prefs1.meeting_length and prefs2.meeting_length:
+        # Calculate similarity based on how close the preferred lengths are
+        length_diff = abs(prefs1.meeting_length - prefs2.meeting_length)
+        length_score = 1 - min(length_diff / MAX_LENGTH_DIFF, 1.0)  # Cap at 1.0
+        weighted_score += length_score * LENGTH_WEIGHT
+        total_weight += LENGTH_WEIGHT
+
+    # Factor 3: Availability compatibility (weighted at 40%)
+    if prefs1.availability and prefs2.availability:
+        common_avail = (prefs1.availability & prefs2.availability).bit_count()
+        if common_avail:
+            # Calculate overlap coefficient: size of intersection / size of smaller set
+            # This rewards having at least one common slot, even if users have many slots
+            avail_score = common_avail / min(
+                prefs1.availability.bit_count(), prefs2.availability.bit_count()
+            )
+            weighted_score += avail_score * AVAIL_WEIGHT
+            total_weight += AVAIL_WEIGHT
+
+    # Return normalized score or 0.5 if no factors were considered
+    if total_weight > 0:
+        return weighted_score / total_weight
+    else:
+        # Default score when no preferences are available
+        return 0.5
+
+
+def _pair_key(user1_id: str, user2_id: str) -> tuple[str, str]:
+    """
+    Order two user IDs so that a pair has the same key either way round.
+
+    Args:
+        user1_id: First user ID
+        user2_id: Second user ID
+
+    Returns:
+        The two IDs, smallest first
+    """
+    return (user1_id, user2_id) if user1_id < user2_id else (user2_id, user1_id)
+
+
+def _history_graph(
+    matches: list[Match], lookback_days: int, now: datetime
+) -> dict[tuple[str, str], float]:
+    """
+    Sum the recency weights of every pair of users who met in the given matches.
+
+    Matches are grouped by size, so the participant pairs of all matches with
+    the same number of participants are expanded in one NumPy operation, and
+    repeated pairs are summed with a single bincount.
+
+    Args:
+        matches: Recent matches
+        lookback_days: Number of days the matches were looked up over
+        now: The current time, to calculate match ages from
+
+    Returns:
+        A dictionary mapping pairs of user IDs (keyed by _pair_key) to weights
+    """
+    if not matches:
+        return {}
+
+    # Recency weight of every match (1.0 for newest, decreasing for older),
+    # from match ages in whole days. Subtracting datetimes in Python is faster
+    # than converting them to datetime64.
+    ages = np.array([(now - match.created_at).days for match in matches])
+    recency_weights = 1.0 - ages / lookback_days
+
+    user_ids: dict[str, int] = {}
+    by_size: dict[int, tuple[list[list[int]], list[int]]] = defaultdict(
+        lambda: ([], [])
+    )
+    for position, match in enumerate(matches):
+        participants, positions = by_size[len(match.participants)]
+        participants.append(
+            [user_ids.setdefault(p, len(user_ids)) for p in match.participants]
+        )
+        positions.append(position)
+
+    sources, targets, pair_weights = [], [], []
+    for size, (participants, positions) in by_size.items():
+        indices = np.array(participants, dtype=np.int64)
+        first, second = np.triu_indices(size, k=1)
+        sources.append(indices[:, first].ravel())
+        targets.append(indices[:, second].ravel())
+        pair_weights.append(np.repeat(recency_weights[positions], len(first)))
+
+    # Sum the weights of repeated pairs, in whichever order the two users
+    # were listed
+    sources, targets = np.concatenate(sources), np.concatenate(targets)
+    pair_codes = np.minimum(sources, targets) * len(user_ids) + np.maximum(
+        sources, targets
+    )
+    codes, inverse = np.unique(pair_codes, return_inverse=True)
+    totals = np.bincount(inverse, weights=np.concatenate(pair_weights))
+
+    ids = list(user_ids)
+    history_graph: dict[tuple[str, str], float] = {}
+    for code, total in zip(codes.tolist(), totals.tolist(), strict=True):
+        source, target = divmod(code, len(user_ids))
+        if source != target:  # Don't add self-connections
+            history_graph[_pair_key(ids[source], ids[target])] = total
+
+    return history_graph
+
+
+def _history_entries(
+    users: list[User], history_graph: dict[tuple[str, str], float]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Look up the history weights of the pairs of users that have met.
+
+    Only pairs in the history graph are returned, in both directions, so the
+    penalty can be applied to them without building a users x users matrix.
+
+    Args:
+        users: The users, in matrix order
+        history_graph: Weighted graph of recent matches
+
+    Returns:
+        Row indices, column indices and history weights of the pairs
+    """
+    index = {user.id: i for i, user in enumerate(users)}
+    rows, cols, weights = [], [], []
+    for (user1_id, user2_id), weight in history_graph.items():
+        i = index.get(user1_id)
+        j = index.get(user2_id)
+        if i is not None and j is not None:
+            rows += [i, j]
+            cols += [j, i]
+            weights += [weight, weight]
+
+    return (
+        np.array(rows, dtype=np.int64),
+        np.array(cols, dtype=np.int64),
+        np.array(weights),
+    )
+
+
+def _incidence(value_lists: list[list[str]]) -> np.ndarray:
+    """
+    Build a users x values matrix marking which values each user has.
+
+    Args:
+        value_lists: Each user's values (e.g. topics)
+
+    Returns:
+        A float matrix with 1.0 where a user has a value, 0.0 otherwise
+    """
+    columns: dict[str, int] = {}
+    rows, cols = [], []
+    for row, values in enumerate(value_lists):
+        for value in values:
+            rows.append(row)
+            cols.append(columns.setdefault(value, len(columns)))
+
+    matrix = np.zeros((len(value_lists), len(columns)))
+    matrix[rows, cols] = 1.0
+    return matrix
+
+
+def _score_matrix(users: list[User]) -> np.ndarray:
+    """
+    Calculate the compatibility scores between all pairs of users at once.
+
+    Must give the same scores as MatchingService.calculate_match_score, the
+    single-pair reference implementation, computed with matrix operations over
+    the whole user list instead of per pair.
+
+    Args:
+        users: The users to score
+
+    Returns:
+        An n x n matrix where entry (i, j) is the score of users i and j
+    """
+    # Factor 1: Jaccard similarity of topics, when both users have topics
+    topics = _incidence([user.preferences.topics for user in users])
+    common_topics = topics @ topics.T
+    topic_counts = topics.sum(axis=1)
+    all_topics = topic_counts[:, None] + topic_counts[None, :] - common_topics
+    has_topics = (topic_counts[:, None] > 0) & (topic_counts[None, :] > 0)
+    topic_score = np.divide(
+        common_topics,
+        all_topics,
+        out=np.zeros_like(common_topics),
+        where=has_topics,
+    )
+
+    # Factor 2: closeness of meeting lengths, when both users have one
+    lengths = np.array(
+        [user.preferences.meeting_length or 0 for user in users],
+        dtype=float,
+    )
+    has_length = (lengths[:, None] > 0) & (lengths[None, :] > 0)
+    length_diff = np.abs(lengths[:, None] - lengths[None, :])
+    length_score = 1 - np.minimum(length_diff / MAX_LENGTH_DIFF, 1.0)
+
+    # Factor 3: overlap coefficient of availability, when any slot is shared
+    avail = _incidence([user.preferences.availability for user in users])
+    common_avail = avail @ avail.T
+    avail_counts = avail.sum(axis=1)
+    has_common_avail = common_avail > 0
+    avail_score = np.divide(
+        common_avail,
+        np.minimum(avail_counts[:, None], avail_counts[None, :]),
+        out=np.zeros_like(common_avail),
+        where=has_common_avail,
+    )
+
+    weighted_score = (
+        np.where(has_topics, topic_score * TOPIC_WEIGHT, 0.0)
+        + np.where(has_length, length_score * LENGTH_WEIGHT, 0.0)
+        + np.where(has_common_avail, avail_score * AVAIL_WEIGHT, 0.0)
+    )
+    total_weight = (
+        has_topics * TOPIC_WEIGHT
+        + has_length * LENGTH_WEIGHT
+        + has_common_avail * AVAIL_WEIGHT
+    )
+
+    # Default score when no preferences are available
+    return np.divide(
+        weighted_score,
+        total_weight,
+        out=np.full_like(weighted_score, 0.5),
+        where=total_weight > 0,
+    )
+
+
+def _final_scores(
+    users: list[User], history_graph: dict[tuple[str, str], float]
+) -> np.ndarray:
+    """
+    Calculate the scores of all pairs of users, penalized by their history.
+
+    Args:
+        users: The users to score
+        history_graph: Weighted graph of recent matches
+
+    Returns:
+        An n x n matrix where entry (i, j) is the final score of users i and j
+    """
+    # Calculate the compatibility scores of all pairs in one pass
+    final_scores = _score_matrix(users)
+
+    # Penalize pairs that have met recently, touching only those pairs
+    # Higher history weight = stronger penalty
+    if history_graph:
+        rows, cols, weights = _history_entries(users, history_graph)
+        final_scores[rows, cols] *= 1.0 - weights * HISTORY_PENALTY_FACTOR
+
+    # Add symmetric noise to ensure randomness when scores are equal
+    # (seeded from the random module, so random.seed() still applies)
+    rng = np.random.default_rng(random.getrandbits(64))
+    noise = rng.random(final_scores.shape)
+    final_scores += (noise + noise.T) * (TIE_BREAK_NOISE / 2)
+
+    return final_scores
+
+
+@dataclass(slots=True)
+class _PairQueue:
+    """All pairs of users ordered best-first, as parallel index arrays."""
+
+    first: np.ndarray
+    second: np.ndarray
+    # Pairs before this position have been popped or skipped
+    position: int = 0
+
+
+def _pair_queue(scores: np.ndarray) -> _PairQueue:
+    """
+    Order all pairs of users best-first.
+
+    Pairs with an already matched user are skipped as they are popped.
+
+    Args:
+        scores: Symmetric matrix of pair scores
+
+    Returns:
+        The pairs, best-first (ties in row order)
+    """
+    # Avoid duplicates and self-pairs
+    first, second = np.triu_indices(len(scores), k=1)
+    order = np.argsort(-scores[first, second], kind="stable")
+    return _PairQueue(
+        first=first[order].astype(np.int32),
+        second=second[order].astype(np.int32),
+    )
+
+
+def _pop_best_pair(
+    pair_queue: _PairQueue, available: bytearray
+) -> Optional[tuple[int, int]]:
+    """
+    Pop the best-scoring pair of users that are both still unmatched.
+
+    Pairs are checked a block at a time, so runs of pairs with a matched user
+    are skipped without a Python loop over them.
+
+    Args:
+        pair_queue: The pairs still to pop, best-first
+        available: Flag per user index, nonzero while the user is unmatched
+
+    Returns:
+        The indices of the best available pair, or None if no pair is left
+    """
+    is_available = np.frombuffer(available, dtype=bool)
+    while pair_queue.position < len(pair_queue.first):
+        start = pair_queue.position
+        end = start + PAIR_SCAN_BLOCK
+        both_available = (
+            is_available[pair_queue.first[start:end]]
+            & is_available[pair_queue.second[start:end]]
+        )
+        if both_available.any():
+            best = start + int(np.argmax(both_available))
+            pair_queue.position = best + 1
+            return int(pair_queue.first[best]), int(pair_queue.second[best])
+        pair_queue.position = end
+    return None
+
+
+def _pick_next(
+    group_sums: np.ndarray, group_size: int, available: bytearray
+) -> tuple[int, float]:
+    """
+    Find the available user with the best average score against a group.
+
+    Args:
+        group_sums: Each user's summed score with the current group members
+        group_size: Number of users in the group
+        available: Flag per user index, nonzero while the user is unmatched
+
+    Returns:
+        The index of the best user and their average score (ties go to the
+        lowest index)
+    """
+    masked = np.where(np.frombuffer(available, dtype=bool), group_sums, -np.inf)
+    best = int(np.argmax(masked))
+    return best, float(masked[best]) / group_size
+
+
+def _improve_pairs(
+    pairs: list[tuple[int, int]],
+    scores: np.ndarray,
+) -> list[tuple[int, int]]:
+    """
+    Improve a pairing by swapping partners between pairs (2-opt).
+
+    Greedy pairing can lock in a pair that blocks two better ones. This
+    repeatedly looks at every two pairs and re-pairs their four users when
+    that raises the total score, until no swap helps or the pass limit is
+    reached.
+
+    Args:
+        pairs: The pairs, as indices into the score matrix
+        scores: Symmetric matrix of pair scores
+
+    Returns:
+        The improved pairs
+    """
+    pairs = list(pairs)
+    score = scores.tolist()
+
+    for _ in range(MAX_PAIR_IMPROVEMENT_PASSES):
+        improved = False
+        for x in range(len(pairs)):
+            for y in range(x + 1, len(pairs)):
+                a, b = pairs[x]
+                c, d = pairs[y]
+                current = score[a][b] + score[c][d]
+                swap_ac = score[a][c] + score[b][d]
+                swap_ad = score[a][d] + score[b][c]
+                if swap_ac > current + 1e-9 and swap_ac >= swap_ad:
+                    pairs[x], pairs[y] = (a, c), (b, d)
+                    improved = True
+                elif swap_ad > current + 1e-9:
+                    pairs[x], pairs[y] = (a, d), (b, c)
+                    improved = True
+        if not improved:
+            break
+
+    return pairs
+
 
 class MatchingService:
     """
@@ -41,7 +530,7 @@ class MatchingService:
         self.deployment_id = deployment_id
         self.user_repository = UserRepository(deployment_id)
         self.match_repository = MatchRepository(deployment_id)
-        self.config_service = ConfigService()
+        self.config_service = config_service
 
     async def get_eligible_users(self) -> list[User]:
         """
@@ -50,11 +539,13 @@ class MatchingService:
         Returns:
             A list of users eligible for matching (active and not paused)
         """
+        # Matching only reads the users' preferences
         return await self.user_repository.get_all(
             {
                 "is_active": True,
                 "is_paused": False,
-            }
+            },
+            fields=["preferences"],
         )
 
     async def get_recent_matches(self, lookback_days: int = 30) -> list[Match]:
@@ -67,20 +558,13 @@ class MatchingService:
         Returns:
             A list of recent matches
         """
-        # Get all matches
-        all_matches = await self.match_repository.get_all()
-
-        # Filter to recent matches
+        # Let the database filter out older matches
         cutoff_date = datetime.utcnow() - timedelta(days=lookback_days)
-        recent_matches = [
-            match for match in all_matches if match.created_at >= cutoff_date
-        ]
-
-        return recent_matches
+        return await self.match_repository.get_all({"created_since": cutoff_date})
 
     async def build_history_graph(
         self, lookback_days: int = 30
-    ) -> dict[str, dict[str, float]]:
+    ) -> dict[tuple[str, str], float]:
         """
         Build a weighted history graph of recent matches between users.
 
@@ -88,45 +572,11 @@ class MatchingService:
             lookback_days: Number of days to look back for historical matches
 
         Returns:
-            A dictionary mapping user IDs to dictionaries of recently matched user IDs with weights
+            A dictionary mapping pairs of recently matched user IDs to weights
             Higher weights indicate more recent or frequent matches
         """
         recent_matches = await self.get_recent_matches(lookback_days)
-
-        # Sort matches by date (newest first)
-        sorted_matches = sorted(
-            recent_matches,
-            key=lambda m: m.created_at,
-            reverse=True,
-        )
-
-        # Build weighted graph of recent matches
-        history_graph: dict[str, dict[str, float]] = defaultdict(
-            lambda: defaultdict(float)
-        )
-
-        # Calculate the maximum age in days for normalization
-        now = datetime.utcnow()
-        max_age = lookback_days
-
-        for match in sorted_matches:
-            # Calculate match age in days
-            match_age = (now - match.created_at).days
-
-            # Calculate recency weight (1.0 for newest, decreasing for older)
-            # More recent matches get higher weights
-            recency_weight = 1.0 - (match_age / max_age)
-
-            # For each pair of participants in the match
-            participants = match.participants
-            for i, user_id in enumerate(participants):
-                # Add all other participants as connections with weights
-                for j, other_id in enumerate(participants):
-                    if i != j:  # Don't add self-connections
-                        # Add recency weight to existing weight (if any)
-                        history_graph[user_id][other_id] += recency_weight
-
-        return dict(history_graph)
+        return _history_graph(recent_matches, lookback_days, datetime.utcnow())
 
     def calculate_match_score(self, user1: User, user2: User) -> float:
         """
@@ -137,6 +587,10 @@ class MatchingService:
         2. Meeting length compatibility - How close their preferred meeting durations are
         3. Availability compatibility - How many time slots they have in common
 
+        This is the single-pair reference implementation: matching scores all
+        pairs at once with _score_matrix, which must give the same scores, so
+        changes to the scoring have to be made in both.
+
         Args:
             user1: First user
             user2: Second user
@@ -144,61 +598,12 @@ class MatchingService:
         Returns:
             A score between 0 and 1, where higher is better
         """
-        # Define weights for different factors
-        TOPIC_WEIGHT = 0.4
-        LENGTH_WEIGHT = 0.2
-        AVAIL_WEIGHT = 0.4
-
-        # Track scores and weights
-        weighted_score = 0.0
-        total_weight = 0.0
-
-        # Factor 1: Common topics (weighted at 40%)
-        user1_topics = set(user1.preferences.topics)
-        user2_topics = set(user2.preferences.topics)
-
-        if user1_topics and user2_topics:  # Only if both have topics
-            common_topics = user1_topics.intersection(user2_topics)
-            all_topics = user1_topics.union(user2_topics)
-
-            if all_topics:  # Avoid division by zero
-                # Jaccard similarity: size of intersection / size of union
-                topic_score = len(common_topics) / len(all_topics)
-                weighted_score += topic_score * TOPIC_WEIGHT
-                total_weight += TOPIC_WEIGHT
-
-        # Factor 2: Meeting length preference compatibility (weighted at 20%)
-        if user1.preferences.meeting_length and user2.preferences.meeting_length:
-            # Calculate similarity based on how close the preferred lengths are
-            length_diff = abs(
-                user1.preferences.meeting_length - user2.preferences.meeting_length
-            )
-            max_diff = 45  # Maximum expected difference (e.g., 15 vs 60 minutes)
-            length_score = 1 - min(length_diff / max_diff, 1.0)  # Cap at 1.0
-            weighted_score += length_score * LENGTH_WEIGHT
-            total_weight += LENGTH_WEIGHT
-
-        # Factor 3: Availability compatibility (weighted at 40%)
-        user1_avail = set(user1.preferences.availability)
-        user2_avail = set(user2.preferences.availability)
-
-        if user1_avail and user2_avail:  # Only if both have availability preferences
-            common_avail = user1_avail.intersection(user2_avail)
-            if common_avail:
-                # Calculate overlap coefficient: size of intersection / size of smaller set
-                # This rewards having at least one common slot, even if users have many slots
-                avail_score = len(common_avail) / min(
-                    len(user1_avail), len(user2_avail)
-                )
-                weighted_score += avail_score * AVAIL_WEIGHT
-                total_weight += AVAIL_WEIGHT
-
-        # Return normalized score or 0.5 if no factors were considered
-        if total_weight > 0:
-            return weighted_score / total_weight
-        else:
-            # Default score when no preferences are available
-            return 0.5
+        # Bit positions only need to agree between the two users, so the index
+        # is built per call, like the columns of _incidence
+        bits: dict[str, int] = {}
+        return _score_preferences(
+            _preference_bits(user1, bits), _preference_bits(user2, bits)
+        )
 
     async def create_matches(
         self, scheduled_date: Optional[datetime] = None
@@ -255,15 +660,16 @@ class MatchingService:
 
         # Log the results
         logger.info(f"Created {len(matches)} matches for {len(eligible_users)} users")
-        for i, match in enumerate(matches):
-            logger.debug(f"Match {i+1}: {len(match.participants)} participants")
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, match in enumerate(matches, start=1):
+                logger.debug("Match %d: %d participants", i, len(match.participants))
 
         return matches
 
     async def _create_optimal_matches(
         self,
         users: list[User],
-        history_graph: dict[str, dict[str, float]],
+        history_graph: dict[tuple[str, str], float],
         meeting_size: int,
         scheduled_date: datetime,
     ) -> list[Match]:
@@ -276,6 +682,9 @@ class MatchingService:
         3. Creating groups of users based on the configured meeting size
         4. Handling leftover users to ensure everyone is matched
 
+        Meeting size 2 is handed to _match_pairs, which does not need the
+        group building below.
+
         Args:
             users: List of eligible users
             history_graph: Weighted graph of recent matches
@@ -285,169 +694,164 @@ class MatchingService:
         Returns:
             A list of created matches
         """
-        # Constants for algorithm tuning
-        HISTORY_PENALTY_FACTOR = (
-            0.7
-        )  # How much to penalize recent matches (lower = stronger penalty)
-        MIN_GROUP_SIZE = 2  # Minimum users required for a valid match
-
-        # Create user lookup dictionary for quick access
-        user_dict = {user.id: user for user in users}
-
-        # Shuffle users to ensure randomness when scores are equal
-        shuffled_users = users.copy()
-        random.shuffle(shuffled_users)
-
-        # Calculate all possible pairs and their scores
-        pair_scores: dict[tuple[str, str], float] = {}
-        for i, user1 in enumerate(shuffled_users):
-            for j, user2 in enumerate(shuffled_users):
-                if i < j:  # Avoid duplicates and self-pairs
-                    # Calculate base compatibility score
-                    base_score = self.calculate_match_score(user1, user2)
-
-                    # Apply history penalty if these users have met recently
-                    history_weight = 0.0
-                    if (
-                        user1.id in history_graph
-                        and user2.id in history_graph[user1.id]
-                    ):
-                        history_weight = history_graph[user1.id][user2.id]
-                    elif (
-                        user2.id in history_graph
-                        and user1.id in history_graph[user2.id]
-                    ):
-                        history_weight = history_graph[user2.id][user1.id]
-
-                    # Calculate final score with history penalty
-                    # Higher history weight = stronger penalty
-                    final_score = base_score * (
-                        1.0 - (history_weight * HISTORY_PENALTY_FACTOR)
-                    )
-
-                    # Store the score
-                    pair_scores[(user1.id, user2.id)] = final_score
+        # Log the matching process
+        logger.info(
+            f"Creating matches for {len(users)} users with meeting size {meeting_size}"
+        )
+
+        if meeting_size == 2:
+            return await self._match_pairs(users, history_graph, scheduled_date)
+
+        final_scores = _final_scores(users, history_graph)
+        pair_queue = _pair_queue(final_scores)
 
         # Create matches based on meeting size
         created_matches = []
-        remaining_users = set(user.id for user in shuffled_users)
+        # Users are tracked by their index into users: 1 while they are still
+        # to be matched, 0 once they are in a group
+        available = bytearray(b"\x01" * len(users))
+        remaining_count = len(users)
+
+        while remaining_count >= MIN_GROUP_SIZE:
+            # For larger meeting sizes, use a greedy algorithm to build optimal groups
+            # Start with the two users who have the highest compatibility score
+            best_initial_pair = _pop_best_pair(pair_queue, available)
+
+            if not best_initial_pair:
+                # Fall back to the first available users if no pair is left
+                best_initial_pair = [
+                    i for i, is_available in enumerate(available) if is_available
+                ][:2]
+
+            # Initialize group with the best pair
+            current_group = list(best_initial_pair)
+            for i in current_group:
+                available[i] = 0
+            remaining_count -= len(current_group)
+
+            # Every user's summed score with the group, kept up to date as
+            # members join rather than recomputed per candidate
+            group_sums = final_scores[:, current_group].sum(axis=1)
+
+            # Add users until we reach the meeting size or run out of users
+            while len(current_group) < meeting_size and remaining_count:
+                # Find the best next user to add based on average compatibility with current group
+                best_next_user, best_avg_score = _pick_next(
+                    group_sums, len(current_group), available
+                )
 
-        # Log the matching process
-        logger.info(
-            f"Creating matches for {len(remaining_users)} users with meeting size {meeting_size}"
+                current_group.append(best_next_user)
+                group_sums += final_scores[:, best_next_user]
+                available[best_next_user] = 0
+                remaining_count -= 1
+                logger.debug(
+                    "Added user %s to group with avg score %.2f",
+                    users[best_next_user].id,
+                    best_avg_score,
+                )
+
+            # Create the match for the group
+            match = self._build_match(
+                [users[i].id for i in current_group], scheduled_date
+            )
+            created_matches.append(match)
+            logger.debug("Created group match with %d users", len(current_group))
+
+        return await self._store_matches(
+            created_matches,
+            [
+                user.id
+                for user, is_available in zip(users, available, strict=True)
+                if is_available
+            ],
+            scheduled_date,
+        )
+
+    async def _match_pairs(
+        self,
+        users: list[User],
+        history_graph: dict[tuple[str, str], float],
+        scheduled_date: datetime,
+    ) -> list[Match]:
+        """
+        Create matches of two users based on history and preferences.
+
+        Users are paired greedily by score, then partners are swapped between
+        pairs where that raises the total score.
+
+        Args:
+            users: List of eligible users
+            history_graph: Weighted graph of recent matches
+            scheduled_date: The scheduled date for the matches
+
+        Returns:
+            A list of created matches
+        """
+        final_scores = _final_scores(users, history_graph)
+        pair_queue = _pair_queue(final_scores)
+
+        # Users are tracked by their index into users: 1 while they are still
+        # to be matched, 0 once they are paired
+        available = bytearray(b"\x01" * len(users))
+        remaining_count = len(users)
+
+        pairs = []
+        while remaining_count >= MIN_GROUP_SIZE and (
+            best_pair := _pop_best_pair(pair_queue, available)
+        ):
+            pairs.append(best_pair)
+            for i in best_pair:
+                available[i] = 0
+            remaining_count -= len(best_pair)
+
+        # Then swap partners where that raises the total score
+        if len(users) <= MAX_PAIR_IMPROVEMENT_USERS:
+            pairs = _improve_pairs(pairs, final_scores)
+
+        created_matches = []
+        for i, j in pairs:
+            match = self._build_match([users[i].id, users[j].id], scheduled_date)
+            created_matches.append(match)
+
+            logger.debug(
+                "Created pair match: %s and %s with score %.2f",
+                users[i].id,
+                users[j].id,
+                final_scores[i, j],
+            )
+
+        return await self._store_matches(
+            created_matches,
+            [
+                user.id
+                for user, is_available in zip(users, available, strict=True)
+                if is_available
+            ],
+            scheduled_date,
         )
 
-        while len(remaining_users) >= MIN_GROUP_SIZE:
-            # For meeting size 2 (pairs), use pair scores directly
-            if meeting_size == 2:
-                # Find best available pair
-                best_pair = None
-                best_score = -1
-
-                for (user1_id, user2_id), score in pair_scores.items():
-                    if (
-                        user1_id in remaining_users
-                        and user2_id in remaining_users
-                        and score > best_score
-                    ):
-                        best_pair = (user1_id, user2_id)
-                        best_score = score
-
-                if best_pair:
-                    # Create match
-                    match = await self._create_match(
-                        [best_pair[0], best_pair[1]], scheduled_date
-                    )
-                    created_matches.append(match)
-
-                    # Remove users from remaining pool
-                    remaining_users.remove(best_pair[0])
-                    remaining_users.remove(best_pair[1])
-
-                    logger.debug(
-                        f"Created pair match: {best_pair[0]} and {best_pair[1]} with score {best_score:.2f}"
-                    )
-                else:
-                    # No valid pairs left
-                    break
-            else:
-                # For larger meeting sizes, use a greedy algorithm to build optimal groups
-                if not remaining_users:
-                    break
-
-                # Start with the two users who have the highest compatibility score
-                best_initial_pair = None
-                best_initial_score = -1
-
-                for (user1_id, user2_id), score in pair_scores.items():
-                    if (
-                        user1_id in remaining_users
-                        and user2_id in remaining_users
-                        and score > best_initial_score
-                    ):
-                        best_initial_pair = (user1_id, user2_id)
-                        best_initial_score = score
-
-                if not best_initial_pair:
-                    # Fall back to random selection if no good pair found
-                    user_list = list(remaining_users)
-                    if len(user_list) >= 2:
-                        best_initial_pair = (user_list[0], user_list[1])
-                    else:
-                        break
-
-                # Initialize group with the best pair
-                current_group = list(best_initial_pair)
-                for user_id in current_group:
-                    remaining_users.remove(user_id)
-
-                # Add users until we reach the meeting size or run out of users
-                while len(current_group) < meeting_size and remaining_users:
-                    best_next_user = None
-                    best_avg_score = -1
-
-                    # Find the best next user to add based on average compatibility with current group
-                    for user_id in remaining_users:
-                        # Calculate average score with all current group members
-                        total_score = 0
-                        valid_pairs = 0
-
-                        for group_member in current_group:
-                            pair = tuple(sorted([user_id, group_member]))
-                            if pair in pair_scores:
-                                score = pair_scores[pair]
-                                total_score += score
-                                valid_pairs += 1
-
-                        if valid_pairs > 0:
-                            avg_score = total_score / valid_pairs
-                            if avg_score > best_avg_score:
-                                best_next_user = user_id
-                                best_avg_score = avg_score
-
-                    if best_next_user:
-                        current_group.append(best_next_user)
-                        remaining_users.remove(best_next_user)
-                        logger.debug(
-                            f"Added user {best_next_user} to group with avg score {best_avg_score:.2f}"
-                        )
-                    else:
-                        break
-
-                # Create match if we have enough users
-                if len(current_group) >= MIN_GROUP_SIZE:
-                    match = await self._create_match(current_group, scheduled_date)
-                    created_matches.append(match)
-                    logger.debug(f"Created group match with {len(current_group)} users")
-                else:
-                    # Put users back in the pool if group is too small
-                    remaining_users.update(current_group)
+    async def _store_matches(
+        self,
+        created_matches: list[Match],
+        remaining_users: list[str],
+        scheduled_date: datetime,
+    ) -> list[Match]:
+        """
+        Place leftover users in a match, then store all matches.
+
+        Args:
+            created_matches: The matches built so far
+            remaining_users: IDs of the users not in any match yet
+            scheduled_date: The scheduled date for the matches
 
+        Returns:
+            The stored matches
+        """
         # Handle leftover users (if any)
         if remaining_users and len(remaining_users) >= MIN_GROUP_SIZE:
             # Create a match with the remaining users if there are at least MIN_GROUP_SIZE
             leftover_group = list(remaining_users)
-            match = await self._create_match(leftover_group, scheduled_date)
+            match = self._build_match(leftover_group, scheduled_date)
             created_matches.append(match)
             logger.info(f"Created leftover match with {len(leftover_group)} users")
         elif remaining_users:
@@ -469,10 +873,8 @@ class MatchingService:
                     created_matches[smallest_match_index].participants + leftover_users
                 )
 
-                # Create a new match with the updated participants
-                updated_match = await self._create_match(
-                    updated_participants, scheduled_date
-                )
+                # Build a new match with the updated participants
+                updated_match = self._build_match(updated_participants, scheduled_date)
 
                 # Replace the old match with the updated one
                 created_matches[smallest_match_index] = updated_match
@@ -480,20 +882,23 @@ class MatchingService:
                     f"Added {len(leftover_users)} leftover users to existing match"
                 )
 
-        return created_matches
+        # Store all matches in one batch, once the groups are final
+        if not created_matches:
+            return []
+        return await self.match_repository.bulk_create(created_matches)
 
-    async def _create_match(
+    def _build_match(
         self, participant_ids: list[str], scheduled_date: datetime
     ) -> Match:
         """
-        Create a match with the given participants.
+        Build a match with the given participants, without storing it.
 
         Args:
             participant_ids: List of participant user IDs
             scheduled_date: The scheduled date for the match
 
         Returns:
-            The created match
+            The new match
         """
         match_create = MatchCreate(
             participants=participant_ids,
@@ -506,4 +911,4 @@ class MatchingService:
             scheduled_date=match_create.scheduled_date,
         )
 
-        return await self.match_repository.create(match)
+        return match
@@ -4,23 +4,154 @@ Notification channel implementations for the Virtual Coffee Platform.
 This module provides interfaces and implementations for different notification channels
 such as email, Slack, Telegram, and Signal.
 """
+import asyncio
 import logging
 from abc import ABC, abstractmethod
+from functools import lru_cache
 
 import boto3
-import requests
-from botocore.exceptions import ClientError
+import httpx
+import orjson
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 
 from backend.api.models.match import Match
 from backend.api.models.user import User
-from backend.api.services.email_templates import format_participants_html, get_template
+from backend.api.services.email_templates import (
+    format_participants_html,
+    prefill_mime,
+    ses_template_name,
+    sync_templates_to_ses,
+)
 
 logger = logging.getLogger(__name__)
 
+# Most destinations SES accepts in one SendBulkTemplatedEmail call
+SES_BULK_MAX_DESTINATIONS = 50
+
+# SES send rate used when the account quota cannot be read (the sandbox rate)
+DEFAULT_SES_SEND_RATE = 1.0
+
+# SES error codes returned when the send rate is exceeded
+SES_THROTTLING_ERRORS = frozenset(
+    {"Throttling", "ThrottlingException", "TooManyRequestsException"}
+)
+
+# Retries of a throttled SES call, and their backoff in seconds
+SES_MAX_RETRIES = 5
+SES_RETRY_BASE_DELAY = 0.5
+SES_RETRY_MAX_DELAY = 30.0
+
+# Most notifications a channel sends at once
+MAX_CONCURRENT_SENDS = 32
+
+# Configuration of the shared SES client: enough pooled connections for the
+# sends running in worker threads. The SDK does not retry, since throttled
+# calls are already paced and retried by EmailChannel._call_ses; two retry
+# layers would multiply the requests sent to an account being throttled
+SES_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"mode": "standard", "max_attempts": 1},
+)
+
+# Timeout of a webhook or chat API request, in seconds
+HTTP_TIMEOUT = 10.0
+
+# Connection pool of each channel's HTTP client
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# Retries of a rate-limited (429) request, and the longest wait honored, in
+# seconds; longer waits fail the send so the user's next channel is tried
+HTTP_RATE_LIMIT_RETRIES = 2
+HTTP_MAX_RETRY_AFTER = 30.0
+
+
+@lru_cache(maxsize=1)
+def get_ses_client():
+    """
+    Get the SES client shared by all email senders.
+
+    Creating a boto3 client loads the service model and sets up a connection
+    pool, so one client is created per process and reused by every
+    deployment's channel.
+
+    Returns:
+        The boto3 SES client
+    """
+    return boto3.client("ses", config=SES_CLIENT_CONFIG)
+
+
+def _platform_url(deployment_id: str) -> str:
+    """
+    Get the base URL of a deployment's platform.
+
+    Args:
+        deployment_id: The deployment ID
+
+    Returns:
+        The platform URL (would be configured in a real implementation)
+    """
+    return f"https://virtual-coffee.example.com/{deployment_id}"
+
+
+def _meeting_length(user: User, default: int = 30) -> int:
+    """
+    Get a user's preferred meeting length.
+
+    Args:
+        user: The user
+        default: The length to use when the user has no preference
+
+    Returns:
+        The meeting length in minutes
+    """
+    preferences = user.preferences
+    return (
+        preferences.meeting_length
+        if preferences and preferences.meeting_length
+        else default
+    )
+
+
+class _RateLimiter:
+    """Spaces out calls so that at most a given number start per second."""
+
+    __slots__ = ("_interval", "_next_start")
+
+    def __init__(self, rate: float):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: The number of calls allowed per second
+        """
+        self._interval = 1.0 / rate
+        self._next_start = 0.0
+
+    async def wait(self, cost: int = 1) -> None:
+        """
+        Wait for the next free slot.
+
+        Slots are handed out in call order, so waiting callers do not need a
+        lock to stay within the rate.
+
+        Args:
+            cost: The number of calls to reserve (e.g. emails in a bulk send)
+        """
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_start)
+        self._next_start = start + cost * self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
 
 class NotificationChannel(ABC):
     """Abstract base class for notification channels."""
 
+    # Channels only hold a few config values; subclasses list theirs in
+    # __slots__ too, so instances have no __dict__
+    __slots__ = ()
+
     @abstractmethod
     async def send_notification(
         self, user: User, match: Match, other_participants: list[User]
@@ -49,10 +180,145 @@ class NotificationChannel(ABC):
             True if the channel is available, False otherwise
         """
 
+    async def send_many(
+        self,
+        jobs: list[tuple[User, Match, list[User]]],
+        max_concurrency: int = MAX_CONCURRENT_SENDS,
+    ) -> list[bool]:
+        """
+        Send notifications to many users concurrently.
+
+        Args:
+            jobs: The user to notify, the match and its other participants,
+                for each notification
+            max_concurrency: Most notifications in flight at once
+
+        Returns:
+            Whether each notification was sent, in the order of the jobs
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send(job: tuple[User, Match, list[User]]) -> bool:
+            async with semaphore:
+                return await self.send_notification(*job)
+
+        results = await asyncio.gather(*map(send, jobs), return_exceptions=True)
+        for (user, _, _), result in zip(jobs, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Error sending %s notification to %s",
+                    type(self).__name__,
+                    user.id,
+                    exc_info=result,
+                )
+        return [result is True for result in results]
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """
+    Read how long a rate-limited response asks the client to wait.
+
+    Args:
+        response: A 429 response
+
+    Returns:
+        The wait in seconds, or None if the response does not say
+    """
+    header = response.headers.get("Retry-After")
+    if header is not None:
+        try:
+            return float(header)
+        except ValueError:
+            return None
+    try:
+        return float(response.json()["parameters"]["retry_after"])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+class _HttpChannel(NotificationChannel):
+    """Base class for channels that send notifications over HTTP."""
+
+    __slots__ = ("_client", "_platform_url", "deployment_id")
+
+    def __init__(self, deployment_id: str):
+        """
+        Initialize the HTTP channel.
+
+        Args:
+            deployment_id: The deployment ID for multi-tenancy
+        """
+        self.deployment_id = deployment_id
+        self._platform_url = _platform_url(deployment_id)
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the channel's HTTP client, creating it on first use.
+
+        The client is shared by all sends of the channel, so concurrent sends
+        reuse its pooled connections.
+
+        Returns:
+            The HTTP client
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+        return self._client
+
+    async def _post(self, url: str, payload: bytes, headers: dict) -> httpx.Response:
+        """
+        POST a request body, waiting and retrying when rate limited.
+
+        On a 429 response the wait comes from the Retry-After header (Slack)
+        or the retry_after parameter of the JSON body (Telegram).
+
+        Args:
+            url: The URL to post to
+            payload: The encoded request body
+            headers: The request headers
+
+        Returns:
+            The last response
+        """
+        client = self._get_client()
+        for attempt in range(HTTP_RATE_LIMIT_RETRIES + 1):
+            response = await client.post(url, content=payload, headers=headers)
+            if response.status_code != 429 or attempt == HTTP_RATE_LIMIT_RETRIES:
+                return response
+
+            delay = _retry_after(response)
+            if delay is None or delay > HTTP_MAX_RETRY_AFTER:
+                return response
+            logger.warning(
+                "Rate limited by %s, retrying in %ss", response.url.host, delay
+            )
+            await asyncio.sleep(delay)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the channel's HTTP client, if it was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
 
 class EmailChannel(NotificationChannel):
     """Email notification channel using AWS SES."""
 
+    __slots__ = (
+        "_default_template_data",
+        "_limiter",
+        "_mime_headers",
+        "_platform_url",
+        "_preferences_url",
+        "_render_body",
+        "_template_synced",
+        "deployment_id",
+        "sender_email",
+        "ses_client",
+    )
+
     def __init__(self, deployment_id: str):
         """
         Initialize the email channel.
@@ -61,11 +327,98 @@ class EmailChannel(NotificationChannel):
             deployment_id: The deployment ID for multi-tenancy
         """
         self.deployment_id = deployment_id
-        self.ses_client = boto3.client("ses")
+        self.ses_client = get_ses_client()
         self.sender_email = (
             f"virtual-coffee-{deployment_id}@example.com"
         )  # Replace with actual domain
 
+        self._platform_url = _platform_url(deployment_id)
+        self._preferences_url = f"{self._platform_url}/preferences"
+        shared = {
+            "platform_url": self._platform_url,
+            "preferences_url": self._preferences_url,
+            "deployment_id": deployment_id,
+        }
+
+        # The match email with the deployment's values filled in and encoded
+        # once, so each send only encodes the recipient's values
+        self._render_body = prefill_mime("match_notification", shared)
+
+        # The headers every raw match email ends with
+        self._mime_headers = (
+            b"MIME-Version: 1.0\r\n"
+            b"Content-Type: text/html; charset=utf-8\r\n"
+            b"Content-Transfer-Encoding: quoted-printable\r\n\r\n"
+        )
+
+        # The same values, as the default data of bulk sends
+        self._default_template_data = orjson.dumps(shared).decode()
+        self._template_synced = False
+
+        # Created on the first send, from the account's SES quota
+        self._limiter: _RateLimiter | None = None
+
+    async def _get_limiter(self) -> _RateLimiter:
+        """
+        Get the rate limiter for SES sends, sized from the account quota.
+
+        The quota is read in a worker thread on the first send only; if it
+        cannot be read, DEFAULT_SES_SEND_RATE is used from then on.
+
+        Returns:
+            The rate limiter
+        """
+        if self._limiter is None:
+            try:
+                quota = await asyncio.to_thread(self.ses_client.get_send_quota)
+                rate = float(quota["MaxSendRate"])
+            except (ClientError, BotoCoreError) as e:
+                logger.warning(
+                    "Could not read the SES send quota, assuming %s/s: %s",
+                    DEFAULT_SES_SEND_RATE,
+                    e,
+                )
+                rate = DEFAULT_SES_SEND_RATE
+            # Concurrent first sends may all have read the quota; keep the
+            # limiter created first
+            if self._limiter is None:
+                self._limiter = _RateLimiter(rate)
+        return self._limiter
+
+    async def _call_ses(self, operation, cost: int = 1, **kwargs) -> dict:
+        """
+        Call an SES send operation within the send rate, retrying if throttled.
+
+        The call runs in a worker thread so it does not block the event loop.
+        Throttled calls are retried with capped exponential backoff.
+
+        Args:
+            operation: The SES client method to call
+            cost: The number of emails the call sends
+            **kwargs: The arguments of the call
+
+        Returns:
+            The SES response
+
+        Raises:
+            ClientError: If SES rejects the call, or still throttles it after
+                SES_MAX_RETRIES retries
+        """
+        limiter = await self._get_limiter()
+        for attempt in range(SES_MAX_RETRIES + 1):
+            await limiter.wait(cost)
+            try:
+                return await asyncio.to_thread(operation, **kwargs)
+            except ClientError as e:
+                if (
+                    e.response["Error"]["Code"] not in SES_THROTTLING_ERRORS
+                    or attempt == SES_MAX_RETRIES
+                ):
+                    raise
+                delay = min(SES_RETRY_BASE_DELAY * 2**attempt, SES_RETRY_MAX_DELAY)
+                logger.warning("SES throttled a send, retrying in %.1fs", delay)
+                await asyncio.sleep(delay)
+
     async def send_notification(
         self, user: User, match: Match, other_participants: list[User]
     ) -> bool:
@@ -83,73 +436,198 @@ class EmailChannel(NotificationChannel):
         try:
             # Check if user has an email
             if not user.email:
-                logger.error(f"User {user.id} has no email address")
-                return False
-
-            # Get email template
-            template = get_template("match_notification")
-            if not template:
-                logger.error("Match notification email template not found")
+                logger.error("User %s has no email address", user.id)
                 return False
 
             # Format participants HTML
             participants_html = format_participants_html(other_participants)
 
-            # Get meeting length preference (default to 30 minutes)
-            meeting_length = (
-                user.preferences.meeting_length
-                if user.preferences and user.preferences.meeting_length
-                else 30
-            )
-
-            # Base URL for the platform (would be configured in a real implementation)
-            platform_url = f"https://virtual-coffee.example.com/{self.deployment_id}"
-            preferences_url = f"{platform_url}/preferences"
-
-            # Replace template variables
-            email_body = template.replace("{{user_name}}", user.name)
-            email_body = email_body.replace("{{participants_html}}", participants_html)
-            email_body = email_body.replace("{{meeting_length}}", str(meeting_length))
-            email_body = email_body.replace("{{platform_url}}", platform_url)
-            email_body = email_body.replace("{{preferences_url}}", preferences_url)
-            email_body = email_body.replace("{{deployment_id}}", self.deployment_id)
+            meeting_length = _meeting_length(user)
 
             # Create email subject
             subject = (
                 f"Virtual Coffee Match - {match.scheduled_date.strftime('%B %d, %Y')}"
             )
 
+            # Splice the recipient's headers and values into the pre-encoded
+            # message
+            raw_message = b"".join(
+                (
+                    f"From: {self.sender_email}\r\n"
+                    f"To: {user.email}\r\n"
+                    f"Subject: {subject}\r\n".encode(),
+                    self._mime_headers,
+                    self._render_body(
+                        user_name=user.name,
+                        participants_html=participants_html,
+                        meeting_length=meeting_length,
+                    ),
+                )
+            )
+
             # Send email using AWS SES
-            response = self.ses_client.send_email(
+            response = await self._call_ses(
+                self.ses_client.send_raw_email,
                 Source=self.sender_email,
-                Destination={
-                    "ToAddresses": [user.email],
-                },
-                Message={
-                    "Subject": {
-                        "Data": subject,
-                    },
-                    "Body": {
-                        "Html": {
-                            "Data": email_body,
-                        },
-                    },
-                },
+                Destinations=[user.email],
+                RawMessage={"Data": raw_message},
             )
 
             logger.info(
-                f"Sent email notification to {user.email} (Message ID: {response['MessageId']})"
+                "Sent email notification to %s (Message ID: %s)",
+                user.email,
+                response["MessageId"],
             )
             return True
         except ClientError as e:
-            logger.error(
-                f"AWS SES error sending email to {user.email}: {e.response['Error']['Message']}"
+            logger.exception(
+                "AWS SES error sending email to %s: %s",
+                user.email,
+                e.response["Error"]["Message"],
             )
             return False
-        except Exception as e:
-            logger.exception(f"Error sending email to {user.email}: {e}")
+        except Exception:
+            logger.exception("Error sending email to %s", user.email)
             return False
 
+    async def ensure_template(self) -> None:
+        """
+        Make sure SES has an up-to-date copy of the match email template.
+
+        The templates are synced on the first bulk send of the channel only,
+        in a worker thread so the SES calls do not block the event loop.
+
+        Raises:
+            ClientError: If SES rejects a request
+        """
+        if not self._template_synced:
+            await asyncio.to_thread(sync_templates_to_ses, self.ses_client)
+            self._template_synced = True
+
+    async def send_bulk_notifications(
+        self, entries: list[tuple[User, Match, list[User]]]
+    ) -> list[bool]:
+        """
+        Send email notifications to many users with SES bulk templated sends.
+
+        SES renders the match template for each recipient, so one API call
+        covers up to SES_BULK_MAX_DESTINATIONS emails. Recipients whose bulk
+        send fails can be retried with send_notification.
+
+        Args:
+            entries: The user to notify, the match and its other participants,
+                for each email
+
+        Returns:
+            Whether each email was accepted by SES, in the order of the entries
+        """
+        results = [False] * len(entries)
+
+        destinations = []
+        positions = []
+        for position, (user, match, other_participants) in enumerate(entries):
+            if not user.email:
+                logger.error("User %s has no email address", user.id)
+                continue
+
+            meeting_length = _meeting_length(user)
+
+            destinations.append(
+                {
+                    "Destination": {"ToAddresses": [user.email]},
+                    "ReplacementTemplateData": orjson.dumps(
+                        {
+                            "user_name": user.name,
+                            "participants_html": str(
+                                format_participants_html(other_participants)
+                            ),
+                            "meeting_length": meeting_length,
+                            "match_date": match.scheduled_date.strftime("%B %d, %Y"),
+                        }
+                    ).decode(),
+                }
+            )
+            positions.append(position)
+
+        if not destinations:
+            return results
+
+        try:
+            await self.ensure_template()
+        except ClientError as e:
+            logger.exception(
+                "AWS SES error syncing email templates: %s",
+                e.response["Error"]["Message"],
+            )
+            return results
+
+        for start in range(0, len(destinations), SES_BULK_MAX_DESTINATIONS):
+            end = start + SES_BULK_MAX_DESTINATIONS
+            try:
+                response = await self._call_ses(
+                    self.ses_client.send_bulk_templated_email,
+                    cost=len(destinations[start:end]),
+                    Source=self.sender_email,
+                    Template=ses_template_name("match_notification"),
+                    DefaultTemplateData=self._default_template_data,
+                    Destinations=destinations[start:end],
+                )
+            except ClientError as e:
+                logger.exception(
+                    "AWS SES error sending %d bulk emails: %s",
+                    len(destinations[start:end]),
+                    e.response["Error"]["Message"],
+                )
+                continue
+
+            # SES reports a status per destination, in request order; any
+            # destination without a status is left to the single sends
+            for position, status in zip(
+                positions[start:end], response["Status"], strict=False
+            ):
+                if status["Status"] == "Success":
+                    results[position] = True
+                else:
+                    logger.error(
+                        "AWS SES rejected bulk email to %s: %s %s",
+                        entries[position][0].email,
+                        status["Status"],
+                        status.get("Error", ""),
+                    )
+
+        logger.info(
+            "Sent %d of %d bulk email notifications", sum(results), len(entries)
+        )
+        return results
+
+    async def send_many(
+        self,
+        jobs: list[tuple[User, Match, list[User]]],
+        max_concurrency: int = MAX_CONCURRENT_SENDS,
+    ) -> list[bool]:
+        """
+        Send email notifications to many users, in SES bulk sends.
+
+        Emails the bulk sends did not deliver are retried one by one.
+
+        Args:
+            jobs: The user to notify, the match and its other participants,
+                for each email
+            max_concurrency: Most single sends in flight at once
+
+        Returns:
+            Whether each email was sent, in the order of the jobs
+        """
+        results = await self.send_bulk_notifications(jobs)
+        failed = [position for position, sent in enumerate(results) if not sent]
+        if failed:
+            retried = await super().send_many(
+                [jobs[position] for position in failed], max_concurrency
+            )
+            for position, sent in zip(failed, retried, strict=True):
+                results[position] = sent
+        return results
+
     def is_available_for_user(self, user: User) -> bool:
         """
         Check if email notifications are available for the user.
@@ -164,15 +642,94 @@ class EmailChannel(NotificationChannel):
         if not user.email:
             return False
 
-        if not user.notification_prefs:
+        prefs = user.notification_prefs
+        if not prefs:
             return True  # Default to email if no preferences are set
 
-        return user.notification_prefs.email
-
-
-class SlackChannel(NotificationChannel):
+        return bool(prefs.email)
+
+
+@lru_cache(maxsize=4096)
+def _slack_participant_block(name: str, email: str) -> bytes:
+    """
+    Build the JSON-encoded Slack block describing a match participant.
+
+    A participant appears in the message of everyone else in the match, so
+    the block is built and encoded once and shared between messages.
+
+    Args:
+        name: The participant's name
+        email: The participant's email address
+
+    Returns:
+        The Slack section block, encoded as JSON
+    """
+    return orjson.dumps(
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"*Name:* {name}\n*Email:* {email}",
+            },
+        }
+    )
+
+
+@lru_cache(maxsize=4096)
+def _telegram_participant_md(name: str, email: str) -> str:
+    """
+    Format a match participant for a Telegram (Markdown) message.
+
+    Args:
+        name: The participant's name
+        email: The participant's email address
+
+    Returns:
+        The participant's lines of the message
+    """
+    return f"*Name:* {name}\n*Email:* {email}\n\n"
+
+
+@lru_cache(maxsize=4096)
+def _signal_participant_plain(name: str, email: str) -> str:
+    """
+    Format a match participant for a plain-text Signal message.
+
+    Args:
+        name: The participant's name
+        email: The participant's email address
+
+    Returns:
+        The participant's lines of the message
+    """
+    return f"Name: {name}\nEmail: {email}\n\n"
+
+
+# Block at the top of every Slack match message, before the greeting
+_SLACK_HEADER_BLOCK = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "Virtual Coffee Match",
+        "emoji": True,
+    },
+}
+
+# Block between the greeting and the participants
+_SLACK_DETAILS_BLOCK = {
+    "type": "section",
+    "text": {
+        "type": "mrkdwn",
+        "text": "*Your match details:*",
+    },
+}
+
+
+class SlackChannel(_HttpChannel):
     """Slack notification channel."""
 
+    __slots__ = ("_details_block", "_message_prefix", "_message_suffix")
+
     def __init__(self, deployment_id: str):
         """
         Initialize the Slack channel.
@@ -180,7 +737,32 @@ class SlackChannel(NotificationChannel):
         Args:
             deployment_id: The deployment ID for multi-tenancy
         """
-        self.deployment_id = deployment_id
+        super().__init__(deployment_id)
+
+        # The platform link is the same in every message of the deployment,
+        # so its block is built once
+        actions_block = {
+            "type": "actions",
+            "elements": [
+                {
+                    "type": "button",
+                    "text": {
+                        "type": "plain_text",
+                        "text": "View Match in Platform",
+                        "emoji": True,
+                    },
+                    "url": self._platform_url,
+                },
+            ],
+        }
+
+        # The fixed blocks are encoded once; each message only encodes its
+        # own blocks and joins them in between
+        self._message_prefix = (
+            b'{"blocks":[' + orjson.dumps(_SLACK_HEADER_BLOCK) + b","
+        )
+        self._details_block = b"," + orjson.dumps(_SLACK_DETAILS_BLOCK)
+        self._message_suffix = b"," + orjson.dumps(actions_block) + b"]}"
 
     async def send_notification(
         self, user: User, match: Match, other_participants: list[User]
@@ -199,103 +781,79 @@ class SlackChannel(NotificationChannel):
         try:
             # Check if user has a Slack webhook
             if not user.notification_prefs or not user.notification_prefs.slack_webhook:
-                logger.error(f"User {user.id} has no Slack webhook configured")
+                logger.error("User %s has no Slack webhook configured", user.id)
                 return False
 
-            # Create message text
-            message = {
-                "blocks": [
-                    {
-                        "type": "header",
-                        "text": {
-                            "type": "plain_text",
-                            "text": "Virtual Coffee Match",
-                            "emoji": True,
-                        },
-                    },
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": f"Hello {user.name},\n\nYou've been matched for a virtual coffee meeting!",
-                        },
-                    },
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": "*Your match details:*",
-                        },
-                    },
-                ],
-            }
-
-            # Add participant blocks
-            for participant in other_participants:
-                message["blocks"].append(
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": f"*Name:* {participant.name}\n*Email:* {participant.email}",
-                        },
-                    }
-                )
-
-            # Add meeting length recommendation
-            meeting_length = (
-                user.preferences.meeting_length
-                if user.preferences and user.preferences.meeting_length
-                else 30
-            )
-            message["blocks"].append(
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"We recommend scheduling a {meeting_length} minute meeting at a time that works for everyone.",
-                    },
-                }
-            )
-
-            # Add platform link
-            platform_url = f"https://virtual-coffee.example.com/{self.deployment_id}"
-            message["blocks"].append(
-                {
-                    "type": "actions",
-                    "elements": [
-                        {
-                            "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "View Match in Platform",
-                                "emoji": True,
-                            },
-                            "url": platform_url,
-                        },
-                    ],
-                }
-            )
+            # Format the message before any network I/O
+            payload = self._build_payload(user, other_participants)
 
             # Send message to Slack webhook
-            response = requests.post(
+            response = await self._post(
                 user.notification_prefs.slack_webhook,
-                json=message,
+                payload,
                 headers={"Content-Type": "application/json"},
             )
 
             if response.status_code == 200:
-                logger.info(f"Sent Slack notification to {user.name}")
+                logger.info("Sent Slack notification to %s", user.name)
                 return True
             else:
                 logger.error(
-                    f"Failed to send Slack notification: {response.status_code} {response.text}"
+                    "Failed to send Slack notification: %s %s",
+                    response.status_code,
+                    response.text,
                 )
                 return False
-        except Exception as e:
-            logger.exception(f"Error sending Slack notification to {user.name}: {e}")
+        except Exception:
+            logger.exception("Error sending Slack notification to %s", user.name)
             return False
 
+    def _build_payload(self, user: User, other_participants: list[User]) -> bytes:
+        """
+        Build the Slack webhook request body of a match notification.
+
+        Args:
+            user: The user to notify
+            other_participants: Other users in the match
+
+        Returns:
+            The JSON-encoded request body
+        """
+        meeting_length = _meeting_length(user)
+
+        # Only the greeting, participants and meeting length differ
+        # between messages
+        greeting_block = {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"Hello {user.name},\n\nYou've been matched for a virtual coffee meeting!",
+            },
+        }
+        meeting_length_block = {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"We recommend scheduling a {meeting_length} minute meeting at a time that works for everyone.",
+            },
+        }
+        parts = [
+            self._message_prefix,
+            orjson.dumps(greeting_block),
+            self._details_block,
+        ]
+        for participant in other_participants:
+            parts += (
+                b",",
+                _slack_participant_block(participant.name, participant.email),
+            )
+        parts += (
+            b",",
+            orjson.dumps(meeting_length_block),
+            self._message_suffix,
+        )
+        return b"".join(parts)
+
     def is_available_for_user(self, user: User) -> bool:
         """
         Check if Slack notifications are available for the user.
@@ -306,16 +864,15 @@ class SlackChannel(NotificationChannel):
         Returns:
             True if Slack notifications are available, False otherwise
         """
-        return (
-            user.notification_prefs
-            and user.notification_prefs.slack
-            and user.notification_prefs.slack_webhook
-        )
+        prefs = user.notification_prefs
+        return bool(prefs and prefs.slack and prefs.slack_webhook)
 
 
-class TelegramChannel(NotificationChannel):
+class TelegramChannel(_HttpChannel):
     """Telegram notification channel."""
 
+    __slots__ = ("api_url", "bot_token")
+
     def __init__(self, deployment_id: str, bot_token: str):
         """
         Initialize the Telegram channel.
@@ -324,7 +881,7 @@ class TelegramChannel(NotificationChannel):
             deployment_id: The deployment ID for multi-tenancy
             bot_token: The Telegram bot token
         """
-        self.deployment_id = deployment_id
+        super().__init__(deployment_id)
         self.bot_token = bot_token
         self.api_url = f"https://api.telegram.org/bot{bot_token}"
 
@@ -348,53 +905,74 @@ class TelegramChannel(NotificationChannel):
                 not user.notification_prefs
                 or not user.notification_prefs.telegram_chat_id
             ):
-                logger.error(f"User {user.id} has no Telegram chat ID configured")
+                logger.error("User %s has no Telegram chat ID configured", user.id)
                 return False
 
-            # Create message text
-            message_text = "*Virtual Coffee Match*\n\n"
-            message_text += f"Hello {user.name},\n\n"
-            message_text += "You've been matched for a virtual coffee meeting!\n\n"
-            message_text += "*Your match details:*\n"
-
-            for participant in other_participants:
-                message_text += f"*Name:* {participant.name}\n"
-                message_text += f"*Email:* {participant.email}\n\n"
-
-            # Add meeting length recommendation
-            meeting_length = (
-                user.preferences.meeting_length
-                if user.preferences and user.preferences.meeting_length
-                else 30
-            )
-            message_text += f"We recommend scheduling a {meeting_length} minute meeting at a time that works for everyone.\n\n"
-
-            # Add platform link
-            platform_url = f"https://virtual-coffee.example.com/{self.deployment_id}"
-            message_text += f"[View Match in Platform]({platform_url})"
+            # Format the message before any network I/O
+            payload = self._build_payload(user, other_participants)
 
             # Send message to Telegram
-            response = requests.post(
+            response = await self._post(
                 f"{self.api_url}/sendMessage",
-                json={
-                    "chat_id": user.notification_prefs.telegram_chat_id,
-                    "text": message_text,
-                    "parse_mode": "Markdown",
-                },
+                payload,
+                headers={"Content-Type": "application/json"},
             )
 
             if response.status_code == 200:
-                logger.info(f"Sent Telegram notification to {user.name}")
+                logger.info("Sent Telegram notification to %s", user.name)
                 return True
             else:
                 logger.error(
-                    f"Failed to send Telegram notification: {response.status_code} {response.text}"
+                    "Failed to send Telegram notification: %s %s",
+                    response.status_code,
+                    response.text,
                 )
                 return False
-        except Exception as e:
-            logger.exception(f"Error sending Telegram notification to {user.name}: {e}")
+        except Exception:
+            logger.exception("Error sending Telegram notification to %s", user.name)
             return False
 
+    def _build_payload(self, user: User, other_participants: list[User]) -> bytes:
+        """
+        Build the Telegram sendMessage request body of a match notification.
+
+        Args:
+            user: The user to notify
+            other_participants: Other users in the match
+
+        Returns:
+            The JSON-encoded request body
+        """
+        # Create message text
+        parts = [
+            "*Virtual Coffee Match*\n\n",
+            f"Hello {user.name},\n\n",
+            "You've been matched for a virtual coffee meeting!\n\n",
+            "*Your match details:*\n",
+        ]
+        parts += [
+            _telegram_participant_md(participant.name, participant.email)
+            for participant in other_participants
+        ]
+
+        # Add meeting length recommendation
+        meeting_length = _meeting_length(user)
+        parts.append(
+            f"We recommend scheduling a {meeting_length} minute meeting at a time that works for everyone.\n\n"
+        )
+
+        # Add platform link
+        parts.append(f"[View Match in Platform]({self._platform_url})")
+        message_text = "".join(parts)
+
+        return orjson.dumps(
+            {
+                "chat_id": user.notification_prefs.telegram_chat_id,
+                "text": message_text,
+                "parse_mode": "Markdown",
+            }
+        )
+
     def is_available_for_user(self, user: User) -> bool:
         """
         Check if Telegram notifications are available for the user.
@@ -405,16 +983,15 @@ class TelegramChannel(NotificationChannel):
         Returns:
             True if Telegram notifications are available, False otherwise
         """
-        return (
-            user.notification_prefs
-            and user.notification_prefs.telegram
-            and user.notification_prefs.telegram_chat_id
-        )
+        prefs = user.notification_prefs
+        return bool(prefs and prefs.telegram and prefs.telegram_chat_id)
 
 
-class SignalChannel(NotificationChannel):
+class SignalChannel(_HttpChannel):
     """Signal notification channel."""
 
+    __slots__ = ("api_key", "signal_service_url")
+
     def __init__(self, deployment_id: str, signal_service_url: str, api_key: str):
         """
         Initialize the Signal channel.
@@ -424,7 +1001,7 @@ class SignalChannel(NotificationChannel):
             signal_service_url: URL of the Signal API service
             api_key: API key for the Signal service
         """
-        self.deployment_id = deployment_id
+        super().__init__(deployment_id)
         self.signal_service_url = signal_service_url
         self.api_key = api_key
 
@@ -445,40 +1022,18 @@ class SignalChannel(NotificationChannel):
         try:
             # Check if user has a Signal number
             if not user.notification_prefs or not user.notification_prefs.signal_number:
-                logger.error(f"User {user.id} has no Signal number configured")
+                logger.error("User %s has no Signal number configured", user.id)
                 return False
 
-            # Create message text
-            message_text = "Virtual Coffee Match\n\n"
-            message_text += f"Hello {user.name},\n\n"
-            message_text += "You've been matched for a virtual coffee meeting!\n\n"
-            message_text += "Your match details:\n"
-
-            for participant in other_participants:
-                message_text += f"Name: {participant.name}\n"
-                message_text += f"Email: {participant.email}\n\n"
-
-            # Add meeting length recommendation
-            meeting_length = (
-                user.preferences.meeting_length
-                if user.preferences and user.preferences.meeting_length
-                else 30
-            )
-            message_text += f"We recommend scheduling a {meeting_length} minute meeting at a time that works for everyone.\n\n"
-
-            # Add platform link
-            platform_url = f"https://virtual-coffee.example.com/{self.deployment_id}"
-            message_text += f"View Match in Platform: {platform_url}"
+            # Format the message before any network I/O
+            payload = self._build_payload(user, other_participants)
 
             # Send message to Signal
             # Note: This is a placeholder implementation as Signal doesn't have an official API
             # In a real implementation, this would use a Signal API service or integration
-            response = requests.post(
+            response = await self._post(
                 f"{self.signal_service_url}/send",
-                json={
-                    "number": user.notification_prefs.signal_number,
-                    "message": message_text,
-                },
+                payload,
                 headers={
                     "Content-Type": "application/json",
                     "Authorization": f"Bearer {self.api_key}",
@@ -486,17 +1041,59 @@ class SignalChannel(NotificationChannel):
             )
 
             if response.status_code == 200:
-                logger.info(f"Sent Signal notification to {user.name}")
+                logger.info("Sent Signal notification to %s", user.name)
                 return True
             else:
                 logger.error(
-                    f"Failed to send Signal notification: {response.status_code} {response.text}"
+                    "Failed to send Signal notification: %s %s",
+                    response.status_code,
+                    response.text,
                 )
                 return False
-        except Exception as e:
-            logger.exception(f"Error sending Signal notification to {user.name}: {e}")
+        except Exception:
+            logger.exception("Error sending Signal notification to %s", user.name)
             return False
 
+    def _build_payload(self, user: User, other_participants: list[User]) -> bytes:
+        """
+        Build the Signal service request body of a match notification.
+
+        Args:
+            user: The user to notify
+            other_participants: Other users in the match
+
+        Returns:
+            The JSON-encoded request body
+        """
+        # Create message text
+        parts = [
+            "Virtual Coffee Match\n\n",
+            f"Hello {user.name},\n\n",
+            "You've been matched for a virtual coffee meeting!\n\n",
+            "Your match details:\n",
+        ]
+        parts += [
+            _signal_participant_plain(participant.name, participant.email)
+            for participant in other_participants
+        ]
+
+        # Add meeting length recommendation
+        meeting_length = _meeting_length(user)
+        parts.append(
+            f"We recommend scheduling a {meeting_length} minute meeting at a time that works for everyone.\n\n"
+        )
+
+        # Add platform link
+        parts.append(f"View Match in Platform: {self._platform_url}")
+        message_text = "".join(parts)
+
+        return orjson.dumps(
+            {
+                "number": user.notification_prefs.signal_number,
+                "message": message_text,
+            }
+        )
+
     def is_available_for_user(self, user: User) -> bool:
         """
         Check if Signal notifications are available for the user.
@@ -507,8 +1104,5 @@ class SignalChannel(NotificationChannel):
         Returns:
             True if Signal notifications are available, False otherwise
         """
-        return (
-            user.notification_prefs
-            and user.notification_prefs.signal
-            and user.notification_prefs.signal_number
-        )
+        prefs = user.notification_prefs
+        return bool(prefs and prefs.signal and prefs.signal_number)
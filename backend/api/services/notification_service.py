@@ -4,22 +4,37 @@ Notification service implementation for the Virtual Coffee Platform.
 This service handles sending notifications to users about their matches
 through various channels, with email as the primary channel for MVP.
 """
+import asyncio
 import logging
+from collections import defaultdict
 
-import boto3
-from botocore.exceptions import ClientError
+import httpx
+from botocore.exceptions import BotoCoreError, ClientError
 
 from backend.api.models.match import Match
 from backend.api.models.user import User
 from backend.api.repositories.match_repository import MatchRepository
 from backend.api.repositories.user_repository import UserRepository
-from backend.api.services.email_templates import format_participants_html, get_template
+from backend.api.services.notification_channels import MAX_CONCURRENT_SENDS
 
 logger = logging.getLogger(__name__)
 
 # Maximum number of retries for notification attempts
 MAX_RETRIES = 3
 
+# Delay before the first retry of failed notifications in seconds, doubled on
+# each further retry
+RETRY_BASE_DELAY = 1.0
+
+# Errors of the channels' transports (SES and HTTP), which may pass when retried;
+# any other error is a bug, and is logged instead of retried
+RETRYABLE_ERRORS = (
+    ClientError,
+    BotoCoreError,
+    httpx.HTTPError,
+    asyncio.TimeoutError,
+)
+
 
 class NotificationService:
     """
@@ -32,25 +47,19 @@ class NotificationService:
     4. Supporting multiple notification channels (Phase 2)
     """
 
-    def __init__(self, deployment_id: str):
+    def __init__(self, deployment_id: str, max_concurrency: int = MAX_CONCURRENT_SENDS):
         """
         Initialize the notification service.
 
         Args:
             deployment_id: The deployment ID for multi-tenancy
+            max_concurrency: Most notifications each channel sends at once
         """
         self.deployment_id = deployment_id
+        self.max_concurrency = max_concurrency
         self.user_repository = UserRepository(deployment_id)
         self.match_repository = MatchRepository(deployment_id)
 
-        # Initialize AWS SES client for email notifications
-        self.ses_client = boto3.client("ses")
-
-        # Email configuration
-        self.sender_email = (
-            f"virtual-coffee-{deployment_id}@example.com"
-        )  # Replace with actual domain
-
         # Initialize notification channels
         self.channels = self._initialize_notification_channels()
 
@@ -93,235 +102,350 @@ class NotificationService:
             "signal": signal_channel,
         }
 
-    async def send_match_notification(self, match: Match, retry_count: int = 0) -> bool:
+    async def aclose(self) -> None:
+        """Close the connections held by the notification channels."""
+        for channel in self.channels.values():
+            aclose = getattr(channel, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    async def send_match_notification(self, match: Match) -> bool:
         """
         Send notifications for a match to all participants.
 
+        Notifications that fail are retried, to the users already fetched.
+
         Args:
             match: The match to send notifications for
-            retry_count: Current retry attempt (for internal use)
 
         Returns:
             True if all notifications were sent successfully, False otherwise
         """
         try:
-            # Get all users in the match
+            # Get all users in the match in one batched read
+            users = await self.user_repository.batch_get(match.participants)
+        except Exception:
+            logger.exception("Error getting the users of match %s", match.id)
+            return False
+
+        found_ids = {user.id for user in users}
+        for user_id in match.participants:
+            if user_id not in found_ids:
+                logger.warning("User %s not found for match %s", user_id, match.id)
+
+        if not users:
+            logger.error("No valid users found for match %s", match.id)
+            return False
+
+        sent = await self._send_with_retries(self._match_jobs(users, match))
+        if not all(sent):
+            logger.error(
+                "Failed to send all notifications for match %s after %s retries",
+                match.id,
+                MAX_RETRIES,
+            )
+            return False
+
+        # Update match notification status once all notifications were sent
+        if not await self._mark_notified(match):
+            return False
+        logger.info("Successfully sent all notifications for match %s", match.id)
+        return True
+
+    async def _mark_notified(self, match: Match) -> bool:
+        """
+        Record that all the notifications of a match were sent.
+
+        Args:
+            match: The match whose notifications were sent
+
+        Returns:
+            True if the match was updated, False otherwise
+        """
+        try:
+            await self.match_repository.update(match.id, {"notification_sent": True})
+        except Exception:
+            logger.exception("Error marking match %s as notified", match.id)
+            return False
+        match.notification_sent = True
+        return True
+
+    async def send_match_notifications_bulk(self, matches: list[Match]) -> list[bool]:
+        """
+        Send notifications for many matches at once.
+
+        The participants of all the matches are fetched in one batched read,
+        and their notifications are sent together, so the email channel can
+        fill its SES bulk sends across matches. Failed notifications are
+        retried together too; matches that were still not fully notified are
+        left pending, to be sent again by a later run.
+
+        Args:
+            matches: The matches to send notifications for
+
+        Returns:
+            Whether all notifications were sent, for each match
+        """
+        participant_ids = list(
+            dict.fromkeys(
+                user_id for match in matches for user_id in match.participants
+            )
+        )
+        try:
+            users = await self.user_repository.batch_get(participant_ids)
+        except Exception:
+            logger.exception("Error getting the users of %d matches", len(matches))
+            return [False] * len(matches)
+        users_by_id = {user.id: user for user in users}
+
+        # The notifications of all the matches, with each match's slice of them
+        jobs = []
+        spans = []
+        for match in matches:
             users = []
             for user_id in match.participants:
-                user = await self.user_repository.get(user_id)
+                user = users_by_id.get(user_id)
                 if user:
                     users.append(user)
                 else:
-                    logger.warning(f"User {user_id} not found for match {match.id}")
-
-            if not users:
-                logger.error(f"No valid users found for match {match.id}")
-                return False
-
-            # Send notification to each user
-            success = True
-            for user in users:
-                # Get other participants to include in notification
-                other_participants = [u for u in users if u.id != user.id]
-
-                # Send notification based on user's preferences
-                user_success = await self._send_user_notification(
-                    user, match, other_participants
-                )
-                success = success and user_success
-
-            # Update match notification status if all notifications were sent
-            if success:
-                match.notification_sent = True
-                await self.match_repository.update(match)
-                logger.info(f"Successfully sent all notifications for match {match.id}")
-            else:
-                # Retry if not all notifications were successful
-                if retry_count < MAX_RETRIES:
-                    logger.info(
-                        f"Retrying notifications for match {match.id} (attempt {retry_count + 1}/{MAX_RETRIES})"
-                    )
-                    return await self.send_match_notification(match, retry_count + 1)
-                else:
-                    logger.error(
-                        f"Failed to send all notifications for match {match.id} after {MAX_RETRIES} attempts"
+                    logger.warning(
+                        "User %s not found for match %s", user_id, match.id
                     )
+            if not users:
+                logger.error("No valid users found for match %s", match.id)
+            start = len(jobs)
+            jobs += self._match_jobs(users, match)
+            spans.append((start, len(jobs)))
 
-            return success
-        except Exception as e:
-            logger.exception(f"Error sending notifications for match {match.id}: {e}")
+        sent = await self._send_with_retries(jobs)
 
-            # Retry on exception
-            if retry_count < MAX_RETRIES:
+        results = []
+        for match, (start, end) in zip(matches, spans, strict=True):
+            success = end > start and all(sent[start:end])
+            if success:
+                success = await self._mark_notified(match)
+            if success:
                 logger.info(
-                    f"Retrying notifications for match {match.id} (attempt {retry_count + 1}/{MAX_RETRIES})"
+                    "Successfully sent all notifications for match %s", match.id
                 )
-                return await self.send_match_notification(match, retry_count + 1)
-
-            return False
+            else:
+                logger.error(
+                    "Failed to send all notifications for match %s", match.id
+                )
+            results.append(success)
+        return results
 
-    async def _send_user_notification(
-        self, user: User, match: Match, other_participants: list[User]
-    ) -> bool:
+    def _channels_for_user(self, user: User) -> list[str]:
         """
-        Send a notification to a specific user about their match.
-
-        This method tries to send notifications through the user's preferred channels,
-        with fallback to email if other channels fail.
+        Get the names of the channels to notify a user through, in order.
 
         Args:
             user: The user to notify
+
+        Returns:
+            The user's primary channel first (if available), then their other
+            available channels
+        """
+        # Determine which channels to use based on user preferences
+        available_channels = []
+
+        # For MVP, we only use email
+        # For Phase 2, we check all available channels
+
+        # Check if user has notification preferences
+        if user.notification_prefs and hasattr(
+            user.notification_prefs, "primary_channel"
+        ):
+            primary_channel = user.notification_prefs.primary_channel
+
+            # Check each channel once
+            available_channels = [
+                channel_name
+                for channel_name, channel in self.channels.items()
+                if channel.is_available_for_user(user)
+            ]
+
+            # Move the primary channel first if available
+            if primary_channel in available_channels:
+                available_channels.remove(primary_channel)
+                available_channels.insert(0, primary_channel)
+        elif "email" in self.channels and user.email:
+            # Default to email for MVP
+            available_channels.append("email")
+
+        return available_channels
+
+    @staticmethod
+    def _match_jobs(
+        users: list[User], match: Match
+    ) -> list[tuple[User, Match, list[User]]]:
+        """
+        Get the notifications to send for a match.
+
+        Args:
+            users: The users in the match
             match: The match information
-            other_participants: Other users in the match
 
         Returns:
-            True if the notification was sent successfully through any channel, False otherwise
+            The user to notify, the match and its other participants, for
+            each user
         """
-        try:
-            # Determine which channels to use based on user preferences
-            available_channels = []
+        return [(user, match, [u for u in users if u.id != user.id]) for user in users]
 
-            # For MVP, we only use email
-            # For Phase 2, we check all available channels
+    async def _send_with_retries(
+        self, jobs: list[tuple[User, Match, list[User]]]
+    ) -> list[bool]:
+        """
+        Send notifications, retrying the ones that fail.
 
-            # Check if user has notification preferences
-            if user.notification_prefs and hasattr(
-                user.notification_prefs, "primary_channel"
-            ):
-                primary_channel = user.notification_prefs.primary_channel
-
-                # Add primary channel first if available
-                if primary_channel in self.channels and self.channels[
-                    primary_channel
-                ].is_available_for_user(user):
-                    available_channels.append(primary_channel)
-
-                # Add other enabled channels
-                for channel_name, channel in self.channels.items():
-                    if (
-                        channel_name != primary_channel
-                        and channel.is_available_for_user(user)
-                    ):
-                        available_channels.append(channel_name)
-            else:
-                # Default to email for MVP
-                if "email" in self.channels and user.email:
-                    available_channels.append("email")
-
-            # If no channels are available, log error and return
-            if not available_channels:
-                logger.error(f"No notification channels available for user {user.id}")
-                return False
-
-            # Try each channel in order until one succeeds
-            for channel_name in available_channels:
-                channel = self.channels[channel_name]
-                try:
-                    success = await channel.send_notification(
-                        user, match, other_participants
-                    )
-                    if success:
-                        logger.info(
-                            f"Successfully sent notification to {user.name} via {channel_name}"
-                        )
-                        return True
-                    else:
-                        logger.warning(
-                            f"Failed to send notification to {user.name} via {channel_name}, trying next channel"
-                        )
-                except Exception as e:
-                    logger.warning(
-                        f"Error sending notification via {channel_name}: {e}"
-                    )
-                    # Continue to next channel
+        Failed notifications are retried up to MAX_RETRIES times, waiting
+        RETRY_BASE_DELAY before the first retry and twice as long before each
+        further one. Each retry only resends the notifications still pending.
 
-            # If we get here, all channels failed
-            logger.error(
-                f"Failed to send notification to {user.name} through any channel"
-            )
-            return False
-        except Exception as e:
-            logger.exception(f"Error sending notification to user {user.id}: {e}")
-            return False
+        Args:
+            jobs: The user to notify, the match and its other participants,
+                for each notification
 
-    async def _send_email_notification(
-        self, user: User, match: Match, other_participants: list[User]
-    ) -> bool:
+        Returns:
+            Whether each notification was sent, in the order of the jobs
+        """
+        sent = [False] * len(jobs)
+
+        # The positions of the notifications not sent yet
+        pending = list(range(len(jobs)))
+        for attempt in range(MAX_RETRIES + 1):
+            if attempt:
+                logger.info(
+                    "Retrying %d notifications (attempt %d/%d)",
+                    len(pending),
+                    attempt,
+                    MAX_RETRIES,
+                )
+                await asyncio.sleep(RETRY_BASE_DELAY * 2 ** (attempt - 1))
+            try:
+                results = await self._send_notifications(
+                    [jobs[position] for position in pending]
+                )
+            except RETRYABLE_ERRORS as e:
+                logger.warning("Error sending notifications: %s", e)
+                continue
+            except Exception:
+                logger.exception("Unexpected error sending notifications")
+                break
+            for position, job_sent in zip(pending, results, strict=True):
+                sent[position] = job_sent
+            pending = [
+                position
+                for position, job_sent in zip(pending, results, strict=True)
+                if not job_sent
+            ]
+            if not pending:
+                break
+
+        return sent
+
+    async def _send_notifications(
+        self, jobs: list[tuple[User, Match, list[User]]]
+    ) -> list[bool]:
         """
-        Send an email notification to a user.
+        Send notifications to many users, each through their channels.
+
+        Users are notified in rounds: each round hands every channel all the
+        users whose next channel it is, so a channel sends its notifications
+        together (concurrently, or in bulk for email). Users whose
+        notification failed move on to their next channel in the next round.
 
         Args:
-            user: The user to notify
-            match: The match information
-            other_participants: Other users in the match
+            jobs: The user to notify, the match and its other participants,
+                for each notification
 
         Returns:
-            True if the email was sent successfully, False otherwise
+            Whether each user was notified through some channel, in the order
+            of the jobs
         """
-        try:
-            # Get email template from the email_templates module
-            template = get_template("match_notification")
-            if not template:
-                logger.error("Match notification email template not found")
-                return False
-
-            # Format participants HTML using the helper function
-            participants_html = format_participants_html(other_participants)
-
-            # Get meeting length preference (default to 30 minutes)
-            meeting_length = (
-                user.preferences.meeting_length
-                if user.preferences and user.preferences.meeting_length
-                else 30
-            )
-
-            # Base URL for the platform (would be configured in a real implementation)
-            platform_url = f"https://virtual-coffee.example.com/{self.deployment_id}"
-            preferences_url = f"{platform_url}/preferences"
-
-            # Replace template variables
-            email_body = template.replace("{{user_name}}", user.name)
-            email_body = email_body.replace("{{participants_html}}", participants_html)
-            email_body = email_body.replace("{{meeting_length}}", str(meeting_length))
-            email_body = email_body.replace("{{platform_url}}", platform_url)
-            email_body = email_body.replace("{{preferences_url}}", preferences_url)
-            email_body = email_body.replace("{{deployment_id}}", self.deployment_id)
-
-            # Create email subject
-            subject = (
-                f"Virtual Coffee Match - {match.scheduled_date.strftime('%B %d, %Y')}"
+        sent = [False] * len(jobs)
+
+        # The position of each job with the channels left to try
+        pending = []
+        for position, (user, _, _) in enumerate(jobs):
+            # A user whose channels cannot be resolved only fails their own
+            # notification
+            try:
+                channel_names = self._channels_for_user(user)
+            except Exception:
+                logger.exception(
+                    "Error resolving notification channels for user %s", user.id
+                )
+                continue
+            if not channel_names:
+                logger.error("No notification channels available for user %s", user.id)
+                continue
+            pending.append((position, channel_names))
+
+        while pending:
+            # Group the jobs by the next channel to try
+            by_channel = defaultdict(list)
+            for position, channel_names in pending:
+                if not channel_names:
+                    logger.error(
+                        "Failed to send notification to %s through any channel",
+                        jobs[position][0].name,
+                    )
+                    continue
+                by_channel[channel_names[0]].append((position, channel_names[1:]))
+
+            results = await asyncio.gather(
+                *(
+                    self.channels[channel_name].send_many(
+                        [jobs[position] for position, _ in entries],
+                        self.max_concurrency,
+                    )
+                    for channel_name, entries in by_channel.items()
+                ),
+                return_exceptions=True,
             )
 
-            # Send email using AWS SES
-            response = self.ses_client.send_email(
-                Source=self.sender_email,
-                Destination={
-                    "ToAddresses": [user.email],
-                },
-                Message={
-                    "Subject": {
-                        "Data": subject,
-                    },
-                    "Body": {
-                        "Html": {
-                            "Data": email_body,
-                        },
-                    },
-                },
-            )
+            pending = []
+            for (channel_name, entries), channel_result in zip(
+                by_channel.items(), results, strict=True
+            ):
+                if isinstance(channel_result, RETRYABLE_ERRORS):
+                    logger.warning(
+                        "Error sending notifications via %s: %s",
+                        channel_name,
+                        channel_result,
+                    )
+                elif isinstance(channel_result, Exception):
+                    logger.error(
+                        "Unexpected error sending notifications via %s",
+                        channel_name,
+                        exc_info=channel_result,
+                    )
+                channel_sent = (
+                    [False] * len(entries)
+                    if isinstance(channel_result, Exception)
+                    else channel_result
+                )
+                for entry, user_success in zip(entries, channel_sent, strict=True):
+                    position = entry[0]
+                    user = jobs[position][0]
+                    if user_success:
+                        logger.info(
+                            "Successfully sent notification to %s via %s",
+                            user.name,
+                            channel_name,
+                        )
+                        sent[position] = True
+                    else:
+                        logger.warning(
+                            "Failed to send notification to %s via %s, "
+                            "trying next channel",
+                            user.name,
+                            channel_name,
+                        )
+                        pending.append(entry)
 
-            logger.info(
-                f"Sent email notification to {user.email} (Message ID: {response['MessageId']})"
-            )
-            return True
-        except ClientError as e:
-            logger.error(
-                f"AWS SES error sending email to {user.email}: {e.response['Error']['Message']}"
-            )
-            return False
-        except Exception as e:
-            logger.exception(f"Error sending email to {user.email}: {e}")
-            return False
+        return sent
 
     async def send_reminder(self, match: Match) -> bool:
         """
@@ -335,5 +459,5 @@ class NotificationService:
         """
         # Similar implementation to send_match_notification but using the reminder template
         # For brevity, this is not fully implemented in this example
-        logger.info(f"Sending reminders for match {match.id}")
+        logger.info("Sending reminders for match %s", match.id)
         return True
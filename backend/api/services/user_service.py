@@ -2,6 +2,7 @@
 User service implementation for the Virtual Coffee Platform.
 """
 import logging
+from collections.abc import AsyncIterator
 from typing import Any, Optional
 
 from backend.api.models.user import User, UserCreate, UserUpdate
@@ -76,7 +77,10 @@ class UserService:
         return await self.repository.get_by_email(email)
 
     async def get_all_users(
-        self, active_only: bool = None, paused_only: bool = None
+        self,
+        active_only: Optional[bool] = None,
+        paused_only: Optional[bool] = None,
+        fields: Optional[list[str]] = None,
     ) -> list[User]:
         """
         Get all users, optionally filtered.
@@ -84,10 +88,52 @@ class UserService:
         Args:
             active_only: If True, only return active users
             paused_only: If True, only return paused users
+            fields: If given, only read these user fields from the database,
+                besides the ones every user needs
 
         Returns:
             A list of users
         """
+        filter_params = self._filter_params(active_only, paused_only)
+
+        return await self.repository.get_all(filter_params, fields)
+
+    def iter_users(
+        self,
+        active_only: Optional[bool] = None,
+        paused_only: Optional[bool] = None,
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[User]:
+        """
+        Iterate over all users, optionally filtered, one page at a time.
+
+        Args:
+            active_only: If True, only return active users
+            paused_only: If True, only return paused users
+            fields: If given, only read these user fields from the database,
+                besides the ones every user needs
+
+        Returns:
+            An async iterator of users
+        """
+        filter_params = self._filter_params(active_only, paused_only)
+
+        return self.repository.iter_all(filter_params, fields)
+
+    @staticmethod
+    def _filter_params(
+        active_only: Optional[bool] = None, paused_only: Optional[bool] = None
+    ) -> dict:
+        """
+        Build the repository filter for a user listing.
+
+        Args:
+            active_only: If not None, filter users on whether they are active
+            paused_only: If not None, filter users on whether they are paused
+
+        Returns:
+            The filter parameters
+        """
         filter_params = {}
 
         if active_only is not None:
@@ -96,7 +142,7 @@ class UserService:
         if paused_only is not None:
             filter_params["is_paused"] = paused_only
 
-        return await self.repository.get_all(filter_params)
+        return filter_params
 
     async def update_user(
         self, user_id: str, user_update: UserUpdate
@@ -111,10 +157,27 @@ class UserService:
         Returns:
             The updated user if found, None otherwise
         """
-        # Convert Pydantic model to dict
-        update_dict = user_update.dict(exclude_unset=True)
+        # Convert Pydantic model to dict (model_dump is the compiled path on
+        # Pydantic v2; .dict() is kept for v1)
+        if hasattr(user_update, "model_dump"):
+            update_dict = user_update.model_dump(exclude_unset=True)
+        else:
+            update_dict = user_update.dict(exclude_unset=True)
+
+        return await self.patch(user_id, **update_dict)
+
+    async def patch(self, user_id: str, **fields: Any) -> Optional[User]:
+        """
+        Update some of a user's fields in a single write.
+
+        Args:
+            user_id: The ID of the user to update
+            **fields: The fields to update, with their new values
 
-        return await self.repository.update(user_id, update_dict)
+        Returns:
+            The updated user if found, None otherwise
+        """
+        return await self.repository.update(user_id, fields)
 
     async def update_preferences(
         self, user_id: str, preferences: dict[str, Any]
@@ -129,9 +192,7 @@ class UserService:
         Returns:
             The updated user if found, None otherwise
         """
-        update_dict = {"preferences": preferences}
-
-        return await self.repository.update(user_id, update_dict)
+        return await self.patch(user_id, preferences=preferences)
 
     async def toggle_participation(
         self, user_id: str, is_paused: bool
@@ -146,9 +207,7 @@ class UserService:
         Returns:
             The updated user if found, None otherwise
         """
-        update_dict = {"is_paused": is_paused}
-
-        return await self.repository.update(user_id, update_dict)
+        return await self.patch(user_id, is_paused=is_paused)
 
     async def delete_user(self, user_id: str) -> bool:
         """
@@ -10,6 +10,7 @@ from backend.api.models.config import (
     ConfigCreate,
     ConfigUpdate,
     DeploymentConfig,
+    DeploymentConfigView,
     EmailTemplates,
 )
 from backend.api.services.config_service import ConfigService
@@ -129,6 +130,23 @@ async def test_get_all_configs(config_service, mock_config_repository, sample_co
     mock_config_repository.get_all.assert_called_once()
 
 
+@pytest.mark.asyncio()
+async def test_get_all_config_views(config_service, mock_config_repository):
+    """Test getting configuration views for scheduling sweeps."""
+    # Setup
+    view = DeploymentConfigView(deployment_id="test-deployment", schedule="0 9 * * 1")
+    mock_config_repository.get_all_views.return_value = [view]
+
+    # Execute
+    result = await config_service.get_all_config_views()
+
+    # Assert
+    assert result == [view]
+    assert result[0].parsed_cron.hours == frozenset({9})
+    mock_config_repository.get_all_views.assert_called_once()
+    mock_config_repository.get_all.assert_not_called()
+
+
 @pytest.mark.asyncio()
 async def test_update_config(config_service, mock_config_repository, sample_config):
     """Test updating a configuration."""
@@ -206,3 +224,28 @@ async def test_delete_config(config_service, mock_config_repository):
     # Assert
     assert result is True
     mock_config_repository.delete.assert_called_once_with("test-deployment")
+
+
+@pytest.mark.asyncio()
+async def test_get_config_cached(config_service, mock_config_repository, sample_config):
+    """Test that configuration reads are cached until the next write."""
+    # Setup
+    mock_config_repository.get.return_value = sample_config
+    mock_config_repository.update.return_value = sample_config
+
+    # Execute
+    await config_service.get_config("test-deployment")
+    result = await config_service.get_config("test-deployment")
+
+    # Assert
+    assert result == sample_config
+    mock_config_repository.get.assert_called_once_with("test-deployment")
+
+    # Callers get copies, so changing one leaves the cached configuration intact
+    result.admin_emails.append("intruder@example.com")
+    assert await config_service.get_config("test-deployment") == sample_config
+
+    # A write invalidates the cached configuration
+    await config_service.update_meeting_size("test-deployment", 3)
+    await config_service.get_config("test-deployment")
+    assert mock_config_repository.get.call_count == 2
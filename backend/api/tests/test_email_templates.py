@@ -0,0 +1,274 @@
+"""
+Tests for the email templates.
+"""
+import quopri
+import re
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+from jinja2 import TemplateNotFound
+from markupsafe import Markup
+
+from backend.api.models.user import User
+from backend.api.services.email_templates import (
+    _ENV,
+    _TEMPLATES,
+    format_participants_html,
+    get_template,
+    prefill,
+    prefill_mime,
+    render,
+    render_bulk,
+    render_bytes,
+    sync_templates_to_ses,
+)
+
+
+def test_get_template_is_compiled_once():
+    template = get_template("match_notification")
+    assert template is not None
+    assert get_template("match_notification") is template
+
+
+def test_get_template_unknown_name():
+    assert get_template("does_not_exist") is None
+
+
+def test_render_match_notification():
+    participants = [
+        User(
+            id="user-2",
+            email="other@example.com",
+            name="Other User",
+            deployment_id="test",
+        ),
+    ]
+    body = get_template("match_notification").render(
+        user_name="Test User",
+        participants_html=format_participants_html(participants),
+        meeting_length=30,
+        platform_url="https://virtual-coffee.example.com/test",
+        preferences_url="https://virtual-coffee.example.com/test/preferences",
+        deployment_id="test",
+    )
+    assert "Hello Test User," in body
+    assert 'href="mailto:other@example.com"' in body
+    assert "a 30 minute meeting" in body
+    assert "{{" not in body
+
+
+def test_template_sources_are_read_only():
+    with pytest.raises(TypeError):
+        _TEMPLATES["match_notification"] = "<p>Replaced</p>"
+
+
+def test_templates_compiled_at_import():
+    cached = {key[1] for key in _ENV.cache}
+    assert set(_TEMPLATES) <= cached
+
+
+def test_format_participants_html_escapes_fields():
+    participants = [
+        User(
+            id="user-3",
+            email="dev@example.com",
+            name="<b>Dev</b> & Ops",
+            deployment_id="test",
+        ),
+    ]
+    html = format_participants_html(participants)
+    assert isinstance(html, Markup)
+    assert "&lt;b&gt;Dev&lt;/b&gt; &amp; Ops" in html
+    assert html.count("dev@example.com") == 2
+
+
+def test_templates_are_minified():
+    for source in _TEMPLATES.values():
+        assert "\n" not in source
+        assert "> <" not in source
+
+
+def test_templates_inline_shared_stylesheet():
+    for name in ("match_notification", "match_reminder", "weekly_summary"):
+        body = get_template(name).render()
+        assert "<style>body{font-family:" in body
+        assert ".participant{" in body
+        assert "<link" not in body
+
+
+def test_format_participants_html_is_cached():
+    participants = [
+        User(
+            id="user-4",
+            email="cached@example.com",
+            name="Cached User",
+            deployment_id="test",
+        ),
+    ]
+    first = format_participants_html(participants)
+    assert format_participants_html(list(participants)) is first
+
+    participants[0].name = "Renamed User"
+    assert "Renamed User" in format_participants_html(participants)
+
+
+def test_render_bulk():
+    contexts = [
+        {"user_name": "Alice", "deployment_id": "test"},
+        {"user_name": "Bob", "deployment_id": "test"},
+    ]
+    alice, bob = render_bulk("match_reminder", contexts)
+    assert "Hello Alice," in alice
+    assert "Hello Bob," in bob
+
+    with pytest.raises(TemplateNotFound):
+        render_bulk("does_not_exist", contexts)
+
+
+def test_sync_templates_to_ses():
+    ses_client = MagicMock()
+    ses_client.get_template.side_effect = ClientError(
+        {"Error": {"Code": "TemplateDoesNotExist", "Message": "Not found"}},
+        "GetTemplate",
+    )
+
+    synced = sync_templates_to_ses(ses_client)
+
+    assert synced == [
+        "virtual-coffee-match_notification",
+        "virtual-coffee-match_reminder",
+        "virtual-coffee-weekly_summary",
+    ]
+    created = ses_client.create_template.call_args_list[0].kwargs["Template"]
+    assert "Hello {{user_name}}," in created["HtmlPart"]
+    assert "{{{participants_html}}}" in created["HtmlPart"]
+    assert "{% include" not in created["HtmlPart"]
+    ses_client.update_template.assert_not_called()
+
+    # Templates already matching the module are left alone, changed ones are
+    # updated
+    stored = {
+        c.kwargs["Template"]["TemplateName"]: dict(c.kwargs["Template"])
+        for c in ses_client.create_template.call_args_list
+    }
+    stored["virtual-coffee-weekly_summary"]["HtmlPart"] = "<p>Outdated</p>"
+    ses_client.reset_mock()
+    ses_client.get_template.side_effect = lambda **kwargs: {
+        "Template": stored[kwargs["TemplateName"]],
+    }
+
+    assert sync_templates_to_ses(ses_client) == ["virtual-coffee-weekly_summary"]
+    ses_client.create_template.assert_not_called()
+    ses_client.update_template.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "template_name",
+    ["match_notification", "match_reminder", "weekly_summary"],
+)
+def test_render_matches_jinja(template_name):
+    context = {
+        "user_name": "Test User",
+        "participants_html": "<div>Other User</div>",
+        "meeting_length": 45,
+        "platform_url": "https://virtual-coffee.example.com/test",
+        "preferences_url": "https://virtual-coffee.example.com/test/preferences",
+        "deployment_id": "test",
+        "matches_count": 3,
+    }
+    rendered = render(template_name, **context)
+    expected = get_template(template_name).render(context)
+
+    # Only the stylesheet may differ, by the rules the email cannot use
+    def without_style(html):
+        return re.sub(r"<style>.*?</style>", "", html)
+
+    assert without_style(rendered) == without_style(expected)
+    assert len(rendered) <= len(expected)
+
+
+def test_render_strips_unused_css():
+    notification = render("match_notification")
+    assert ".participant{" in notification
+    assert ".match-details{" in notification
+    assert ".stats" not in notification
+    assert ".stat-item" not in notification
+
+    summary = render("weekly_summary")
+    assert ".stats{" in summary
+    assert ".participant" not in summary
+    assert ".match-details" not in summary
+
+
+def test_templates_share_base_layout():
+    body = render("match_reminder", preferences_url="/prefs", deployment_id="test")
+    assert "<title>Virtual Coffee Reminder</title>" in body
+    assert "<h1>Virtual Coffee Reminder</h1>" in body
+    assert 'href="/prefs" class="preferences-link"' in body
+    assert "<p>Deployment: test</p>" in body
+
+
+def test_render_with_shared_values():
+    shared = {
+        "meeting_length": 30,
+        "platform_url": "https://virtual-coffee.example.com/test",
+        "preferences_url": "https://virtual-coffee.example.com/test/preferences",
+        "deployment_id": "test",
+    }
+    for user_name in ("Alice", "Bob"):
+        assert render(
+            "match_notification",
+            shared=shared,
+            user_name=user_name,
+            participants_html="<div>Other User</div>",
+        ) == render(
+            "match_notification",
+            user_name=user_name,
+            participants_html="<div>Other User</div>",
+            **shared,
+        )
+
+
+def test_render_bytes():
+    shared = {"platform_url": "https://virtual-coffee.example.com/test"}
+    assert render_bytes(
+        "match_reminder",
+        shared=shared,
+        user_name="Zoë",
+    ) == render("match_reminder", user_name="Zoë", **shared).encode()
+
+
+def test_prefill():
+    shared = {
+        "platform_url": "https://virtual-coffee.example.com/test",
+        "preferences_url": "https://virtual-coffee.example.com/test/preferences",
+        "deployment_id": "test",
+    }
+    render_body = prefill("match_notification", shared)
+    for user_name, meeting_length in (("Alice", 30), ("Bob", 45)):
+        assert render_body(
+            user_name=user_name,
+            meeting_length=meeting_length,
+        ) == render(
+            "match_notification",
+            user_name=user_name,
+            meeting_length=meeting_length,
+            **shared,
+        )
+
+
+def test_prefill_mime():
+    shared = {
+        "platform_url": "https://virtual-coffee.example.com/test",
+        "preferences_url": "https://virtual-coffee.example.com/test/preferences",
+        "deployment_id": "test",
+    }
+    render_body = prefill_mime("match_notification", shared)
+    body = render_body(user_name="Zoë", meeting_length=30)
+
+    assert body.isascii()
+    assert all(len(line) <= 76 for line in body.split(b"\r\n"))
+    assert quopri.decodestring(body).decode() == render(
+        "match_notification", user_name="Zoë", meeting_length=30, **shared
+    )
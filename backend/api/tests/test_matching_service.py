@@ -5,12 +5,23 @@ import random
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock
 
+import numpy as np
 import pytest
 
 from backend.api.models.config import DeploymentConfig
 from backend.api.models.match import Match
 from backend.api.models.user import Preferences, User
-from backend.api.services.matching_service import MatchingService
+from backend.api.services.matching_service import (
+    MatchingService,
+    _bitmask,
+    _history_entries,
+    _history_graph,
+    _improve_pairs,
+    _pair_queue,
+    _pick_next,
+    _pop_best_pair,
+    _score_matrix,
+)
 
 
 @pytest.fixture()
@@ -91,19 +102,19 @@ class TestMatchingService:
             {
                 "is_active": True,
                 "is_paused": False,
-            }
+            },
+            fields=["preferences"],
         )
         assert result == expected_users
 
     async def test_get_recent_matches(self, matching_service, mock_match_repository):
         """Test getting recent matches."""
         # Setup
-        all_matches = [
+        recent_matches = [
             create_test_match(1, ["user-1", "user-2"], created_days_ago=5),
             create_test_match(2, ["user-1", "user-3"], created_days_ago=15),
-            create_test_match(3, ["user-2", "user-3"], created_days_ago=40),
         ]
-        mock_match_repository.get_all.return_value = all_matches
+        mock_match_repository.get_all.return_value = recent_matches
 
         # Execute
         result = await matching_service.get_recent_matches(lookback_days=30)
@@ -113,6 +124,11 @@ class TestMatchingService:
         assert result[0].id == "match-1"
         assert result[1].id == "match-2"
 
+        # Older matches are filtered out by the repository query
+        filter_params = mock_match_repository.get_all.call_args[0][0]
+        cutoff_age = datetime.utcnow() - filter_params["created_since"]
+        assert timedelta(days=30) <= cutoff_age < timedelta(days=30, minutes=1)
+
     async def test_build_history_graph(self, matching_service):
         """Test building the weighted history graph."""
         # Setup
@@ -138,34 +154,22 @@ class TestMatchingService:
         result = await matching_service.build_history_graph(lookback_days=30)
 
         # Verify
-        # Check that all users are in the graph
-        assert "user-1" in result
-        assert "user-2" in result
-        assert "user-3" in result
-        assert "user-4" in result
-
-        # Check that all connections are present
-        assert "user-2" in result["user-1"]
-        assert "user-3" in result["user-1"]
-        assert "user-1" in result["user-2"]
-        assert "user-3" in result["user-2"]
-        assert "user-4" in result["user-2"]
-        assert "user-1" in result["user-3"]
-        assert "user-2" in result["user-3"]
-        assert "user-4" in result["user-3"]
-        assert "user-2" in result["user-4"]
-        assert "user-3" in result["user-4"]
+        # Check that all connections are present, once per pair
+        assert set(result) == {
+            ("user-1", "user-2"),
+            ("user-1", "user-3"),
+            ("user-2", "user-3"),
+            ("user-2", "user-4"),
+            ("user-3", "user-4"),
+        }
 
         # Check that weights are higher for more recent matches
-        assert result["user-1"]["user-2"] > result["user-1"]["user-3"]
-        assert result["user-2"]["user-3"] > result["user-2"]["user-4"]
+        assert result[("user-1", "user-2")] > result[("user-1", "user-3")]
+        assert result[("user-2", "user-3")] > result[("user-2", "user-4")]
 
         # Check that weights are between 0 and 1
-        for user_id, connections in result.items():
-            for other_id, weight in connections.items():
-                assert (
-                    0 <= weight <= 1
-                ), f"Weight {weight} for {user_id}->{other_id} is out of range"
+        for pair, weight in result.items():
+            assert 0 <= weight <= 1, f"Weight {weight} for {pair} is out of range"
 
     def test_calculate_match_score(self, matching_service):
         """Test calculating match scores between users."""
@@ -209,6 +213,116 @@ class TestMatchingService:
         assert 0 <= score1_3 <= 1
         assert 0 <= score2_3 <= 1
 
+    def test_history_graph_sums_repeated_pairs(self):
+        """Test that pairs meeting more than once add up their weights."""
+        now = datetime.utcnow()
+        matches = [
+            create_test_match(1, ["user-1", "user-2"]),
+            create_test_match(2, ["user-2", "user-1", "user-3"]),
+        ]
+        matches[0].created_at = now - timedelta(days=6)
+        matches[1].created_at = now - timedelta(days=15)
+
+        result = _history_graph(matches, 30, now)
+
+        assert result == {
+            ("user-1", "user-2"): pytest.approx(0.8 + 0.5),
+            ("user-1", "user-3"): pytest.approx(0.5),
+            ("user-2", "user-3"): pytest.approx(0.5),
+        }
+        assert _history_graph([], 30, now) == {}
+
+    def test_bitmask_is_stable_per_value(self):
+        """Test that each value always maps to the same bit within an index."""
+        bits = {}
+        mask = _bitmask(["Coffee", "Books"], bits)
+        assert mask == _bitmask(["Books", "Coffee", "Books"], bits)
+        assert mask.bit_count() == 2
+        assert (mask & _bitmask(["Books", "Sports"], bits)).bit_count() == 1
+        assert _bitmask([], bits) == 0
+        assert bits == {"Coffee": 0, "Books": 1, "Sports": 2}
+
+    def test_history_entries(self):
+        """Test that history weights are looked up symmetrically by index."""
+        users = [create_test_user(i, f"User {i}") for i in range(1, 4)]
+        history_graph = {
+            ("user-1", "user-2"): 0.8,
+            ("user-1", "user-3"): 0.4,
+            ("user-3", "user-9"): 1.0,
+        }
+
+        rows, cols, weights = _history_entries(users, history_graph)
+
+        assert rows.tolist() == [0, 1, 0, 2]
+        assert cols.tolist() == [1, 0, 2, 0]
+        assert weights.tolist() == [0.8, 0.8, 0.4, 0.4]
+
+    def test_score_matrix_matches_calculate_match_score(self, matching_service):
+        """Test that the vectorized scores equal the per-pair scores."""
+        users = [
+            create_test_user(1, "User 1", ["Tech", "Coffee"], ["Mon 9-10"], 30),
+            create_test_user(2, "User 2", ["Tech"], ["Mon 9-10", "Tue 9-10"], 60),
+            create_test_user(3, "User 3", [], ["Wed 9-10"], 15),
+            create_test_user(4, "User 4", ["Coffee", "Books"], [], 45),
+            create_test_user(5, "User 5"),
+        ]
+
+        scores = _score_matrix(users)
+
+        for i, user1 in enumerate(users):
+            for j, user2 in enumerate(users):
+                if i != j:
+                    assert scores[i, j] == pytest.approx(
+                        matching_service.calculate_match_score(user1, user2)
+                    )
+
+    def test_pop_best_pair_skips_matched_users(self):
+        """Test that pairs with an already matched user are skipped."""
+        scores = np.array(
+            [
+                [0.0, 0.9, 0.5],
+                [0.9, 0.0, 0.8],
+                [0.5, 0.8, 0.0],
+            ]
+        )
+        pair_queue = _pair_queue(scores)
+        available = bytearray([1, 0, 1])
+
+        assert _pop_best_pair(pair_queue, available) == (0, 2)
+        assert pair_queue.position == 3
+        assert _pop_best_pair(pair_queue, available) is None
+
+    def test_pick_next_uses_group_average(self):
+        """Test that the next user has the best average score with the group."""
+        scores = np.array(
+            [
+                [0.0, 0.9, 0.2, 0.7, 0.9],
+                [0.9, 0.0, 0.9, 0.5, 0.8],
+                [0.2, 0.9, 0.0, 0.1, 0.1],
+                [0.7, 0.5, 0.1, 0.0, 0.1],
+                [0.9, 0.8, 0.1, 0.1, 0.0],
+            ]
+        )
+        available = bytearray([0, 0, 1, 1, 0])
+
+        group_sums = scores[:, [0, 1]].sum(axis=1)
+
+        assert _pick_next(group_sums, 2, available) == (3, pytest.approx(0.6))
+
+    def test_improve_pairs_swaps_partners(self):
+        """Test that a greedy pairing blocking two better pairs is improved."""
+        scores = np.array(
+            [
+                [0.0, 1.0, 0.9, 0.0],
+                [1.0, 0.0, 0.0, 0.9],
+                [0.9, 0.0, 0.0, 0.1],
+                [0.0, 0.9, 0.1, 0.0],
+            ],
+        )
+
+        # Greedy takes the single best pair (0, 1) for a total of 1.1
+        assert sorted(_improve_pairs([(0, 1), (2, 3)], scores)) == [(0, 2), (1, 3)]
+
     async def test_create_matches_with_meeting_size_2(
         self,
         matching_service,
@@ -238,10 +352,10 @@ class TestMatchingService:
         matching_service.build_history_graph = AsyncMock(return_value={})
 
         # Mock match creation
-        async def mock_create_match(match):
-            return match
+        async def mock_bulk_create(matches):
+            return matches
 
-        mock_match_repository.create.side_effect = mock_create_match
+        mock_match_repository.bulk_create.side_effect = mock_bulk_create
 
         # Set a fixed seed for reproducibility
         random.seed(42)
@@ -295,10 +409,10 @@ class TestMatchingService:
         matching_service.build_history_graph = AsyncMock(return_value={})
 
         # Mock match creation
-        async def mock_create_match(match):
-            return match
+        async def mock_bulk_create(matches):
+            return matches
 
-        mock_match_repository.create.side_effect = mock_create_match
+        mock_match_repository.bulk_create.side_effect = mock_bulk_create
 
         # Set a fixed seed for reproducibility
         random.seed(42)
@@ -348,19 +462,17 @@ class TestMatchingService:
 
         # Mock weighted history graph with recent matches
         history_graph = {
-            "user-1": {"user-2": 0.8},  # High weight = very recent match
-            "user-2": {"user-1": 0.8},
-            "user-3": {"user-4": 0.8},
-            "user-4": {"user-3": 0.8},
+            ("user-1", "user-2"): 0.8,  # High weight = very recent match
+            ("user-3", "user-4"): 0.8,
         }
 
         matching_service.build_history_graph = AsyncMock(return_value=history_graph)
 
         # Mock match creation
-        async def mock_create_match(match):
-            return match
+        async def mock_bulk_create(matches):
+            return matches
 
-        mock_match_repository.create.side_effect = mock_create_match
+        mock_match_repository.bulk_create.side_effect = mock_bulk_create
 
         # Set a fixed seed for reproducibility
         random.seed(42)
@@ -411,10 +523,10 @@ class TestMatchingService:
         matching_service.build_history_graph = AsyncMock(return_value={})
 
         # Mock match creation
-        async def mock_create_match(match):
-            return match
+        async def mock_bulk_create(matches):
+            return matches
 
-        mock_match_repository.create.side_effect = mock_create_match
+        mock_match_repository.bulk_create.side_effect = mock_bulk_create
 
         # Set a fixed seed for reproducibility
         random.seed(42)
@@ -438,6 +550,10 @@ class TestMatchingService:
 
         assert len(matched_users) == 5
 
+        # All matches are stored in one batch, after the leftover user joined
+        mock_match_repository.bulk_create.assert_called_once()
+        mock_match_repository.create.assert_not_called()
+
     async def test_create_matches_with_not_enough_users(
         self, matching_service, mock_user_repository, mock_config_service
     ):
@@ -538,10 +654,10 @@ class TestMatchingService:
         matching_service.build_history_graph = AsyncMock(return_value={})
 
         # Mock match creation
-        async def mock_create_match(match):
-            return match
+        async def mock_bulk_create(matches):
+            return matches
 
-        mock_match_repository.create.side_effect = mock_create_match
+        mock_match_repository.bulk_create.side_effect = mock_bulk_create
 
         # Set a fixed seed for reproducibility
         random.seed(42)
@@ -148,6 +148,47 @@ class TestConfigModels:
                 schedule="invalid-cron",  # Invalid cron expression should fail
             )
 
+        with pytest.raises(ValidationError):
+            DeploymentConfig(
+                deployment_id="test-team",
+                schedule="61 9 * * 1",  # Minute out of range should fail
+            )
+
+    def test_config_parsed_cron(self):
+        config = DeploymentConfig(
+            deployment_id="test-team",
+            schedule="*/30 9-10 * * 1,7",
+        )
+        parsed = config.parsed_cron
+        assert parsed.minutes == frozenset({0, 30})
+        assert parsed.hours == frozenset({9, 10})
+        assert parsed.weekdays == frozenset({0, 1})
+        assert parsed.next_after(datetime(2024, 1, 1, 9, 30)) == datetime(
+            2024, 1, 1, 10, 0
+        )
+        assert parsed.matches(datetime(2024, 1, 7, 10, 30))  # Sunday
+        assert not parsed.matches(datetime(2024, 1, 2, 10, 30))  # Tuesday
+
+    def test_config_parsed_cron_names_and_macros(self):
+        config = DeploymentConfig(
+            deployment_id="test-team",
+            schedule="0 9 * jan-Mar MON-FRI",
+        )
+        assert config.parsed_cron.months == frozenset({1, 2, 3})
+        assert config.parsed_cron.weekdays == frozenset({1, 2, 3, 4, 5})
+
+        config = DeploymentConfig(deployment_id="test-team", schedule="@weekly")
+        assert config.schedule == "@weekly"
+        assert config.parsed_cron == DeploymentConfig(
+            deployment_id="test-team", schedule="0 0 * * 0"
+        ).parsed_cron
+
+        with pytest.raises(ValidationError):
+            DeploymentConfig(
+                deployment_id="test-team",
+                schedule="0 9 * * MON-FOO",  # Unknown day name should fail
+            )
+
     def test_config_meeting_size_validation(self):
         with pytest.raises(ValidationError):
             DeploymentConfig(
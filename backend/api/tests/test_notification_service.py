@@ -2,13 +2,18 @@
 Tests for the notification service.
 """
 from datetime import datetime, timedelta
+from email import message_from_bytes
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from botocore.exceptions import ClientError
+from botocore.exceptions import ClientError, EndpointConnectionError
 
 from backend.api.models.match import Match
 from backend.api.models.user import NotificationPreferences, Preferences, User
+from backend.api.services.notification_channels import (
+    DEFAULT_SES_SEND_RATE,
+    get_ses_client,
+)
 from backend.api.services.notification_service import NotificationService
 
 
@@ -33,14 +38,23 @@ def mock_ses_client():
     return mock
 
 
+@pytest.fixture(autouse=True)
+def no_sleep():
+    """Skip the waits of rate limiting and retry backoff."""
+    with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep, patch(
+        "backend.api.services.notification_service.RETRY_BASE_DELAY", 0
+    ):
+        yield mock_sleep
+
+
 @pytest.fixture()
 def notification_service(mock_user_repository, mock_match_repository, mock_ses_client):
     """Create a notification service with mocked dependencies."""
+    get_ses_client.cache_clear()
     with patch("boto3.client", return_value=mock_ses_client):
         service = NotificationService("test-deployment")
         service.user_repository = mock_user_repository
         service.match_repository = mock_match_repository
-        service.ses_client = mock_ses_client
         return service
 
 
@@ -96,20 +110,23 @@ class TestNotificationService:
         match = create_test_match(1, [user1.id, user2.id])
 
         # Mock repository responses
-        mock_user_repository.get.side_effect = lambda user_id: {
+        users_by_id = {
             "user-1": user1,
             "user-2": user2,
-        }.get(user_id)
+        }
+        mock_user_repository.batch_get.side_effect = lambda user_ids: [
+            users_by_id[user_id] for user_id in user_ids if users_by_id.get(user_id)
+        ]
 
         # Mock SES response
-        mock_ses_client.send_email.return_value = {"MessageId": "test-message-id"}
+        mock_ses_client.send_raw_email.return_value = {"MessageId": "test-message-id"}
 
         # Execute
         result = await notification_service.send_match_notification(match)
 
         # Verify
         assert result is True
-        assert mock_ses_client.send_email.call_count == 2  # One email for each user
+        assert mock_ses_client.send_raw_email.call_count == 2  # One email for each user
 
         # Verify match was updated
         mock_match_repository.update.assert_called_once()
@@ -125,10 +142,13 @@ class TestNotificationService:
         match = create_test_match(1, [user1.id, "user-nonexistent"])
 
         # Mock repository responses
-        mock_user_repository.get.side_effect = lambda user_id: {
+        users_by_id = {
             "user-1": user1,
             "user-nonexistent": None,
-        }.get(user_id)
+        }
+        mock_user_repository.batch_get.side_effect = lambda user_ids: [
+            users_by_id[user_id] for user_id in user_ids if users_by_id.get(user_id)
+        ]
 
         # Execute
         result = await notification_service.send_match_notification(match)
@@ -137,6 +157,74 @@ class TestNotificationService:
         assert result is True  # Should still succeed for the existing user
         mock_match_repository.update.assert_called_once()
 
+    @pytest.mark.asyncio()
+    async def test_send_match_notifications_bulk(
+        self, notification_service, mock_user_repository, mock_match_repository
+    ):
+        """Test sending the notifications of several matches together."""
+        # Setup
+        users = [create_test_user(i, f"User {i}") for i in range(1, 5)]
+        matches = [
+            create_test_match(1, [users[0].id, users[1].id]),
+            create_test_match(2, [users[2].id, users[3].id]),
+        ]
+        mock_user_repository.batch_get.return_value = users
+
+        # Send every notification through one mock channel
+        channel = MagicMock()
+        channel.send_many = AsyncMock(
+            side_effect=lambda jobs, max_concurrency: [
+                user.id != users[3].id for user, _, _ in jobs
+            ]
+        )
+        notification_service.channels = {"email": channel}
+
+        # Execute
+        results = await notification_service.send_match_notifications_bulk(matches)
+
+        # Verify
+        assert results == [True, False]
+        mock_user_repository.batch_get.assert_called_once_with(
+            [user.id for user in users]
+        )
+        assert len(channel.send_many.call_args_list[0][0][0]) == 4
+        mock_match_repository.update.assert_called_once_with(
+            matches[0].id, {"notification_sent": True}
+        )
+        assert matches[1].notification_sent is False
+
+    @pytest.mark.asyncio()
+    async def test_send_match_notifications_bulk_errors(
+        self, notification_service, mock_user_repository, mock_match_repository
+    ):
+        """Test that bulk notification errors only fail the affected matches."""
+        # Setup
+        users = [create_test_user(i, f"User {i}") for i in range(1, 5)]
+        matches = [
+            create_test_match(1, [users[0].id, users[1].id]),
+            create_test_match(2, [users[2].id, users[3].id]),
+        ]
+        channel = MagicMock()
+        channel.send_many = AsyncMock(
+            side_effect=lambda jobs, max_concurrency: [True] * len(jobs)
+        )
+        notification_service.channels = {"email": channel}
+
+        # A failed user read fails every match without sending
+        mock_user_repository.batch_get.side_effect = Exception("DynamoDB error")
+        results = await notification_service.send_match_notifications_bulk(matches)
+        assert results == [False, False]
+        channel.send_many.assert_not_called()
+
+        # A failed match update only fails that match
+        mock_user_repository.batch_get.side_effect = None
+        mock_user_repository.batch_get.return_value = users
+        mock_match_repository.update.side_effect = [Exception("DynamoDB error"), None]
+        results = await notification_service.send_match_notifications_bulk(matches)
+        assert results == [False, True]
+        assert matches[0].notification_sent is False
+        assert matches[1].notification_sent is True
+
     @pytest.mark.asyncio()
     async def test_send_match_notification_ses_error(
         self, notification_service, mock_user_repository, mock_ses_client
@@ -148,10 +236,13 @@ class TestNotificationService:
         match = create_test_match(1, [user1.id, user2.id])
 
         # Mock repository responses
-        mock_user_repository.get.side_effect = lambda user_id: {
+        users_by_id = {
             "user-1": user1,
             "user-2": user2,
-        }.get(user_id)
+        }
+        mock_user_repository.batch_get.side_effect = lambda user_ids: [
+            users_by_id[user_id] for user_id in user_ids if users_by_id.get(user_id)
+        ]
 
         # Mock SES error
         error_response = {
@@ -160,8 +251,8 @@ class TestNotificationService:
                 "Message": "Email address is not verified",
             },
         }
-        mock_ses_client.send_email.side_effect = ClientError(
-            error_response, "SendEmail"
+        mock_ses_client.send_raw_email.side_effect = ClientError(
+            error_response, "SendRawEmail"
         )
 
         # Execute
@@ -175,7 +266,7 @@ class TestNotificationService:
 
     @pytest.mark.asyncio()
     async def test_send_match_notification_retry(
-        self, notification_service, mock_user_repository, mock_ses_client
+        self, notification_service, mock_user_repository
     ):
         """Test retry logic for sending match notifications."""
         # Setup
@@ -184,43 +275,85 @@ class TestNotificationService:
         match = create_test_match(1, [user1.id, user2.id])
 
         # Mock repository responses
-        mock_user_repository.get.side_effect = lambda user_id: {
+        users_by_id = {
             "user-1": user1,
             "user-2": user2,
-        }.get(user_id)
-
-        # Mock SES to fail on first attempt for one user, then succeed
-        call_count = 0
-
-        def mock_send_email(**kwargs):
-            nonlocal call_count
-            if (
-                call_count == 0
-                and kwargs["Destination"]["ToAddresses"][0] == user1.email
-            ):
-                call_count += 1
-                error_response = {
-                    "Error": {
-                        "Code": "Throttling",
-                        "Message": "Daily message quota exceeded",
-                    },
-                }
-                raise ClientError(error_response, "SendEmail")
-            return {"MessageId": "test-message-id"}
-
-        mock_ses_client.send_email.side_effect = mock_send_email
+        }
+        mock_user_repository.batch_get.side_effect = lambda user_ids: [
+            users_by_id[user_id] for user_id in user_ids if users_by_id.get(user_id)
+        ]
+
+        # Mock the channel to fail on first attempt for one user, then succeed
+        attempts = []
+
+        def mock_send_many(jobs, max_concurrency):
+            attempts.append([user.id for user, _, _ in jobs])
+            return [len(attempts) > 1 or user.id != user1.id for user, _, _ in jobs]
+
+        channel = MagicMock()
+        channel.send_many = AsyncMock(side_effect=mock_send_many)
+        notification_service.channels = {"email": channel}
 
         # Execute
-        with patch.object(
-            notification_service,
-            "send_match_notification",
-            wraps=notification_service.send_match_notification,
-        ) as wrapped_method:
-            result = await notification_service.send_match_notification(match)
+        result = await notification_service.send_match_notification(match)
+
+        # Verify
+        assert result is True  # Should eventually succeed
+        assert attempts == [[user1.id, user2.id], [user1.id]]  # Only retried user 1
+        mock_user_repository.batch_get.assert_called_once()
 
-            # Verify
-            assert result is True  # Should eventually succeed
-            assert wrapped_method.call_count > 1  # Should have retried
+    @pytest.mark.asyncio()
+    async def test_send_with_retries(self, notification_service, no_sleep):
+        """Test that sends are retried with backoff until they succeed."""
+        # Setup
+        user1 = create_test_user(1, "User 1")
+        user2 = create_test_user(2, "User 2")
+        match = create_test_match(1, [user1.id, user2.id])
+        jobs = notification_service._match_jobs([user1, user2], match)
+
+        # Fail the first attempt outright, then one user on the second one
+        notification_service._send_notifications = AsyncMock(
+            side_effect=[
+                ClientError(
+                    {"Error": {"Code": "Throttling", "Message": "Rate exceeded"}},
+                    "SendBulkTemplatedEmail",
+                ),
+                [True, False],
+                [True],
+            ]
+        )
+
+        # Execute
+        with patch("backend.api.services.notification_service.RETRY_BASE_DELAY", 0.5):
+            sent = await notification_service._send_with_retries(jobs)
+
+        # Verify
+        assert sent == [True, True]
+        assert notification_service._send_notifications.call_args_list[2][0][0] == [
+            jobs[1]
+        ]
+        assert [call[0][0] for call in no_sleep.call_args_list] == [0.5, 1.0]
+
+    @pytest.mark.asyncio()
+    async def test_send_with_retries_unexpected_error(
+        self, notification_service, no_sleep
+    ):
+        """Test that unexpected errors are not retried."""
+        # Setup
+        user1 = create_test_user(1, "User 1")
+        match = create_test_match(1, [user1.id, "user-2"])
+        jobs = notification_service._match_jobs([user1], match)
+        notification_service._send_notifications = AsyncMock(
+            side_effect=AttributeError("notification_prefs")
+        )
+
+        # Execute
+        sent = await notification_service._send_with_retries(jobs)
+
+        # Verify
+        assert sent == [False]
+        notification_service._send_notifications.assert_called_once()
+        no_sleep.assert_not_called()
 
     @pytest.mark.asyncio()
     async def test_send_email_notification(self, notification_service, mock_ses_client):
@@ -231,21 +364,96 @@ class TestNotificationService:
         match = create_test_match(1, [user.id, other_user.id])
 
         # Mock SES response
-        mock_ses_client.send_email.return_value = {"MessageId": "test-message-id"}
+        mock_ses_client.send_raw_email.return_value = {"MessageId": "test-message-id"}
 
         # Execute
-        result = await notification_service._send_email_notification(
+        result = await notification_service.channels["email"].send_notification(
             user, match, [other_user]
         )
 
         # Verify
         assert result is True
-        mock_ses_client.send_email.assert_called_once()
+        mock_ses_client.send_raw_email.assert_called_once()
 
         # Check email content
-        call_args = mock_ses_client.send_email.call_args[1]
-        assert call_args["Destination"]["ToAddresses"][0] == user.email
-        assert "Virtual Coffee Match" in call_args["Message"]["Subject"]["Data"]
-        assert user.name in call_args["Message"]["Body"]["Html"]["Data"]
-        assert other_user.name in call_args["Message"]["Body"]["Html"]["Data"]
-        assert other_user.email in call_args["Message"]["Body"]["Html"]["Data"]
+        call_args = mock_ses_client.send_raw_email.call_args[1]
+        message = message_from_bytes(call_args["RawMessage"]["Data"])
+        body = message.get_payload(decode=True).decode()
+        assert call_args["Destinations"] == [user.email]
+        assert "Virtual Coffee Match" in message["Subject"]
+        assert user.name in body
+        assert other_user.name in body
+        assert other_user.email in body
+
+    @pytest.mark.asyncio()
+    async def test_email_limiter_quota_fallback(
+        self, notification_service, mock_ses_client
+    ):
+        """Test that an unreachable SES quota falls back to the default rate once."""
+        # Setup
+        mock_ses_client.get_send_quota.side_effect = EndpointConnectionError(
+            endpoint_url="https://email.us-east-1.amazonaws.com"
+        )
+        channel = notification_service.channels["email"]
+
+        # Execute
+        limiter = await channel._get_limiter()
+
+        # Verify
+        assert limiter._interval == 1.0 / DEFAULT_SES_SEND_RATE
+        assert await channel._get_limiter() is limiter
+        mock_ses_client.get_send_quota.assert_called_once()
+
+    @pytest.mark.asyncio()
+    async def test_send_many_logs_send_errors(self, notification_service, caplog):
+        """Test that a raising send fails only its job and logs its traceback."""
+        # Setup
+        user1 = create_test_user(1, "User 1")
+        user2 = create_test_user(2, "User 2")
+        match = create_test_match(1, [user1.id, user2.id])
+        jobs = notification_service._match_jobs([user1, user2], match)
+        channel = notification_service.channels["slack"]
+
+        # Execute
+        with patch.object(
+            type(channel),
+            "send_notification",
+            new=AsyncMock(side_effect=[KeyError("channel"), True]),
+        ):
+            sent = await channel.send_many(jobs)
+
+        # Verify
+        assert sent == [False, True]
+        errors = [record for record in caplog.records if record.exc_info]
+        assert len(errors) == 1
+        assert user1.id in errors[0].getMessage()
+        assert isinstance(errors[0].exc_info[1], KeyError)
+
+    @pytest.mark.asyncio()
+    async def test_send_notifications_unresolvable_channels(
+        self, notification_service
+    ):
+        """Test that a user whose channels cannot be resolved only fails alone."""
+        # Setup
+        user1 = create_test_user(1, "User 1")
+        user2 = create_test_user(2, "User 2")
+        match = create_test_match(1, [user1.id, user2.id])
+        jobs = notification_service._match_jobs([user1, user2], match)
+
+        channel = MagicMock()
+        channel.send_many = AsyncMock(
+            side_effect=lambda jobs, max_concurrency: [True] * len(jobs)
+        )
+        notification_service.channels = {"email": channel}
+
+        # Execute
+        with patch.object(
+            notification_service,
+            "_channels_for_user",
+            side_effect=[AttributeError("notification_prefs"), ["email"]],
+        ):
+            sent = await notification_service._send_notifications(jobs)
+
+        # Verify
+        assert sent == [False, True]
+        channel.send_many.assert_called_once()
@@ -10,7 +10,7 @@ from models.match import Match
 from models.user import Preferences, User
 from repositories.dynamodb_connection import DynamoDBConnectionManager
 from repositories.match_repository import MatchRepository
-from repositories.user_repository import UserRepository
+from repositories.user_repository import UserRepository, _TTLCache, _user_cache
 
 
 # Mock DynamoDB for testing
@@ -28,8 +28,9 @@ def mock_dynamodb():
         mock_boto3.resource.return_value = mock_resource
         mock_resource.Table.return_value = mock_table
 
-        # Reset the singleton instance
+        # Reset the singleton instance and the cached users
         DynamoDBConnectionManager._instance = None
+        _user_cache.clear()
 
         yield {
             "client": mock_client,
@@ -38,6 +39,21 @@ def mock_dynamodb():
         }
 
 
+def test_ttl_cache():
+    """Test that the user cache evicts its oldest entries and expires them."""
+    cache = _TTLCache(maxsize=2, ttl=60)
+    for key in ("a", "b", "c"):
+        cache.set(key, key.upper())
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "B"
+    assert cache.get("c") == "C"
+
+    expired = _TTLCache(maxsize=2, ttl=0)
+    expired.set("a", "A")
+    assert expired.get("a") is None
+
+
 class TestUserRepository:
     """Tests for UserRepository."""
 
@@ -106,6 +122,25 @@ class TestUserRepository:
             },
         )
 
+    async def test_get_user_cached(self, user_repo, sample_user, mock_dynamodb):
+        """Test that repeated lookups of a user are served from the cache."""
+        # Configure the mock
+        mock_dynamodb["table"].get_item.return_value = {
+            "Item": sample_user.dict(),
+        }
+
+        # Call the methods
+        by_id = await user_repo.get(sample_user.id)
+        by_email = await user_repo.get_by_email(sample_user.email)
+
+        # Verify the results
+        assert by_id.id == sample_user.id
+        assert by_email.id == sample_user.id
+
+        # Verify only the first lookup reached DynamoDB
+        mock_dynamodb["table"].get_item.assert_called_once()
+        mock_dynamodb["table"].query.assert_not_called()
+
     async def test_get_user_not_found(self, user_repo, mock_dynamodb):
         """Test getting a non-existent user."""
         # Configure the mock
@@ -120,6 +155,31 @@ class TestUserRepository:
         # Verify the mock was called correctly
         mock_dynamodb["table"].get_item.assert_called_once()
 
+    async def test_batch_get_users(self, user_repo, sample_user, mock_dynamodb):
+        """Test getting several users with one batched read."""
+        # Configure the mock
+        mock_dynamodb["resource"].batch_get_item.return_value = {
+            "Responses": {"users-test-deployment": [sample_user.dict()]},
+        }
+
+        # Call the method
+        result = await user_repo.batch_get([sample_user.id, "non-existent-id"])
+
+        # Verify the result
+        assert [user.id for user in result] == [sample_user.id]
+
+        # Verify the mock was called correctly
+        mock_dynamodb["resource"].batch_get_item.assert_called_once_with(
+            RequestItems={
+                "users-test-deployment": {
+                    "Keys": [
+                        {"id": sample_user.id, "deployment_id": "test-deployment"},
+                        {"id": "non-existent-id", "deployment_id": "test-deployment"},
+                    ],
+                },
+            },
+        )
+
     async def test_get_all_users(self, user_repo, sample_user, mock_dynamodb):
         """Test getting all users."""
         # Configure the mock
@@ -161,6 +221,48 @@ class TestUserRepository:
         assert "FilterExpression" in call_args
         assert call_args["FilterExpression"] == "is_active = :is_active"
 
+    async def test_get_all_users_with_fields(
+        self, user_repo, sample_user, mock_dynamodb
+    ):
+        """Test getting users with only some of their attributes."""
+        # Configure the mock
+        mock_dynamodb["table"].query.return_value = {
+            "Items": [
+                sample_user.dict(include={"id", "email", "name", "deployment_id"})
+            ],
+        }
+
+        # Call the method with fields
+        result = await user_repo.get_all(fields=["is_paused"])
+
+        # Verify the result
+        assert result[0].id == sample_user.id
+
+        # Verify the mock was called correctly
+        call_args = mock_dynamodb["table"].query.call_args[1]
+        assert call_args["ProjectionExpression"] == (
+            "#id, #email, #name, #deployment_id, #is_paused"
+        )
+        assert call_args["ExpressionAttributeNames"]["#is_paused"] == "is_paused"
+
+    async def test_iter_all_users(self, user_repo, sample_user, mock_dynamodb):
+        """Test iterating over users one query page at a time."""
+        # Configure the mock with two pages
+        mock_dynamodb["table"].query.side_effect = [
+            {"Items": [sample_user.dict()], "LastEvaluatedKey": {"id": "page-1"}},
+            {"Items": [sample_user.dict()]},
+        ]
+
+        # Call the method
+        result = [user async for user in user_repo.iter_all()]
+
+        # Verify the result
+        assert len(result) == 2
+
+        # Verify the second page started after the first one
+        call_args = mock_dynamodb["table"].query.call_args[1]
+        assert call_args["ExclusiveStartKey"] == {"id": "page-1"}
+
     async def test_update_user(self, user_repo, sample_user, mock_dynamodb):
         """Test updating a user."""
         # Configure the mocks
@@ -247,6 +349,24 @@ class TestMatchRepository:
         assert call_args["Item"]["id"] == sample_match.id
         assert call_args["Item"]["participants"] == sample_match.participants
 
+    async def test_bulk_create_matches(self, match_repo, sample_match, mock_dynamodb):
+        """Test creating matches with a batch writer."""
+        # Configure the mock
+        batch = mock_dynamodb["table"].batch_writer.return_value.__enter__.return_value
+
+        # Call the method
+        result = await match_repo.bulk_create([sample_match])
+
+        # Verify the result
+        assert result == [sample_match]
+
+        # Verify the mock was called correctly
+        mock_dynamodb["table"].put_item.assert_not_called()
+        batch.put_item.assert_called_once()
+        item = batch.put_item.call_args[1]["Item"]
+        assert item["id"] == sample_match.id
+        assert item["scheduled_date"] == sample_match.scheduled_date.isoformat()
+
     async def test_get_match(self, match_repo, sample_match, mock_dynamodb):
         """Test getting a match by ID."""
         # Convert datetime to string for the mock response
@@ -324,6 +444,24 @@ class TestMatchRepository:
             call_args["FilterExpression"] == "contains(participants, :participant_id)"
         )
 
+    async def test_get_all_matches_created_since(
+        self, match_repo, sample_match, mock_dynamodb
+    ):
+        """Test filtering matches by creation date in the query."""
+        # Configure the mock
+        mock_dynamodb["table"].query.return_value = {"Items": []}
+
+        # Call the method
+        await match_repo.get_all({"created_since": datetime(2024, 1, 1, 9, 30)})
+
+        # Verify the mock was called correctly
+        call_args = mock_dynamodb["table"].query.call_args[1]
+        assert call_args["FilterExpression"] == "created_at >= :created_since"
+        assert (
+            call_args["ExpressionAttributeValues"][":created_since"]
+            == "2024-01-01T09:30:00"
+        )
+
     async def test_update_match(self, match_repo, sample_match, mock_dynamodb):
         """Test updating a match."""
         # Convert datetime to string for the mock responses
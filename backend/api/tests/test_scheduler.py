@@ -1,13 +1,16 @@
 """
 Tests for the scheduler component.
 """
+import subprocess
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import ANY, AsyncMock, patch
 
+import orjson
 import pytest
+import pytz
 
-from backend.api.models.config import DeploymentConfig
-from backend.api.scheduler.scheduler import MatchingScheduler
+from backend.api.models.config import DeploymentConfig, DeploymentConfigView
+from backend.api.scheduler.scheduler import MatchingScheduler, _run_kubectl
 
 
 @pytest.fixture()
@@ -21,13 +24,24 @@ def mock_config_service():
 def scheduler(mock_config_service):
     """Create a scheduler with a mock config service."""
     with patch(
-        "backend.api.scheduler.scheduler.ConfigService",
-        return_value=mock_config_service,
+        "backend.api.scheduler.scheduler.config_service",
+        mock_config_service,
     ):
         scheduler = MatchingScheduler()
         yield scheduler
 
 
+@pytest.fixture()
+def sample_config_view():
+    """Create a sample configuration view for testing."""
+    return DeploymentConfigView(
+        deployment_id="test-deployment",
+        schedule="0 9 * * 1",  # Every Monday at 9:00
+        timezone="America/New_York",
+        meeting_size=2,
+    )
+
+
 @pytest.fixture()
 def sample_config():
     """Create a sample configuration for testing."""
@@ -54,6 +68,19 @@ async def test_get_schedule_info_valid(scheduler, sample_config):
     assert "next_run_utc" in result
 
 
+@pytest.mark.asyncio()
+async def test_get_schedule_info_next_run(scheduler, sample_config):
+    """Test that the next run is computed in the deployment's timezone."""
+    # Monday 2024-01-01 12:00 UTC is 07:00 in New York
+    now = datetime(2024, 1, 1, 12, 0, tzinfo=pytz.UTC)
+
+    # Execute
+    result = await scheduler.get_schedule_info(sample_config, now=now)
+
+    # Verify: Monday 09:00 in New York is 14:00 UTC
+    assert result["next_run_utc"] == "2024-01-01T14:00:00"
+
+
 @pytest.mark.asyncio()
 async def test_get_schedule_info_invalid_cron(scheduler):
     """Test getting schedule information with an invalid cron expression."""
@@ -92,10 +119,10 @@ async def test_get_schedule_info_invalid_timezone(scheduler):
 
 
 @pytest.mark.asyncio()
-async def test_get_all_schedules(scheduler, mock_config_service, sample_config):
+async def test_get_all_schedules(scheduler, mock_config_service, sample_config_view):
     """Test getting all schedules."""
     # Setup
-    mock_config_service.get_all_configs.return_value = [sample_config]
+    mock_config_service.get_all_config_views.return_value = [sample_config_view]
 
     # Mock get_schedule_info to return a valid schedule
     scheduler.get_schedule_info = AsyncMock()
@@ -114,8 +141,10 @@ async def test_get_all_schedules(scheduler, mock_config_service, sample_config):
     # Verify
     assert "test-deployment" in result
     assert result["test-deployment"]["valid"] is True
-    mock_config_service.get_all_configs.assert_called_once()
-    scheduler.get_schedule_info.assert_called_once_with(sample_config)
+    mock_config_service.get_all_config_views.assert_called_once()
+    scheduler.get_schedule_info.assert_called_once_with(
+        sample_config_view, now=ANY, local_now=ANY
+    )
 
 
 def test_generate_cronjob_manifest(scheduler):
@@ -192,6 +221,43 @@ async def test_apply_schedule(scheduler, mock_config_service, sample_config):
     scheduler.get_schedule_info.assert_called_once_with(sample_config)
 
 
+@pytest.mark.asyncio()
+async def test_apply_schedule_with_loaded_config(
+    scheduler, mock_config_service, sample_config
+):
+    """Test applying a schedule with an already-loaded configuration."""
+    # Setup
+    scheduler._apply_kubernetes_manifest = AsyncMock(return_value=True)
+    scheduler._apply_argocd_workflow = AsyncMock(return_value=True)
+
+    # Execute
+    result = await scheduler.apply_schedule("test-deployment", sample_config)
+
+    # Verify
+    assert result is True
+    mock_config_service.get_config.assert_not_called()
+
+
+@pytest.mark.asyncio()
+async def test_apply_all_schedules(
+    scheduler, mock_config_service, sample_config_view
+):
+    """Test applying all schedules from a single config fetch."""
+    # Setup
+    mock_config_service.get_all_config_views.return_value = [sample_config_view]
+    scheduler.apply_schedule = AsyncMock(return_value=True)
+
+    # Execute
+    result = await scheduler.apply_all_schedules()
+
+    # Verify
+    assert result == {"test-deployment": True}
+    mock_config_service.get_config.assert_not_called()
+    scheduler.apply_schedule.assert_called_once_with(
+        "test-deployment", sample_config_view
+    )
+
+
 @pytest.mark.asyncio()
 async def test_apply_schedule_no_config(scheduler, mock_config_service):
     """Test applying a schedule with no configuration."""
@@ -238,3 +304,62 @@ async def test_remove_schedule(scheduler):
 
     # Verify
     assert result is True
+
+
+@pytest.mark.asyncio()
+async def test_apply_manifest_does_not_retry_forbidden(scheduler):
+    """Test that permanent kubectl errors are not retried."""
+    # Setup
+    error = subprocess.CalledProcessError(
+        1, ["kubectl", "apply"], stderr=b"Error from server (Forbidden): denied"
+    )
+    manifest = scheduler.generate_cronjob_manifest_bytes(
+        "test-deployment", "0 9 * * 1", "UTC"
+    )
+
+    # Execute
+    with patch(
+        "backend.api.scheduler.scheduler._run_kubectl", side_effect=error
+    ) as mock_run, patch(
+        "asyncio.sleep", new_callable=AsyncMock
+    ) as mock_sleep:
+        result = await scheduler._apply_kubernetes_manifest(
+            manifest, "CronJob", "virtual-coffee-matching-test-deployment"
+        )
+
+    # Verify
+    assert result is False
+    mock_run.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.asyncio()
+async def test_run_kubectl_raises_on_failure():
+    """Test that kubectl runs as an asyncio subprocess and reports failures."""
+    # Setup
+    process = AsyncMock()
+    process.communicate.return_value = (b"", b"Error from server (Forbidden)")
+    process.returncode = 1
+
+    # Execute
+    with patch(
+        "asyncio.create_subprocess_exec", return_value=process
+    ) as mock_exec, pytest.raises(subprocess.CalledProcessError) as exc_info:
+        await _run_kubectl("apply", "-f", "-", input=b"manifest")
+
+    # Verify
+    assert mock_exec.call_args[0] == ("kubectl", "apply", "-f", "-")
+    process.communicate.assert_called_once_with(b"manifest")
+    assert exc_info.value.stderr == b"Error from server (Forbidden)"
+
+
+def test_generate_manifest_bytes_matches_dict(scheduler):
+    """Test that the serialized manifests match the dictionary manifests."""
+    args = ("test-deployment", "0 9 * * 1", "America/New_York")
+
+    assert orjson.loads(
+        scheduler.generate_cronjob_manifest_bytes(*args)
+    ) == scheduler.generate_cronjob_manifest(*args)
+    assert orjson.loads(
+        scheduler.generate_argocd_workflow_bytes(*args)
+    ) == scheduler.generate_argocd_workflow(*args)
@@ -24,6 +24,12 @@ def mock_user_service():
     return service
 
 
+async def iterate(items):
+    """Helper function to serve items as an async iterator."""
+    for item in items:
+        yield item
+
+
 @pytest.fixture()
 def sample_user():
     """Create a sample user for testing."""
@@ -206,7 +212,7 @@ def test_get_all_users(
 ):
     """Test the get all users endpoint."""
     # Setup
-    mock_user_service.get_all_users.return_value = [sample_user]
+    mock_user_service.iter_users = MagicMock(return_value=iterate([sample_user]))
 
     with patch("backend.api.main.UserService", return_value=mock_user_service):
         # Execute
@@ -216,7 +222,7 @@ def test_get_all_users(
         assert response.status_code == 200
         assert len(response.json()) == 1
         assert response.json()[0]["id"] == "test-user-id"
-        mock_user_service.get_all_users.assert_called_once_with(None, None)
+        mock_user_service.iter_users.assert_called_once_with(None, None)
 
 
 def test_get_all_users_filtered(
@@ -224,7 +230,7 @@ def test_get_all_users_filtered(
 ):
     """Test the get all users endpoint with filters."""
     # Setup
-    mock_user_service.get_all_users.return_value = [sample_user]
+    mock_user_service.iter_users = MagicMock(return_value=iterate([sample_user]))
 
     with patch("backend.api.main.UserService", return_value=mock_user_service):
         # Execute
@@ -233,4 +239,4 @@ def test_get_all_users_filtered(
         # Assert
         assert response.status_code == 200
         assert len(response.json()) == 1
-        mock_user_service.get_all_users.assert_called_once_with(True, False)
+        mock_user_service.iter_users.assert_called_once_with(True, False)
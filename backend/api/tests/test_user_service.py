@@ -134,7 +134,7 @@ async def test_get_all_users(user_service, mock_user_repository, sample_user):
 
     # Assert
     assert result == [sample_user]
-    mock_user_repository.get_all.assert_called_once_with({})
+    mock_user_repository.get_all.assert_called_once_with({}, None)
 
 
 @pytest.mark.asyncio()
@@ -152,7 +152,26 @@ async def test_get_all_users_filtered(user_service, mock_user_repository, sample
         {
             "is_active": True,
             "is_paused": False,
-        }
+        },
+        None,
+    )
+
+
+@pytest.mark.asyncio()
+async def test_patch_user(user_service, mock_user_repository, sample_user):
+    """Test updating several fields of a user in one write."""
+    # Setup
+    mock_user_repository.update.return_value = sample_user
+
+    # Execute
+    result = await user_service.patch(
+        "test-user-id", is_paused=True, preferences={"meeting_length": 45}
+    )
+
+    # Assert
+    assert result == sample_user
+    mock_user_repository.update.assert_called_once_with(
+        "test-user-id", {"is_paused": True, "preferences": {"meeting_length": 45}}
     )
 
 